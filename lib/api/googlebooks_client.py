@@ -9,6 +9,10 @@ import requests
 from ..obsidian_utils import format_wikilink, get_user_input, sanitize_filename, translate_genre_tag
 from .base import MediaAPIClient
 
+# Patterns compiled once at import rather than looked up in re's cache per call
+_YEAR_RE = re.compile(r'\b(\d{4})\b')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
 
 class GoogleBooksClient(MediaAPIClient):
     """Google Books API client implementation for books."""
@@ -149,13 +153,13 @@ class GoogleBooksClient(MediaAPIClient):
         """Return the first 4-digit year found in text, or None."""
         if not text:
             return None
-        match = re.search(r'\b(\d{4})\b', str(text))
+        match = _YEAR_RE.search(str(text))
         return int(match.group(1)) if match else None
 
     @staticmethod
     def _strip_html(text: str) -> str:
         """Remove basic HTML tags Google sometimes embeds in descriptions."""
-        return re.sub(r'<[^>]+>', '', text)
+        return _HTML_TAG_RE.sub('', text)
 
     def _best_cover_url(self, image_links: Optional[Dict]) -> Optional[str]:
         """Pick the largest available cover, force HTTPS, drop the page-curl overlay."""
@@ -1,6 +1,7 @@
 """IGDB API client for games."""
 
 import json
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 import requests
@@ -10,6 +11,37 @@ from ..obsidian_utils import format_wikilink, get_user_input, sanitize_filename,
 from .base import MediaAPIClient
 
 
+@lru_cache(maxsize=None)
+def fetch_access_token(client_id: str, client_secret: str) -> str:
+    """
+    Generate an OAuth2 access token from Twitch, memoized per credential pair.
+
+    Twitch client-credential tokens are valid for weeks, so one token per
+    process is plenty; repeated client construction (e.g. via
+    MediaAPIFactory) reuses it instead of re-authenticating. Failures raise
+    and are therefore not cached.
+
+    Args:
+        client_id: Twitch application client ID
+        client_secret: Twitch application client secret
+
+    Returns:
+        Access token string
+    """
+    url = "https://id.twitch.tv/oauth2/token"
+    params = {
+        'client_id': client_id,
+        'client_secret': client_secret,
+        'grant_type': 'client_credentials'
+    }
+
+    response = requests.post(url, params=params)
+    response.raise_for_status()
+
+    data = response.json()
+    return data['access_token']
+
+
 class IGDBClient(MediaAPIClient):
     """IGDB API client implementation."""
 
@@ -30,7 +62,7 @@ class IGDBClient(MediaAPIClient):
 
     def _get_access_token(self) -> str:
         """
-        Generate OAuth2 access token from Twitch.
+        Get an OAuth2 access token from Twitch (cached per credential pair).
 
         Returns:
             Access token string
@@ -38,18 +70,7 @@ class IGDBClient(MediaAPIClient):
         Raises:
             Exception if token generation fails
         """
-        url = "https://id.twitch.tv/oauth2/token"
-        params = {
-            'client_id': self.client_id,
-            'client_secret': self.client_secret,
-            'grant_type': 'client_credentials'
-        }
-
-        response = requests.post(url, params=params)
-        response.raise_for_status()
-
-        data = response.json()
-        return data['access_token']
+        return fetch_access_token(self.client_id, self.client_secret)
 
     def search(self, title: str) -> List[Dict]:
         """Search IGDB for a game title."""
@@ -62,7 +83,7 @@ class IGDBClient(MediaAPIClient):
         '''
 
         byte_array = self.wrapper.api_request('games', query)
-        results = json.loads(byte_array.decode('utf-8'))
+        results = json.loads(byte_array)
 
         return results if isinstance(results, list) else []
 
@@ -75,7 +96,7 @@ class IGDBClient(MediaAPIClient):
             where id = {media_id};
         '''
         byte_array = self.wrapper.api_request('games', query)
-        results = json.loads(byte_array.decode('utf-8'))
+        results = json.loads(byte_array)
 
         if not results or not isinstance(results, list):
             raise ValueError(f"Game with ID {media_id} not found")
@@ -218,10 +239,8 @@ tags:
         Returns:
             Full URL to poster image, or None if no cover available
         """
-        if 'cover' not in details or not details['cover']:
-            return None
-
-        image_id = details['cover'].get('image_id')
+        # Missing and null cover both fall through to an empty dict
+        image_id = (details.get('cover') or {}).get('image_id')
         if not image_id:
             return None
 
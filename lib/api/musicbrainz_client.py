@@ -1,5 +1,10 @@
 """MusicBrainz API client for music albums."""
 
+import heapq
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, List, Optional
 
 import musicbrainzngs
@@ -7,6 +12,56 @@ import musicbrainzngs
 from ..obsidian_utils import format_wikilink, get_user_input, sanitize_filename, translate_genre_tag
 from .base import MediaAPIClient
 
+# Shared, never-mutated include lists. musicbrainzngs wraps anything that isn't a
+# list (tuples included) in a list, so these can't be frozen into tuples.
+_RELEASE_INCLUDES = ['artists', 'labels', 'release-groups', 'tags']
+# browse_releases has no 'tags' include; release-group tags come from the anchor release
+_BROWSE_INCLUDES = ['artist-credits', 'labels']
+
+
+@lru_cache(maxsize=1024)
+def fetch_release(mbid: str) -> Dict:
+    """
+    Fetch a release with expanded artist/label/release-group/tag data, cached by MBID.
+
+    Releases are effectively immutable on MusicBrainz, so a cache hit skips both
+    the network round-trip and the 1 request/second rate limit. Errors raise
+    and are therefore not cached.
+
+    Args:
+        mbid: MusicBrainz release ID
+
+    Returns:
+        Raw musicbrainzngs response (treat as read-only)
+    """
+    return _fetch_release_once(mbid)
+
+
+# MBID -> Future for lookups currently on the wire. lru_cache doesn't coalesce
+# concurrent misses, so callers that race on one MBID share the first request.
+_in_flight: Dict[str, Future] = {}
+_in_flight_lock = threading.Lock()
+
+
+def _fetch_release_once(mbid: str) -> Dict:
+    """Issue get_release_by_id, or wait on an identical request already in flight."""
+    with _in_flight_lock:
+        future = _in_flight.get(mbid)
+        owner = future is None
+        if owner:
+            future = _in_flight[mbid] = Future()
+
+    if owner:
+        try:
+            future.set_result(musicbrainzngs.get_release_by_id(mbid, includes=_RELEASE_INCLUDES))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with _in_flight_lock:
+                _in_flight.pop(mbid, None)
+
+    return future.result()
+
 
 class MusicBrainzClient(MediaAPIClient):
     """MusicBrainz API client implementation."""
@@ -19,6 +74,9 @@ class MusicBrainzClient(MediaAPIClient):
             "1.0",
             "https://github.com/anthropics/obsidian-tools"
         )
+        # Release MBID -> release-group id, learned from search results and fetched
+        # releases, so get_details_batch() only browses groups with known siblings
+        self._release_groups: Dict[str, str] = {}
 
     def search(self, title: str) -> List[Dict]:
         """Search MusicBrainz for an album title."""
@@ -38,6 +96,10 @@ class MusicBrainzClient(MediaAPIClient):
             # Standardize the results format
             standardized = []
             for release in releases:
+                release_group_id = release.get('release-group', {}).get('id')
+                if release.get('id') and release_group_id:
+                    self._release_groups[release['id']] = release_group_id
+
                 # Get primary artist name
                 artist_credit = release.get('artist-credit', [])
                 artist_name = 'Various Artists'
@@ -66,61 +128,111 @@ class MusicBrainzClient(MediaAPIClient):
 
     def get_details(self, media_id: str) -> Dict:
         """Get detailed information from MusicBrainz."""
-        try:
-            # Get release details with expanded information
-            result = musicbrainzngs.get_release_by_id(
-                media_id,
-                includes=['artists', 'labels', 'release-groups', 'tags']
-            )
+        return self.get_details_batch([media_id])[media_id]
+
+    def get_details_batch(self, mbids: List[str]) -> Dict[str, Dict]:
+        """
+        Get details for several releases, coalescing releases that share a release-group.
+
+        The first pending MBID is fetched on its own (via the per-MBID cache); if
+        another pending MBID is known (from an earlier search() or fetch) to be in
+        the same release-group, one browse_releases call over that group resolves
+        every sibling at once. MusicBrainz rate-limits per request, not per result,
+        so albums that share a release-group cost one extra round-trip instead of
+        one each, and unrelated albums cost no extra round-trips at all.
+
+        Args:
+            mbids: MusicBrainz release IDs
+
+        Returns:
+            Dict mapping each requested MBID to its standardized details
+        """
+        details = {}
+        pending = list(dict.fromkeys(mbids))
 
-            release = result.get('release', {})
-
-            # Get artist credits
-            artist_credit = release.get('artist-credit', [])
-            artist_name = 'Various Artists'
-            if artist_credit:
-                artist_name = ' & '.join([
-                    ac.get('artist', {}).get('name', 'Unknown')
-                    for ac in artist_credit
-                    if isinstance(ac, dict) and 'artist' in ac
-                ])
-
-            # Get label information
-            label_info = release.get('label-info-list', [])
-            label = 'Independent'
-            if label_info and len(label_info) > 0:
-                label_obj = label_info[0].get('label')
-                if label_obj:
-                    label = label_obj.get('name', 'Independent')
-
-            # Get release group for type information
-            release_group = release.get('release-group', {})
-            primary_type = release_group.get('primary-type', 'Album')
-            secondary_types = release_group.get('secondary-type-list', [])
-
-            # Get tags from release-group (more reliable than release tags)
-            tags = []
-            rg_tags = release_group.get('tag-list', [])
-            if rg_tags:
-                # Sort by vote count and take top tags
-                sorted_tags = sorted(rg_tags, key=lambda t: int(t.get('count', 0)), reverse=True)
-                tags = [t['name'] for t in sorted_tags if int(t.get('count', 0)) > 5][:5]
-
-            return {
-                'id': release.get('id'),
-                'title': release.get('title', 'Unknown'),
-                'artist': artist_name,
-                'date': release.get('date', ''),
-                'label': label,
-                'primary_type': primary_type,
-                'secondary_types': secondary_types,
-                'tags': tags,
-                'disambiguation': release.get('disambiguation', '')
-            }
+        try:
+            while pending:
+                mbid = pending.pop(0)
+
+                # Get release details with expanded information (cached per MBID)
+                release = fetch_release(mbid).get('release', {})
+                details[mbid] = self._parse_release(release)
+
+                release_group = release.get('release-group', {})
+                group_id = release_group.get('id')
+                if not group_id:
+                    continue
+                self._release_groups[mbid] = group_id
+                if not any(self._release_groups.get(m) == group_id for m in pending):
+                    continue
+
+                # Resolve the remaining siblings of this release-group in one request.
+                # Browsed releases omit release-group tags, so reuse the group we already have.
+                result = musicbrainzngs.browse_releases(
+                    release_group=release_group['id'],
+                    includes=_BROWSE_INCLUDES,
+                    limit=100
+                )
+                for sibling in result.get('release-list', []):
+                    sibling_id = sibling.get('id')
+                    if sibling_id in pending:
+                        details[sibling_id] = self._parse_release(
+                            {**sibling, 'release-group': release_group}
+                        )
+
+                pending = [m for m in pending if m not in details]
 
         except musicbrainzngs.WebServiceError as e:
             raise Exception(f"MusicBrainz API error: {e}")
 
+        return details
+
+    def _parse_release(self, release: Dict) -> Dict:
+        """Standardize a raw MusicBrainz release into the details format."""
+        # Get artist credits
+        artist_credit = release.get('artist-credit', [])
+        artist_name = 'Various Artists'
+        if artist_credit:
+            artist_name = ' & '.join([
+                ac.get('artist', {}).get('name', 'Unknown')
+                for ac in artist_credit
+                if isinstance(ac, dict) and 'artist' in ac
+            ])
+
+        # Get label information
+        label_info = release.get('label-info-list', [])
+        label = 'Independent'
+        if label_info and len(label_info) > 0:
+            label_obj = label_info[0].get('label')
+            if label_obj:
+                label = label_obj.get('name', 'Independent')
+
+        # Get release group for type information
+        release_group = release.get('release-group', {})
+        primary_type = release_group.get('primary-type', 'Album')
+        secondary_types = list(release_group.get('secondary-type-list', []))
+
+        # Get tags from release-group (more reliable than release tags)
+        tags = []
+        rg_tags = release_group.get('tag-list', [])
+        if rg_tags:
+            # Top 5 tags by vote count (counts arrive as strings); nlargest avoids a full sort
+            voted = [(int(t.get('count', 0)), t['name']) for t in rg_tags]
+            voted = [entry for entry in voted if entry[0] > 5]
+            tags = [name for _, name in heapq.nlargest(5, voted, key=itemgetter(0))]
+
+        return {
+            'id': release.get('id'),
+            'title': release.get('title', 'Unknown'),
+            'artist': artist_name,
+            'date': release.get('date', ''),
+            'label': label,
+            'primary_type': primary_type,
+            'secondary_types': secondary_types,
+            'tags': tags,
+            'disambiguation': release.get('disambiguation', '')
+        }
+
     def prompt_disambiguation(self, title: str, results: List[Dict]) -> Optional[Dict]:
         """Show results and prompt user to select the correct one."""
         print(f"\n🎵 Multiple results found for '{title}':")
@@ -129,7 +241,7 @@ class MusicBrainzClient(MediaAPIClient):
         for idx, result in enumerate(results, 1):
             album_title = result.get('title', 'Unknown')
             artist = result.get('artist', 'Unknown')
-            year = result.get('date', 'TBD')[:4] if result.get('date') else 'TBD'
+            year = (result.get('date') or '')[:4] or 'TBD'
 
             # Get album type
             album_type = result.get('type', 'Album').upper()
@@ -215,12 +327,8 @@ tags:
         artist = details.get('artist', 'Unknown')
         title = details.get('title', 'Unknown')
 
-        # Get year from date field
-        date = details.get('date', '')
-        year = 'TBD'
-        if date:
-            # Date can be YYYY-MM-DD, YYYY-MM, or YYYY
-            year = date[:4]
+        # Get year from date field; date can be YYYY-MM-DD, YYYY-MM, YYYY, empty or None
+        year = (details.get('date') or '')[:4] or 'TBD'
 
         # Sanitize for filesystem
         artist = sanitize_filename(artist)
@@ -236,11 +344,8 @@ tags:
         Returns:
             Full URL to cover art image, or None if no cover available
         """
-        mbid = details.get('id')
-        if not mbid:
-            return None
-
         # Cover Art Archive provides direct access to front cover
         # This will return the front cover image directly
         # If no cover exists, the download will fail gracefully
-        return f"https://coverartarchive.org/release/{mbid}/front"
+        mbid = details.get('id')
+        return f"https://coverartarchive.org/release/{mbid}/front" if mbid else None
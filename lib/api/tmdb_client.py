@@ -1,10 +1,10 @@
 """TMDB API client for movies and TV shows."""
 
+import json
 from typing import Dict, List, Optional
 
-import requests
-
 from ..obsidian_utils import format_wikilink, get_user_input, sanitize_filename, translate_genre_tag
+from ..poster_utils import make_session
 from .base import MediaAPIClient
 
 
@@ -23,6 +23,9 @@ class TMDBClient(MediaAPIClient):
         self.media_type = media_type
         self.tmdb_base_url = "https://api.themoviedb.org/3"
 
+        # Search and details calls share one pooled session
+        self._session = make_session()
+
     def search(self, title: str) -> List[Dict]:
         """Search TMDB for a title."""
         url = f"{self.tmdb_base_url}/search/{self.media_type}"
@@ -32,9 +35,10 @@ class TMDBClient(MediaAPIClient):
             'language': 'en-US'
         }
 
-        response = requests.get(url, params=params)
+        response = self._session.get(url, params=params)
         response.raise_for_status()
-        data = response.json()
+        # Parse the raw bytes; response.json() would decode to str first
+        data = json.loads(response.content)
 
         return data.get('results', [])
 
@@ -47,9 +51,9 @@ class TMDBClient(MediaAPIClient):
             'append_to_response': 'credits,external_ids'
         }
 
-        response = requests.get(url, params=params)
+        response = self._session.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        return json.loads(response.content)
 
     def prompt_disambiguation(self, title: str, results: List[Dict]) -> Optional[Dict]:
         """Show results and prompt user to select the correct one."""
@@ -106,8 +110,8 @@ class TMDBClient(MediaAPIClient):
 
         # Get director (for movies) or creator (for TV shows)
         crew = details.get('credits', {}).get('crew', [])
-        directors = [c['name'] for c in crew if c.get('job') == 'Director']
-        director_text = format_wikilink(directors[0]) if directors else "Unknown"
+        director = next((c['name'] for c in crew if c.get('job') == 'Director'), None)
+        director_text = format_wikilink(director) if director is not None else "Unknown"
 
         # Get top 3 cast members
         cast = details.get('credits', {}).get('cast', [])[:3]
@@ -159,10 +163,10 @@ tags:
         """Generate filename in 'Title (Year).md' format."""
         # Get the year
         if self.media_type == 'movie':
-            year = details.get('release_date', '')[:4]
+            year = (details.get('release_date') or '')[:4]
             proper_title = details.get('title', 'Unknown')
         else:  # tv
-            year = details.get('first_air_date', '')[:4]
+            year = (details.get('first_air_date') or '')[:4]
             proper_title = details.get('name', 'Unknown')
 
         if not year:
@@ -177,6 +181,4 @@ tags:
     def get_poster_url(self, details: Dict) -> Optional[str]:
         """Get full poster URL from TMDB details."""
         poster_path = details.get('poster_path')
-        if not poster_path:
-            return None
-        return f"https://image.tmdb.org/t/p/original{poster_path}"
+        return f"https://image.tmdb.org/t/p/original{poster_path}" if poster_path else None
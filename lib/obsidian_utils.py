@@ -1,6 +1,8 @@
 """Utilities for working with Obsidian markdown files."""
 
 import re
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -24,9 +26,19 @@ def extract_yaml_frontmatter(content: str) -> Tuple[Optional[Dict], str]:
         return None, content
 
 
+# Patterns compiled once at import rather than looked up in re's cache per call
+_TITLE_YEAR_RE = re.compile(r'^(.+?)\s*\((\d{4})\)\s*$')
+_GENRE_SPECIAL_RE = re.compile(r'[^\w\s-]')
+_GENRE_SPACES_RE = re.compile(r'[\s_]+')
+_GENRE_HYPHENS_RE = re.compile(r'-+')
+
+# Built once; str.translate rewrites every problematic character in a single pass
+_SANITIZE_TABLE = str.maketrans({':': ' -', '/': '-', '\\': '-', '?': None})
+
+
 def sanitize_filename(title: str) -> str:
     """Sanitize title for filesystem (remove problematic characters)."""
-    return title.replace(':', ' -').replace('/', '-').replace('\\', '-').replace('?', '')
+    return title.translate(_SANITIZE_TABLE)
 
 
 def format_wikilink(text: str) -> str:
@@ -86,13 +98,39 @@ def extract_title_and_year(input_string: str) -> Tuple[str, Optional[str]]:
         "The Matrix (1999)" -> ("The Matrix", "1999")
     """
     # Match pattern: Title (Year) where Year is 4 digits
-    match = re.match(r'^(.+?)\s*\((\d{4})\)\s*$', input_string)
+    match = _TITLE_YEAR_RE.match(input_string)
     if match:
         return match.group(1).strip(), match.group(2)
     else:
         return input_string.strip(), None
 
 
+def _date_year(value) -> Optional[str]:
+    """Year from a 'YYYY-MM-DD' / 'YYYY-MM' / 'YYYY' string (TMDB, MusicBrainz)."""
+    return value[:4] if value else None
+
+
+def _timestamp_year(value) -> Optional[str]:
+    """Year from a Unix timestamp (IGDB), in UTC to avoid timezone issues."""
+    return str(datetime.fromtimestamp(value, tz=timezone.utc).year) if value is not None else None
+
+
+def _int_year(value) -> Optional[str]:
+    """Year from an int year (Google Books first_publish_year)."""
+    return str(value) if value else None
+
+
+# media_type -> (result field holding the date, converter to a 4-digit year string)
+_YEAR_EXTRACTORS = {
+    'movie': ('release_date', _date_year),
+    'tv': ('first_air_date', _date_year),
+    'series': ('first_air_date', _date_year),
+    'game': ('first_release_date', _timestamp_year),
+    'album': ('date', _date_year),
+    'book': ('first_publish_year', _int_year),
+}
+
+
 def filter_results_by_year(results: List[Dict], year: str, media_type: str) -> List[Dict]:
     """
     Filter search results by year.
@@ -105,35 +143,27 @@ def filter_results_by_year(results: List[Dict], year: str, media_type: str) -> L
     Returns:
         Filtered list of results matching the year
     """
-    filtered = []
-    for result in results:
-        result_year = None
-
-        if media_type in ['movie', 'tv', 'series']:
-            # TMDB format
-            if media_type == 'movie' and 'release_date' in result:
-                result_year = result['release_date'][:4] if result['release_date'] else None
-            elif media_type in ['tv', 'series'] and 'first_air_date' in result:
-                result_year = result['first_air_date'][:4] if result['first_air_date'] else None
-        elif media_type == 'game':
-            # IGDB format - convert timestamp to year (use UTC to avoid timezone issues)
-            if 'first_release_date' in result:
-                from datetime import datetime, timezone
-                timestamp = result['first_release_date']
-                result_year = str(datetime.fromtimestamp(timestamp, tz=timezone.utc).year)
-        elif media_type == 'album':
-            # MusicBrainz date format: 'YYYY-MM-DD', 'YYYY-MM', or 'YYYY'
-            if 'date' in result:
-                result_year = result['date'][:4] if result['date'] else None
-        elif media_type == 'book':
-            # Google Books: first_publish_year is an int
-            if 'first_publish_year' in result and result['first_publish_year']:
-                result_year = str(result['first_publish_year'])
-
-        if result_year == year:
-            filtered.append(result)
-
-    return filtered
+    extractor = _YEAR_EXTRACTORS.get(media_type)
+    if extractor is None:
+        return []
+
+    # Resolve the field/converter once, not per result
+    field, to_year = extractor
+    if to_year is _date_year and len(year) == 4:
+        # 'YYYY-...' strings: a prefix test avoids slicing every date
+        return [result for result in results if (result.get(field) or '').startswith(year)]
+    return [result for result in results if to_year(result.get(field)) == year]
+
+
+# media_type -> how to read a result's title (TMDB movies use 'title', TV uses 'name')
+_TITLE_GETTERS = {
+    'movie': lambda result: result.get('title') or result.get('name'),
+    'tv': lambda result: result.get('title') or result.get('name'),
+    'series': lambda result: result.get('title') or result.get('name'),
+    'game': lambda result: result.get('name'),       # IGDB
+    'album': lambda result: result.get('title'),     # MusicBrainz
+    'book': lambda result: result.get('title'),      # Google Books (standardized)
+}
 
 
 def find_exact_title_match(results: List[Dict], title: str, media_type: str) -> Optional[Dict]:
@@ -148,32 +178,20 @@ def find_exact_title_match(results: List[Dict], title: str, media_type: str) ->
     Returns:
         The result if exactly one exact match is found, None otherwise
     """
-    exact_matches = []
-    title_lower = title.lower().strip()
+    get_title = _TITLE_GETTERS.get(media_type)
+    if get_title is None:
+        return None
 
+    needle = title.strip().casefold()
+    match = None
     for result in results:
-        result_title = None
-
-        if media_type in ['movie', 'tv', 'series']:
-            # TMDB format: movies use 'title', TV uses 'name'
-            result_title = result.get('title') or result.get('name')
-        elif media_type == 'game':
-            # IGDB format: uses 'name'
-            result_title = result.get('name')
-        elif media_type == 'album':
-            # MusicBrainz uses 'title' field
-            result_title = result.get('title')
-        elif media_type == 'book':
-            # Google Books standardized result uses 'title'
-            result_title = result.get('title')
-
-        if result_title and result_title.lower().strip() == title_lower:
-            exact_matches.append(result)
-
-    # Only return if exactly one exact match found
-    if len(exact_matches) == 1:
-        return exact_matches[0]
-    return None
+        result_title = get_title(result)
+        if result_title and result_title.strip().casefold() == needle:
+            # Only return if exactly one exact match found; stop at the second
+            if match is not None:
+                return None
+            match = result
+    return match
 
 
 def is_game_unreleased(game_result: Dict) -> bool:
@@ -239,6 +257,7 @@ def _load_genre_mappings() -> Dict[str, List[str]]:
         return _GENRE_MAPPINGS_CACHE
 
 
+@lru_cache(maxsize=512)
 def translate_genre_tag(genre: str) -> str:
     """
     Translate API genre string to Obsidian-friendly tag.
@@ -246,6 +265,10 @@ def translate_genre_tag(genre: str) -> str:
     Uses genre_mappings.yaml config to map API genre strings to clean tags.
     Falls back to sanitizing the genre if no mapping found.
 
+    Results are memoized per genre string, since the same genres recur across
+    a library; the missing-mapping warning is therefore printed once per genre.
+    Call translate_genre_tag.cache_clear() after changing the mappings.
+
     Args:
         genre: Genre string from API (TMDB or IGDB)
 
@@ -268,9 +291,9 @@ def translate_genre_tag(genre: str) -> str:
 
     # No mapping found - sanitize the genre
     # Convert to lowercase and replace spaces/special chars with hyphens
-    sanitized = re.sub(r'[^\w\s-]', ' ', genre_lower)  # Convert special chars to spaces (preserves word boundaries)
-    sanitized = re.sub(r'[\s_]+', '-', sanitized)      # Replace spaces/underscores with hyphens
-    sanitized = re.sub(r'-+', '-', sanitized)          # Collapse multiple hyphens
+    sanitized = _GENRE_SPECIAL_RE.sub(' ', genre_lower)  # Convert special chars to spaces (preserves word boundaries)
+    sanitized = _GENRE_SPACES_RE.sub('-', sanitized)     # Replace spaces/underscores with hyphens
+    sanitized = _GENRE_HYPHENS_RE.sub('-', sanitized)    # Collapse multiple hyphens
     sanitized = sanitized.strip('-')                    # Remove leading/trailing hyphens
 
     result = sanitized if sanitized else 'unknown'
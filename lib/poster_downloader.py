@@ -1,12 +1,20 @@
 """Poster downloader for Obsidian media notes."""
 
+import json
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 import musicbrainzngs
 import requests
+import yaml
 
+from .api.igdb_client import fetch_access_token
 from .obsidian_utils import (
     extract_title_and_year,
     filter_results_by_year,
@@ -14,11 +22,191 @@ from .obsidian_utils import (
     get_user_input,
 )
 from .poster_utils import (
+    YamlLoader,
+    atomic_write,
     download_and_resize_poster,
-    extract_yaml_frontmatter,
+    make_session,
+    scan_tags_and_poster,
+    split_yaml_frontmatter,
     update_frontmatter_with_poster,
 )
 
+# Media types in detection priority order (a note tagged both movie and series is a movie)
+_MEDIA_TYPES = ('movie', 'series', 'game', 'album', 'book')
+_MEDIA_TAGS = frozenset(_MEDIA_TYPES)
+
+# TMDB's pre-resized poster widths, smallest first
+_TMDB_POSTER_WIDTHS = (92, 154, 185, 342, 500, 780)
+
+
+def _tmdb_size_for(width: int) -> str:
+    """
+    Pick the smallest TMDB poster size at least 1.5x the target width.
+
+    Downloading a CDN-resized variant instead of the original cuts transfer and
+    decode work several-fold while leaving enough pixels for a clean downscale.
+    Falls back to 'original' when no fixed width is large enough.
+    """
+    for size in _TMDB_POSTER_WIDTHS:
+        if size >= width * 1.5:
+            return f'w{size}'
+    return 'original'
+
+
+# Menu emoji per media type in prompt_disambiguation()
+_MEDIA_EMOJI = {'movie': '🎬', 'series': '📺', 'game': '🎮', 'album': '🎵', 'book': '📚'}
+
+# Any '#movie'-style hashtag, anywhere in the note (substring match, so '#movies' counts)
+_HASHTAG_RE = re.compile(r'#(movie|series|game|album|book)', re.IGNORECASE)
+
+# First four-digit year in a Google Books 'publishedDate'
+_YEAR_RE = re.compile(r'\b(\d{4})\b')
+
+
+# Notes are read in chunks of this many characters until the frontmatter closes
+_HEAD_CHUNK = 4096
+
+# Threads reading/parsing notes during the vault scan; file reads release the GIL,
+# so this overlaps filesystem latency on large (or network-mounted) vaults
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Concurrent TMDB searches when prefetching a batch (well under TMDB's rate limit)
+_SEARCH_WORKERS = 8
+
+
+class _Note(NamedTuple):
+    """What the vault scan needs from a markdown note."""
+    media_type: Optional[str]  # 'movie', 'series', 'game', 'album', 'book', or None
+    has_poster: bool           # frontmatter has a non-empty 'poster'
+
+
+@lru_cache(maxsize=1024)
+def _frontmatter_fields(frontmatter_text: Optional[str]) -> Dict:
+    """
+    'tags'/'poster' from raw frontmatter: fast line scan, YAML only when needed.
+
+    Memoized on the text itself, so notes sharing a frontmatter block (e.g.
+    created from one template) are scanned or YAML-parsed once per run. The
+    returned dict is shared and must not be mutated.
+    """
+    if frontmatter_text is None:
+        return {}
+    fields = scan_tags_and_poster(frontmatter_text)
+    if fields is None:
+        try:
+            parsed = yaml.load(frontmatter_text, Loader=YamlLoader)
+        except yaml.YAMLError:
+            parsed = None
+        if not isinstance(parsed, dict):
+            return {}
+        # Keep only what the scan reads, not the whole parsed tree
+        fields = {key: parsed[key] for key in ('tags', 'poster') if key in parsed}
+    return fields
+
+
+def _first_media_type(found: FrozenSet[str]) -> Optional[str]:
+    """Highest-priority media type among the media tags found on a note."""
+    if not found:
+        return None
+    return next(media_type for media_type in _MEDIA_TYPES if media_type in found)
+
+
+def _hashtag_media_type(content: str) -> Optional[str]:
+    """Media type from '#movie'-style hashtags: one case-insensitive pass over the note."""
+    hashtags = (tag.lower() for tag in _HASHTAG_RE.findall(content))
+    return _first_media_type(_MEDIA_TAGS.intersection(hashtags))
+
+
+@lru_cache(maxsize=4096)
+def _parse_note(path: str, mtime_ns: int, size: int) -> _Note:
+    """
+    Read and parse a note once per (path, mtime, size).
+
+    Tag detection and the poster check share this, so each file is read and
+    parsed once per scan; an edited file gets a new key and is re-read. Only
+    'tags' and 'poster' are needed, so simple frontmatter is line-scanned and
+    the YAML parser runs only for notes the scanner can't handle.
+
+    Only the frontmatter block is read up front. The rest of the note is read
+    only when the frontmatter has no media tag and hashtags must be checked.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        head = f.read(_HEAD_CHUNK)
+        if head.startswith('---'):
+            # Read until the closing '---' (the second one, as split_yaml_frontmatter finds it)
+            start = 3
+            while head.find('---', start) == -1:
+                chunk = f.read(_HEAD_CHUNK)
+                if not chunk:
+                    break
+                start = max(3, len(head) - 2)
+                head += chunk
+
+        frontmatter_text, _ = split_yaml_frontmatter(head)
+        fields = _frontmatter_fields(frontmatter_text)
+
+        raw_tags = fields.get('tags')
+        media_type = None
+        if isinstance(raw_tags, list):
+            # Membership-test each tag against the media tags; other tags are never collected
+            tags = (str(t).lower() for t in raw_tags)
+            media_type = _first_media_type(_MEDIA_TAGS.intersection(tags))
+        if media_type is None:
+            # Hashtags can appear anywhere, so this is the one case that needs the whole note
+            media_type = _hashtag_media_type(head + f.read())
+
+    poster = fields.get('poster')
+    return _Note(media_type, bool(poster) and bool(str(poster).strip()))
+
+
+def _load_note(file_path: Union[str, Path], stat: Optional[os.stat_result] = None) -> _Note:
+    """Fetch a note through the parse cache, reusing a stat result if the caller has one."""
+    if stat is None:
+        stat = os.stat(file_path)
+    return _parse_note(os.fspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _iter_markdown_files(root: str) -> Iterator[os.DirEntry]:
+    """
+    Yield a DirEntry for every '*.md' file under root, in Path.rglob('*.md') order.
+
+    Walks with os.scandir so file/directory checks come from the directory read
+    and each note's stat is cached on its DirEntry, rather than building and
+    stat-ing a Path per file. Like rglob, symlinked directories are not descended
+    into and unreadable directories are skipped.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except PermissionError:
+        return
+
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if not entry.is_symlink():
+                subdirs.append(entry.path)
+        elif entry.name.endswith('.md'):
+            yield entry
+
+    for subdir in subdirs:
+        yield from _iter_markdown_files(subdir)
+
+
+def _try_load_note(
+    entry: os.DirEntry
+) -> Tuple[os.DirEntry, Optional[_Note], Optional[Exception]]:
+    """Scan worker: (entry, note, None), or (entry, None, error) if the file can't be read."""
+    try:
+        # One stat and one read/parse per file, shared by both checks
+        return entry, _load_note(entry.path, entry.stat()), None
+    except Exception as e:
+        return entry, None, e
+
 
 class PosterDownloader:
     """Download and manage posters for media notes."""
@@ -51,12 +239,23 @@ class PosterDownloader:
         self.poster_width = poster_width
         self.tmdb_base_url = "https://api.themoviedb.org/3"
 
-        # Initialize IGDB wrapper if credentials provided
-        self.igdb_wrapper = None
-        if igdb_client_id and igdb_client_secret:
-            access_token = self._get_igdb_access_token()
-            from igdb.wrapper import IGDBWrapper
-            self.igdb_wrapper = IGDBWrapper(igdb_client_id, access_token)
+        # Searches and poster downloads share one pooled session
+        self._session = make_session()
+        # prefetch_searches() workers each set their own session here, since a
+        # Session's cookie jar and adapter setup aren't documented thread-safe
+        self._local = threading.local()
+
+        # search_api() results per (normalized title, media type); notes like
+        # 'Dune (1984)' and 'Dune (2021)' search the same title
+        self._search_cache: Dict[Tuple[str, str], Tuple[List[Dict], str]] = {}
+
+        # Poster URL -> poster file already saved from it during this run, so
+        # duplicate notes for one title copy that file instead of re-downloading
+        self._saved_posters: Dict[str, Path] = {}
+
+        # IGDB wrapper is built on first use (see igdb_wrapper), so scans that
+        # never search for a game don't pay for the Twitch OAuth round-trip
+        self._igdb_wrapper = None
 
         # Initialize MusicBrainz (no credentials needed)
         musicbrainzngs.set_useragent(
@@ -65,17 +264,18 @@ class PosterDownloader:
             "https://github.com/anthropics/obsidian-tools"
         )
 
+    @property
+    def igdb_wrapper(self):
+        """IGDB API wrapper, created on first access; None without IGDB credentials."""
+        if self._igdb_wrapper is None and self.igdb_client_id and self.igdb_client_secret:
+            access_token = self._get_igdb_access_token()
+            from igdb.wrapper import IGDBWrapper
+            self._igdb_wrapper = IGDBWrapper(self.igdb_client_id, access_token)
+        return self._igdb_wrapper
+
     def _get_igdb_access_token(self) -> str:
-        """Generate OAuth2 access token from Twitch."""
-        url = "https://id.twitch.tv/oauth2/token"
-        params = {
-            'client_id': self.igdb_client_id,
-            'client_secret': self.igdb_client_secret,
-            'grant_type': 'client_credentials'
-        }
-        response = requests.post(url, params=params)
-        response.raise_for_status()
-        return response.json()['access_token']
+        """Twitch OAuth2 access token, shared process-wide with the IGDB client."""
+        return fetch_access_token(self.igdb_client_id, self.igdb_client_secret)
 
     def get_media_type_from_tags(self, file_path: Path) -> Optional[str]:
         """
@@ -88,40 +288,7 @@ class PosterDownloader:
             'movie', 'series', 'game', 'album', 'book', or None if no matching tag found
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Check YAML frontmatter
-            frontmatter, remaining = extract_yaml_frontmatter(content)
-            if frontmatter and 'tags' in frontmatter:
-                tags = frontmatter['tags']
-                if isinstance(tags, list):
-                    tags_lower = [str(t).lower() for t in tags]
-                    if 'movie' in tags_lower:
-                        return 'movie'
-                    if 'series' in tags_lower:
-                        return 'series'
-                    if 'game' in tags_lower:
-                        return 'game'
-                    if 'album' in tags_lower:
-                        return 'album'
-                    if 'book' in tags_lower:
-                        return 'book'
-
-            # Check hashtag format
-            full_content = content.lower()
-            if '#movie' in full_content:
-                return 'movie'
-            if '#series' in full_content:
-                return 'series'
-            if '#game' in full_content:
-                return 'game'
-            if '#album' in full_content:
-                return 'album'
-            if '#book' in full_content:
-                return 'book'
-
-            return None
+            return _load_note(file_path).media_type
         except Exception as e:
             print(f"Error reading {file_path}: {e}")
             return None
@@ -129,16 +296,7 @@ class PosterDownloader:
     def already_has_poster(self, file_path: Path) -> bool:
         """Check if the file already has a poster property in frontmatter."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            frontmatter, _ = extract_yaml_frontmatter(content)
-            if frontmatter and 'poster' in frontmatter:
-                poster_value = frontmatter['poster']
-                if poster_value and str(poster_value).strip():
-                    return True
-
-            return False
+            return _load_note(file_path).has_poster
         except Exception as e:
             print(f"Error reading {file_path}: {e}")
             return False
@@ -152,17 +310,28 @@ class PosterDownloader:
         """
         media_files = []
 
-        for md_file in self.vault_path.rglob('*.md'):
-            media_type = self.get_media_type_from_tags(md_file)
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+            # map() submits each note as the walk yields it, so workers read notes
+            # while the walk is still listing directories; results come back in
+            # walk order, so output matches a sequential scan
+            scanned = list(pool.map(_try_load_note,
+                                    _iter_markdown_files(os.fspath(self.vault_path))))
+
+        for entry, note, error in scanned:
+            if error is not None:
+                print(f"Error reading {entry.path}: {error}")
+                continue
+
+            media_type = note.media_type
             if not media_type:
                 continue
 
-            if self.already_has_poster(md_file):
-                print(f"⊘ Skipping (already has poster): {md_file.name}")
+            if note.has_poster:
+                print(f"⊘ Skipping (already has poster): {entry.name}")
                 continue
 
-            media_files.append((md_file, media_type))
-            print(f"✓ Found: {md_file.name} [{media_type.upper()}]")
+            media_files.append((Path(entry.path), media_type))
+            print(f"✓ Found: {entry.name} [{media_type.upper()}]")
 
         return media_files
 
@@ -187,9 +356,9 @@ class PosterDownloader:
             'language': 'en-US'
         }
 
-        response = requests.get(url, params=params)
+        response = self._http().get(url, params=params)
         response.raise_for_status()
-        data = response.json()
+        data = json.loads(response.content)
 
         return data.get('results', [])
 
@@ -214,9 +383,8 @@ class PosterDownloader:
         '''
 
         try:
-            import json
             byte_array = self.igdb_wrapper.api_request('games', query)
-            results = json.loads(byte_array.decode('utf-8'))
+            results = json.loads(byte_array)
             return results if isinstance(results, list) else []
         except Exception as e:
             print(f"❌ IGDB search error: {e}")
@@ -241,7 +409,7 @@ class PosterDownloader:
                 'country': 'US',
                 'key': self.google_books_api_key,
             }
-            response = requests.get(url, params=params, timeout=15)
+            response = self._http().get(url, params=params, timeout=15)
             response.raise_for_status()
             data = response.json()
 
@@ -254,7 +422,7 @@ class PosterDownloader:
                 author = ' & '.join(authors) if authors else 'Unknown'
 
                 published = info.get('publishedDate', '') or ''
-                year_match = re.search(r'\b(\d{4})\b', published)
+                year_match = _YEAR_RE.search(published)
                 first_publish_year = int(year_match.group(1)) if year_match else None
 
                 book_title = info.get('title', 'Unknown')
@@ -350,15 +518,29 @@ class PosterDownloader:
         Returns:
             Tuple of (results, api_used) where api_used is 'tmdb', 'igdb', 'musicbrainz',
             or 'googlebooks'
+
+        Non-empty results are cached for the lifetime of the downloader, keyed by
+        case- and whitespace-normalized title. Empty results are not cached, since
+        most search methods also return [] on API errors.
         """
+        key = (' '.join(title.split()).casefold(), media_type)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            results, api_used = cached
+            return list(results), api_used
+
         if media_type == 'game':
-            return self.search_igdb(title), 'igdb'
+            results, api_used = self.search_igdb(title), 'igdb'
         elif media_type == 'album':
-            return self.search_musicbrainz(title), 'musicbrainz'
+            results, api_used = self.search_musicbrainz(title), 'musicbrainz'
         elif media_type == 'book':
-            return self.search_googlebooks(title), 'googlebooks'
+            results, api_used = self.search_googlebooks(title), 'googlebooks'
         else:
-            return self.search_tmdb(title, media_type), 'tmdb'
+            results, api_used = self.search_tmdb(title, media_type), 'tmdb'
+
+        if results:
+            self._search_cache[key] = (results, api_used)
+        return list(results), api_used
 
     def get_poster_url_from_result(self, result: Dict, api_used: str) -> Optional[str]:
         """
@@ -375,7 +557,7 @@ class PosterDownloader:
             poster_path = result.get('poster_path')
             if not poster_path:
                 return None
-            return f"https://image.tmdb.org/t/p/original{poster_path}"
+            return f"https://image.tmdb.org/t/p/{_tmdb_size_for(self.poster_width)}{poster_path}"
 
         elif api_used == 'igdb':
             if 'cover' not in result or not result['cover']:
@@ -399,11 +581,11 @@ class PosterDownloader:
 
     def prompt_disambiguation(self, title: str, results: List[Dict], media_type: str, api_used: str) -> Optional[Dict]:
         """Show results and prompt user to select the correct one."""
-        emoji_map = {'movie': '🎬', 'series': '📺', 'game': '🎮', 'album': '🎵', 'book': '📚'}
-        emoji = emoji_map.get(media_type, '📝')
+        emoji = _MEDIA_EMOJI.get(media_type, '📝')
+        type_label = media_type.upper()
 
-        print(f"\n{emoji} Multiple results found for '{title}':")
-        print("-" * 80)
+        # Build the whole menu and print it once rather than line by line
+        lines = [f"\n{emoji} Multiple results found for '{title}':", "-" * 80]
 
         for idx, result in enumerate(results, 1):
             # Extract name based on API
@@ -412,7 +594,6 @@ class PosterDownloader:
                 # Convert Unix timestamp to year
                 year = 'TBD'
                 if 'first_release_date' in result:
-                    from datetime import datetime
                     timestamp = result['first_release_date']
                     year = str(datetime.fromtimestamp(timestamp).year)
                 summary = result.get('summary', 'No description')[:100]
@@ -437,14 +618,14 @@ class PosterDownloader:
                     year = result['first_air_date'][:4]
                 summary = result.get('overview', 'No description')[:100]
 
-            type_label = media_type.upper()
-            print(f"{idx}. {name} ({year}) [{type_label}]")
+            lines.append(f"{idx}. {name} ({year}) [{type_label}]")
             if summary:
-                print(f"   {summary}...")
-            print()
+                lines.append(f"   {summary}...")
+            lines.append("")
 
-        print("0. Skip this file")
-        print("-" * 80)
+        lines.append("0. Skip this file")
+        lines.append("-" * 80)
+        print("\n".join(lines))
 
         while True:
             try:
@@ -460,6 +641,51 @@ class PosterDownloader:
             except ValueError:
                 print("Please enter a valid number")
 
+    def _http(self) -> requests.Session:
+        """Return the session for this thread: a prefetch worker's own, else the shared one."""
+        return getattr(self._local, 'session', None) or self._session
+
+    def prefetch_searches(self, media_files: List[Tuple[Path, str]]) -> None:
+        """
+        Run the TMDB searches for a batch of files concurrently, ahead of processing.
+
+        Fills the search_api() cache so the sequential (interactive) process_file()
+        loop finds results ready instead of waiting on one round-trip per note.
+        Only TMDB-backed types are prefetched: TMDB's rate limit comfortably allows
+        parallel requests, and search_tmdb raises rather than printing, so a failed
+        prefetch stays silent and process_file() simply searches again. Each
+        worker thread searches over its own Session, closed once the batch is done.
+
+        Args:
+            media_files: (file_path, media_type) tuples, as from find_media_files()
+        """
+        titles = {
+            (extract_title_and_year(file_path.name.replace('.md', ''))[0], media_type)
+            for file_path, media_type in media_files
+            if media_type in ('movie', 'series')
+        }
+        if len(titles) < 2:
+            return
+
+        sessions: List[requests.Session] = []
+
+        def search(title_and_type):
+            if getattr(self._local, 'session', None) is None:
+                session = make_session(pool_maxsize=1)
+                sessions.append(session)
+                self._local.session = session
+            try:
+                self.search_api(*title_and_type)
+            except Exception:
+                pass  # process_file() repeats the search and reports the error
+
+        try:
+            with ThreadPoolExecutor(max_workers=_SEARCH_WORKERS) as pool:
+                list(pool.map(search, titles))
+        finally:
+            for session in sessions:
+                session.close()
+
     def process_file(self, file_path: Path, media_type: str) -> bool:
         """
         Process a single file: search API, download poster, update frontmatter.
@@ -528,10 +754,24 @@ class PosterDownloader:
         poster_filename = file_path.stem + '.jpg'
         poster_file_path = file_path.parent / poster_filename
 
-        # Download and resize poster
-        print("📥 Downloading poster...")
-        if not download_and_resize_poster(poster_url, poster_file_path, self.poster_width):
-            return False
+        # Same image already downloaded and resized this run: copy that file,
+        # atomically so an interrupted copy can't leave a truncated JPEG behind
+        copied = False
+        saved = self._saved_posters.get(poster_url)
+        if saved is not None and saved != poster_file_path:
+            try:
+                atomic_write(poster_file_path, saved.read_bytes())
+                copied = True
+            except OSError:
+                pass  # Moved or deleted since; download it again
+
+        if not copied:
+            # Download and resize poster
+            print("📥 Downloading poster...")
+            if not download_and_resize_poster(poster_url, poster_file_path, self.poster_width,
+                                              session=self._session):
+                return False
+            self._saved_posters[poster_url] = poster_file_path
 
         print(f"✓ Poster saved: {poster_filename}")
 
@@ -1,19 +1,69 @@
 """Utilities for downloading and processing media posters."""
 
-from io import BytesIO
+import io
+import os
+import re
+import stat
+import tempfile
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Tuple, Union
 
 import requests
 import yaml
 from PIL import Image
+from requests.adapters import HTTPAdapter
+
+# libyaml's C parser and emitter when PyYAML was built with it (the standard
+# wheels are), several times faster than the pure-Python SafeLoader/SafeDumper
+# with the same results
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper
+    from yaml import SafeLoader as YamlLoader
+
+# Poster downloads are streamed in chunks of this size into a buffer that stays in
+# memory up to _SPOOL_MAX_SIZE and moves to a temporary file beyond it
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+_SPOOL_MAX_SIZE = 2 * 1024 * 1024
+
+
+def make_session(pool_maxsize: int = 20) -> requests.Session:
+    """
+    Create a requests.Session with a pooled HTTPS adapter.
+
+    Requests made through one session reuse keep-alive connections instead of
+    a TLS handshake per request; pool_maxsize caps the connections kept per host.
+    """
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_maxsize=pool_maxsize))
+    return session
+
+
+# Downloads without a caller-supplied session share this one, so e.g. the 'add'
+# command reuses the image CDN's connection across titles
+_SESSION = make_session()
+
+# Seconds to wait for the image server to connect / send the next chunk
+_DOWNLOAD_TIMEOUT = 15
+
+# Process umask, read once at import: os.umask() can only be queried by setting
+# it, which would briefly change it for every thread creating files
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Image.resize(reducing_gap=...): sources more than this many times the target
+# size are first shrunk with a cheap integer box reduce
+_REDUCING_GAP = 3.0
 
 
 def download_and_resize_poster(
     poster_url: str,
     output_path: Path,
     poster_width: int = 200,
-    tmdb_api_key: str = None
+    tmdb_api_key: str = None,
+    session: Optional[requests.Session] = None
 ) -> bool:
     """
     Download poster from URL, resize it, convert to JPEG.
@@ -23,40 +73,70 @@ def download_and_resize_poster(
         output_path: Where to save the processed poster
         poster_width: Width to resize to in pixels (default: 200)
         tmdb_api_key: Deprecated, kept for backward compatibility
+        session: Optional requests.Session to reuse pooled keep-alive connections
+            across many downloads (default: this module's shared session)
 
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Download the image from provided URL
-        response = requests.get(poster_url)
-        response.raise_for_status()
-
-        # Open image with PIL
-        img = Image.open(BytesIO(response.content))
-
-        # Calculate new height maintaining aspect ratio
-        aspect_ratio = img.height / img.width
-        new_height = int(poster_width * aspect_ratio)
-
-        # Resize image
-        img_resized = img.resize((poster_width, new_height), Image.Resampling.LANCZOS)
-
-        # Convert to RGB if needed (for JPEG)
-        if img_resized.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', img_resized.size, (255, 255, 255))
-            if img_resized.mode == 'P':
-                img_resized = img_resized.convert('RGBA')
-            if img_resized.mode in ('RGBA', 'LA'):
-                background.paste(img_resized, mask=img_resized.split()[-1])
-                img_resized = background
+        # Stream the download into a spooled buffer: typical posters stay in memory,
+        # multi-MB originals spill to a temp file rather than sitting in RAM as
+        # response bytes while being decoded
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as buffer:
+            # Release the connection back to the pool before decoding
+            with (session or _SESSION).get(poster_url, stream=True,
+                                           timeout=_DOWNLOAD_TIMEOUT) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    buffer.write(chunk)
+            buffer.seek(0)
+
+            # Open image with PIL
+            img = Image.open(buffer)
+
+            # Calculate new height maintaining aspect ratio
+            aspect_ratio = img.height / img.width
+            new_height = int(poster_width * aspect_ratio)
+
+            # JPEG only: let libjpeg decode at 1/2, 1/4 or 1/8 scale while staying at
+            # least twice the target size (the margin Image.thumbnail uses), so a
+            # 2000px original isn't fully decoded just to become 200px. No-op otherwise.
+            img.draft(None, (poster_width * 2, new_height * 2))
+
+            # Resize image, unless the server already sent it at the target size.
+            # reducing_gap box-reduces big non-JPEG sources (PNG covers) by an integer
+            # factor first, so LANCZOS only convolves the last <=3x step; Pillow rates
+            # a gap of 3 indistinguishable from a full LANCZOS pass
+            if img.size == (poster_width, new_height):
+                img_resized = img
             else:
+                img_resized = img.resize((poster_width, new_height), Image.Resampling.LANCZOS,
+                                         reducing_gap=_REDUCING_GAP)
+                # Free the full-size decode now rather than holding it through the
+                # RGB conversion and JPEG encode
+                img.close()
+
+            # Convert to RGB if needed (for JPEG)
+            if img_resized.mode in ('RGBA', 'LA', 'P'):
+                background = Image.new('RGB', img_resized.size, (255, 255, 255))
+                if img_resized.mode == 'P':
+                    img_resized = img_resized.convert('RGBA')
+                if img_resized.mode in ('RGBA', 'LA'):
+                    # getchannel() copies just the alpha band; split() would copy all of them
+                    background.paste(img_resized, mask=img_resized.getchannel('A'))
+                    img_resized = background
+                else:
+                    img_resized = img_resized.convert('RGB')
+            elif img_resized.mode != 'RGB':
                 img_resized = img_resized.convert('RGB')
-        elif img_resized.mode != 'RGB':
-            img_resized = img_resized.convert('RGB')
 
-        # Save as JPEG
-        img_resized.save(output_path, 'JPEG', quality=85, optimize=True)
+            # Encode in memory (a few KB at poster size) and write it in one atomic
+            # step, so a failed encode or write never leaves a truncated poster
+            encoded = io.BytesIO()
+            img_resized.save(encoded, 'JPEG', quality=85, optimize=True)
+
+        atomic_write(output_path, encoded.getvalue())
 
         return True
 
@@ -65,15 +145,16 @@ def download_and_resize_poster(
         return False
 
 
-def extract_yaml_frontmatter(content: str) -> Tuple[Optional[Dict], str]:
+def split_yaml_frontmatter(content: str) -> Tuple[Optional[str], str]:
     """
-    Extract YAML frontmatter and return it with the remaining content.
+    Split raw (unparsed) YAML frontmatter text from the rest of the content.
 
     Args:
         content: Full markdown file content
 
     Returns:
-        Tuple of (frontmatter_dict, remaining_content)
+        Tuple of (frontmatter_text, remaining_content); frontmatter_text is None
+        when the content has no frontmatter block
     """
     if not content.startswith('---'):
         return None, content
@@ -82,14 +163,196 @@ def extract_yaml_frontmatter(content: str) -> Tuple[Optional[Dict], str]:
     if len(parts) < 3:
         return None, content
 
+    return parts[1], parts[2]
+
+
+def extract_yaml_frontmatter(content: str) -> Tuple[Optional[Dict], str]:
+    """
+    Extract YAML frontmatter and return it with the remaining content.
+
+    Args:
+        content: Full markdown file content
+
+    Returns:
+        Tuple of (frontmatter_dict, remaining_content)
+    """
+    frontmatter_text, remaining_content = split_yaml_frontmatter(content)
+    if frontmatter_text is None:
+        return None, content
+
     try:
-        frontmatter = yaml.safe_load(parts[1])
-        remaining_content = parts[2]
+        frontmatter = yaml.load(frontmatter_text, Loader=YamlLoader)
         return frontmatter, remaining_content
     except yaml.YAMLError:
         return None, content
 
 
+# Frontmatter lines the fast scanner understands: 'key: value' / 'key:' at column 0,
+# and '- item' block-sequence entries under an empty key
+_FM_KEY_RE = re.compile(r'([A-Za-z0-9_][\w .-]*):(?: +(.*))?$')
+_FM_ITEM_RE = re.compile(r'( *)- +(.*)$')
+
+# First characters that make a plain YAML scalar something other than plain text
+_FM_INDICATORS = frozenset('[]{},#&*!|>\'"%@`')
+
+_YAML_RESOLVER = yaml.resolver.Resolver()
+_YAML_STR = 'tag:yaml.org,2002:str'
+
+_FALLBACK = object()  # sentinel: value needs the real YAML parser
+
+
+def _scan_scalar(text: str, require_str: bool):
+    """Value of a one-line quoted or plain scalar, or _FALLBACK for anything fancier."""
+    if not text:
+        return _FALLBACK
+    if len(text) >= 2 and text[0] == text[-1] == "'" and "'" not in text[1:-1]:
+        return text[1:-1]
+    if len(text) >= 2 and text[0] == text[-1] == '"' and not any(c in text[1:-1] for c in '"\\'):
+        return text[1:-1]
+    if (text[0] in _FM_INDICATORS or (text[0] in '-?:' and text[1:2] in ('', ' '))
+            or ' #' in text or ': ' in text or text.endswith(':') or '\t' in text):
+        return _FALLBACK
+    if require_str and _YAML_RESOLVER.resolve(yaml.ScalarNode, text, (True, False)) != _YAML_STR:
+        return _FALLBACK
+    return text
+
+
+def _scan_value(text: str, require_str: bool):
+    """Value of a one-line scalar or flat '[a, b]' flow sequence, or _FALLBACK."""
+    if text.startswith('[') and text.endswith(']'):
+        inner = text[1:-1].strip()
+        if not inner:
+            return []
+        if any(c in inner for c in '[]{}'):
+            return _FALLBACK
+        items = [item.strip() for item in inner.split(',')]
+        if items[-1] == '':
+            items.pop()  # YAML allows a trailing comma
+        values = [_scan_scalar(item, require_str) if item else _FALLBACK for item in items]
+        return _FALLBACK if _FALLBACK in values else values
+    return _scan_scalar(text, require_str)
+
+
+def scan_tags_and_poster(frontmatter_text: str) -> Optional[Dict]:
+    """
+    Read 'tags' and 'poster' from simple frontmatter without a YAML parse.
+
+    Handles the flat 'key: value' / '- item' layout the add command writes (and
+    most hand-written notes use). Returns None when any line is beyond that
+    subset (nested mappings, block scalars, anchors, non-string tags/poster,
+    ...), so the caller can fall back to the YAML loader and get identical results.
+    """
+    fields = {}
+    block_key = None     # key whose '- item' entries are being collected
+    block_indent = None
+    for line in frontmatter_text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+
+        item = _FM_ITEM_RE.match(line)
+        if item:
+            indent = len(item.group(1))
+            if block_key is None or block_indent not in (None, indent):
+                return None
+            block_indent = indent
+            value = _scan_scalar(item.group(2).rstrip(), block_key in ('tags', 'poster'))
+            if value is _FALLBACK:
+                return None
+            fields[block_key].append(value)
+            continue
+
+        key_line = _FM_KEY_RE.match(line)
+        if not key_line:
+            return None
+        if block_key is not None and not fields[block_key]:
+            fields[block_key] = None  # 'key:' with no '- item' entries is null
+        key = key_line.group(1).strip()
+        raw_value = (key_line.group(2) or '').rstrip()
+        block_key, block_indent = None, None
+        if not raw_value:
+            # Either an empty value or the start of a block sequence
+            block_key = key
+            fields[key] = []
+            continue
+        value = _scan_value(raw_value, key in ('tags', 'poster'))
+        if value is _FALLBACK:
+            return None
+        fields[key] = value
+
+    if block_key is not None and not fields[block_key]:
+        fields[block_key] = None
+    return {key: fields[key] for key in ('tags', 'poster') if key in fields}
+
+
+def _set_poster_line(frontmatter_text: str, poster: str) -> Optional[str]:
+    """
+    Set 'poster' by editing the frontmatter text, without a YAML round trip.
+
+    Only for frontmatter the fast scanner reads as a flat mapping with at most
+    one one-line 'poster' key. The poster line is replaced in place, or appended
+    like yaml.dump would append a new key; every other line is kept verbatim.
+    Returns None when the text needs the YAML path instead.
+    """
+    if (not frontmatter_text.startswith('\n') or not frontmatter_text.endswith('\n')
+            or '\r' in frontmatter_text
+            or scan_tags_and_poster(frontmatter_text) is None):
+        return None
+
+    poster_line = yaml.dump({'poster': poster}, Dumper=YamlDumper,
+                            default_flow_style=False).rstrip('\n')
+    lines = frontmatter_text.split('\n')
+    poster_lines = [
+        i for i, line in enumerate(lines)
+        if (key_line := _FM_KEY_RE.match(line)) and key_line.group(1).strip() == 'poster'
+    ]
+    if not poster_lines:
+        lines.insert(len(lines) - 1, poster_line)
+    elif len(poster_lines) == 1 and _FM_KEY_RE.match(lines[poster_lines[0]]).group(2):
+        lines[poster_lines[0]] = poster_line
+    else:
+        return None  # duplicate keys or a block-list poster
+    return '\n'.join(lines)
+
+
+def atomic_write(path: Path, data: Union[str, bytes]) -> None:
+    """
+    Replace a file's contents via a temp file in the same directory and os.replace().
+
+    A crash or full disk mid-write leaves the original file intact instead of
+    truncated. An existing file keeps its permission bits; a new one gets what a
+    plain open() would (0666 minus the umask), not mkstemp's 0600.
+
+    os.replace() swaps out whatever sits at the path, so a symlink is resolved
+    first (the link stays, its target is replaced) and a file with other hard
+    links is written in place instead, keeping every link pointing at the new
+    contents at the cost of atomicity.
+    """
+    path = Path(os.path.realpath(path))
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        st = None
+
+    file_mode, encoding = ('w', 'utf-8') if isinstance(data, str) else ('wb', None)
+
+    if st is not None and st.st_nlink > 1:
+        with open(path, file_mode, encoding=encoding) as f:
+            f.write(data)
+        return
+
+    mode = stat.S_IMODE(st.st_mode) if st is not None else 0o666 & ~_UMASK
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, file_mode, encoding=encoding) as f:
+            f.write(data)
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
 def update_frontmatter_with_poster(file_path: Path, poster_filename: str) -> bool:
     """
     Update the file's YAML frontmatter to include the poster wikilink.
@@ -101,27 +364,70 @@ def update_frontmatter_with_poster(file_path: Path, poster_filename: str) -> boo
     Returns:
         True if successful, False otherwise
     """
+    return _write_poster(file_path, poster_filename, embed=False)[0]
+
+
+def add_poster_to_note(file_path: Path, poster_filename: str) -> Tuple[bool, bool]:
+    """
+    Add the poster wikilink to the frontmatter and embed the poster (![[...]]) at
+    the start of the content, in one read/parse/write of the note.
+
+    A note whose content already starts with the embed is not embedded twice.
+
+    Args:
+        file_path: Path to markdown file
+        poster_filename: Name of poster file (e.g., 'Movie (2020).jpg')
+
+    Returns:
+        (updated, embedded): whether the note was updated successfully, and
+        whether the embed was added by this call
+    """
+    return _write_poster(file_path, poster_filename, embed=True)
+
+
+def _write_poster(file_path: Path, poster_filename: str, embed: bool) -> Tuple[bool, bool]:
+    """Set the poster wikilink, optionally embedding the poster; returns (updated, embedded)."""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        frontmatter, remaining_content = extract_yaml_frontmatter(content)
+        poster = f"[[{poster_filename}]]"
 
-        if frontmatter is None:
-            frontmatter = {}
+        # Simple frontmatter: edit the poster line in place, keeping the rest as written
+        frontmatter_text, remaining_content = split_yaml_frontmatter(content)
+        yaml_str = None
+        if frontmatter_text is not None:
+            edited = _set_poster_line(frontmatter_text, poster)
+            if edited is not None:
+                yaml_str = edited[1:]  # drop the newline after the opening '---'
 
-        # Add poster property with wikilink
-        frontmatter['poster'] = f"[[{poster_filename}]]"
+        if yaml_str is None:
+            frontmatter, remaining_content = extract_yaml_frontmatter(content)
 
-        # Reconstruct the file with updated frontmatter
-        yaml_str = yaml.dump(frontmatter, default_flow_style=False, sort_keys=False)
-        new_content = f"---\n{yaml_str}---{remaining_content}"
+            if frontmatter is None:
+                frontmatter = {}
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+            # Add poster property with wikilink
+            frontmatter['poster'] = poster
 
-        return True
+            # Reconstruct the file with updated frontmatter
+            yaml_str = yaml.dump(frontmatter, Dumper=YamlDumper,
+                                 default_flow_style=False, sort_keys=False)
+
+        remaining_stripped = remaining_content.lstrip('\n')
+        embedded = embed and not remaining_stripped.startswith(f"!{poster}")
+        if embedded:
+            # Format: ---\n{yaml}---\n\n![[poster.jpg]]\n\n{original content}
+            new_content = f"---\n{yaml_str}---\n\n!{poster}\n\n{remaining_stripped}"
+        else:
+            new_content = f"---\n{yaml_str}---{remaining_content}"
+
+        # Already up to date (e.g. a re-run): leave the file and its mtime alone
+        if new_content != content:
+            atomic_write(file_path, new_content)
+
+        return True, embedded
 
     except Exception as e:
         print(f"❌ Error updating frontmatter: {e}")
-        return False
+        return False, False
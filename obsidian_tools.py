@@ -11,8 +11,6 @@ import time
 from pathlib import Path
 from typing import Optional, Set
 
-import yaml
-
 from lib.api import MediaAPIFactory
 from lib.backup import create_vault_backup
 from lib.config import get_config_path, get_value, load_config, set_value
@@ -25,11 +23,7 @@ from lib.obsidian_utils import (
     prompt_unreleased_confirmation,
 )
 from lib.poster_downloader import PosterDownloader
-from lib.poster_utils import (
-    download_and_resize_poster,
-    extract_yaml_frontmatter,
-    update_frontmatter_with_poster,
-)
+from lib.poster_utils import add_poster_to_note, download_and_resize_poster
 
 
 def resolve_vault_path(cli_value: Optional[str]) -> Optional[Path]:
@@ -81,45 +75,6 @@ def read_titles_from_stdin() -> list[str]:
     return normalize_titles(lines)
 
 
-def embed_poster_in_content(file_path: Path, poster_filename: str) -> bool:
-    """
-    Embed poster image at the beginning of the file content.
-
-    Args:
-        file_path: Path to markdown file
-        poster_filename: Name of poster file (e.g., 'Movie (2020).jpg')
-
-    Returns:
-        True if successful, False otherwise
-    """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        frontmatter, remaining = extract_yaml_frontmatter(content)
-
-        if not frontmatter:
-            return False
-
-        # Build new content with embed
-        # Format: ---\n{yaml}---\n\n![[poster.jpg]]\n\n{original content}
-        yaml_str = yaml.dump(frontmatter, default_flow_style=False, sort_keys=False)
-
-        # Remove leading newlines from remaining to avoid extra spacing
-        remaining_stripped = remaining.lstrip('\n')
-
-        new_content = f"---\n{yaml_str}---\n\n![[{poster_filename}]]\n\n{remaining_stripped}"
-
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-
-        return True
-
-    except Exception as e:
-        print(f"❌ Error embedding poster: {e}")
-        return False
-
-
 def process_title(
     client,
     vault_path: Path,
@@ -235,13 +190,13 @@ def process_title(
 
         if download_and_resize_poster(poster_url, poster_file_path, poster_width):
             print(f"✓ Poster saved: {poster_filename}")
-            if update_frontmatter_with_poster(file_path, poster_filename):
+            # Add the wikilink and embed the poster at the beginning of the content
+            # in one rewrite of the note
+            updated, embedded = add_poster_to_note(file_path, poster_filename)
+            if updated:
                 print("✓ Frontmatter updated with poster wikilink")
-                # Embed the poster at the beginning of the content
-                if embed_poster_in_content(file_path, poster_filename):
+                if embedded:
                     print("✓ Poster embedded in content")
-                else:
-                    print("⚠️  Failed to embed poster in content")
             else:
                 print("⚠️  Failed to update frontmatter with poster")
         else:
@@ -401,7 +356,8 @@ def handle_posters_command(args):
     print(f"\n📋 Found {len(media_files)} file(s) to process")
     print("=" * 80)
 
-    # Process each file
+    # Process each file (TMDB searches are fetched concurrently up front)
+    downloader.prefetch_searches(media_files)
     processed_count = 0
     skipped_count = 0
 
@@ -1,23 +1,60 @@
 """Shared pytest fixtures for Obsidian Tools tests."""
 
+import json
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 from PIL import Image
 
+from lib.api.igdb_client import fetch_access_token
+from lib.api.musicbrainz_client import fetch_release
+from lib.obsidian_utils import translate_genre_tag
+from lib.poster_downloader import _frontmatter_fields, _parse_note
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def fixtures_dir():
     """Return path to test fixtures directory."""
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_responses_dir(fixtures_dir):
     """Return path to API response fixtures."""
     return fixtures_dir / "api_responses"
 
 
+def _freeze(obj):
+    """Recursively convert dicts to MappingProxyType and lists to tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
+
+@pytest.fixture(scope="session")
+def load_api_response(api_responses_dir):
+    """
+    Return a loader for read-only API response fixtures.
+
+    The parsed JSON is frozen (MappingProxyType/tuple) so it can be shared at
+    session scope without a per-test deepcopy: any accidental mutation raises
+    TypeError instead of leaking into other tests. Tests that need to mutate
+    should build their own dicts. Serialize with ``json.dumps(data, default=dict)``.
+
+    Pass ``freeze=False`` for payloads handed to code that type-checks for
+    ``dict`` (e.g. musicbrainzngs results); those must still be treated as
+    read-only by the tests sharing them.
+    """
+    def load(filename: str, freeze: bool = True):
+        # json.loads detects UTF-8 on bytes itself, skipping the text-mode decode layer
+        data = json.loads((api_responses_dir / filename).read_bytes())
+        return _freeze(data) if freeze else data
+    return load
+
+
 @pytest.fixture
 def images_dir(fixtures_dir):
     """Return path to test image fixtures."""
@@ -30,6 +67,40 @@ def markdown_dir(fixtures_dir):
     return fixtures_dir / "markdown"
 
 
+@pytest.fixture(autouse=True)
+def clear_igdb_token_cache():
+    """Reset the memoized IGDB OAuth token so each test sees its own mocks."""
+    fetch_access_token.cache_clear()
+    yield
+    fetch_access_token.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_musicbrainz_release_cache():
+    """Reset the memoized MusicBrainz releases so each test sees its own mocks."""
+    fetch_release.cache_clear()
+    yield
+    fetch_release.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_genre_tag_cache():
+    """Reset memoized genre translations so per-test mapping patches take effect."""
+    translate_genre_tag.cache_clear()
+    yield
+    translate_genre_tag.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_note_parse_cache():
+    """Reset the memoized note parses so tests never see another test's files."""
+    _parse_note.cache_clear()
+    _frontmatter_fields.cache_clear()
+    yield
+    _parse_note.cache_clear()
+    _frontmatter_fields.cache_clear()
+
+
 @pytest.fixture
 def mock_tmdb_api():
     """Mock TMDB API credentials."""
@@ -59,43 +59,6 @@ def test_read_titles_skips_empty_lines(monkeypatch):
     assert titles == ['Inception', 'The Matrix']
 
 
-# ============================================================================
-# Tests for embed_poster_in_content()
-# ============================================================================
-
-def test_embed_poster_in_content(tmp_path):
-    """Test embedding poster in markdown file."""
-    file = tmp_path / 'test.md'
-    file.write_text("""---
-title: Test Movie
-tags: [movie]
----
-
-## Description
-Test content here.
-""")
-
-    result = obsidian_tools.embed_poster_in_content(file, 'poster.jpg')
-
-    assert result is True
-
-    # Verify file content
-    content = file.read_text()
-    assert '![[poster.jpg]]' in content
-    # Poster should be after frontmatter but before original content
-    assert content.index('---\n\n![[poster.jpg]]') > 0
-
-
-def test_embed_poster_no_frontmatter(tmp_path):
-    """Test embedding poster fails without frontmatter."""
-    file = tmp_path / 'test.md'
-    file.write_text("# Just a heading\n\nSome content")
-
-    result = obsidian_tools.embed_poster_in_content(file, 'poster.jpg')
-
-    assert result is False
-
-
 # ============================================================================
 # Tests for argument parsing - 'add' command
 # ============================================================================
@@ -659,3 +622,32 @@ def test_add_command_uses_title_arguments(tmp_path, monkeypatch):
     # process_title(client, vault_path, title_input, media_type, poster_width)
     processed_titles = [call.args[2] for call in process.call_args_list]
     assert processed_titles == ['Dune', 'The Hobbit']  # de-duplicated, order preserved
+
+
+# ============================================================================
+# Tests for process_title() poster handling
+# ============================================================================
+
+
+@pytest.mark.parametrize('content, embed_reported', [
+    ('---\ntags: [book]\n---\n# Dune', True),
+    ('---\ntags: [book]\n---\n\n![[Dune.jpg]]\n\n# Dune', False),
+])
+def test_process_title_reports_embed_only_when_added(
+    tmp_path, monkeypatch, capsys, content, embed_reported
+):
+    """The embed message is printed only when the poster embed was actually added."""
+    client = Mock()
+    client.search.return_value = [{'id': 1, 'title': 'Dune'}]
+    client.get_filename.return_value = 'Dune.md'
+    client.format_note_content.return_value = content
+    monkeypatch.setattr(
+        obsidian_tools, 'download_and_resize_poster', lambda url, path, width: True
+    )
+
+    assert obsidian_tools.process_title(client, tmp_path, 'Dune', 'book') is True
+
+    out = capsys.readouterr().out
+    assert "✓ Frontmatter updated with poster wikilink" in out
+    assert ("✓ Poster embedded in content" in out) is embed_reported
+    assert (tmp_path / 'Dune.md').read_text().count('![[Dune.jpg]]') == 1
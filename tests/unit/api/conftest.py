@@ -0,0 +1,47 @@
+"""Fixtures shared by the API client unit tests."""
+
+import socket
+
+import pytest
+import responses
+
+from lib.api import googlebooks_client, igdb_client, musicbrainz_client, tmdb_client
+
+# Each client module imports get_user_input by name, so each binding is patched
+_PROMPTING_MODULES = (tmdb_client, igdb_client, musicbrainz_client, googlebooks_client)
+
+
+def _forbidden_socket(*args, **kwargs):
+    """Stand-in for socket.socket/getaddrinfo that refuses to touch the network."""
+    raise RuntimeError(
+        "Network access is disabled in API client unit tests; "
+        "mock the request with responses or mocker"
+    )
+
+
+@pytest.fixture(autouse=True)
+def block_network(monkeypatch):
+    """Fail fast if a test bypasses its mocks instead of hanging on DNS/connect."""
+    monkeypatch.setattr(socket, 'getaddrinfo', _forbidden_socket)
+    monkeypatch.setattr(socket, 'socket', _forbidden_socket)
+
+
+@pytest.fixture
+def mocked_responses():
+    """Active responses.RequestsMock; register mocks with mocked_responses.add(...)."""
+    with responses.RequestsMock() as rsps:
+        yield rsps
+
+
+@pytest.fixture(autouse=True)
+def fake_input(monkeypatch):
+    """
+    Replace every client's get_user_input with one FIFO of canned answers.
+
+    Autouse so no API client test can ever block on /dev/tty; tests that
+    prompt feed answers with ``fake_input.extend([...])``.
+    """
+    queue = []
+    for module in _PROMPTING_MODULES:
+        monkeypatch.setattr(module, 'get_user_input', lambda prompt: queue.pop(0))
+    return queue
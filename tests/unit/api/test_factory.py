@@ -1,11 +1,15 @@
 """Unit tests for lib/api/__init__.py (MediaAPIFactory)"""
 
+import json
 
 import pytest
 import responses
 
 from lib.api import GoogleBooksClient, IGDBClient, MediaAPIFactory, MusicBrainzClient, TMDBClient
 
+# Serialized once; the OAuth callback below replays these bytes verbatim.
+_OAUTH_TOKEN_BODY = json.dumps({'access_token': 'test_token'})
+
 # ============================================================================
 # Tests for MediaAPIFactory.create_client
 # ============================================================================
@@ -243,31 +247,32 @@ def test_googlebooks_client_properties(set_mock_env):
 def test_create_multiple_different_clients(set_mock_env):
     """Test creating multiple different client types."""
     # Mock OAuth token request
-    responses.add(
+    responses.add_callback(
         responses.POST,
         'https://id.twitch.tv/oauth2/token',
-        json={'access_token': 'test_token'},
-        status=200
+        callback=lambda request: (200, {}, _OAUTH_TOKEN_BODY),
+        content_type='application/json'
     )
 
-    movie_client = MediaAPIFactory.create_client('movie')
-    tv_client = MediaAPIFactory.create_client('tv')
-    game_client = MediaAPIFactory.create_client('game')
-    album_client = MediaAPIFactory.create_client('album')
-    book_client = MediaAPIFactory.create_client('book')
+    expected = [
+        ('movie', TMDBClient),
+        ('tv', TMDBClient),
+        ('game', IGDBClient),
+        ('game', IGDBClient),
+        ('album', MusicBrainzClient),
+        ('book', GoogleBooksClient),
+    ]
+    clients = [MediaAPIFactory.create_client(media_type) for media_type, _ in expected]
+
+    # The OAuth token is memoized per credential pair: one round-trip for both game clients
+    assert len(responses.calls) == 1
 
     # All should be different instances
-    assert movie_client is not tv_client
-    assert movie_client is not game_client
-    assert movie_client is not album_client
-    assert movie_client is not book_client
+    assert len({id(client) for client in clients}) == len(clients)
 
     # All should be correct types
-    assert isinstance(movie_client, TMDBClient)
-    assert isinstance(tv_client, TMDBClient)
-    assert isinstance(game_client, IGDBClient)
-    assert isinstance(album_client, MusicBrainzClient)
-    assert isinstance(book_client, GoogleBooksClient)
+    for (media_type, client_cls), client in zip(expected, clients):
+        assert isinstance(client, client_cls), media_type
 
 
 def test_create_same_type_multiple_times(set_mock_env):
@@ -21,16 +21,16 @@ def gb_client():
     return GoogleBooksClient('test_google_books_key')
 
 
-@pytest.fixture
-def book_search_payload(api_responses_dir):
-    with open(api_responses_dir / 'googlebooks_search.json') as f:
-        return json.load(f)
+@pytest.fixture(scope="session")
+def book_search_payload(load_api_response):
+    """Load Google Books search results from fixture (frozen, shared)."""
+    return load_api_response('googlebooks_search.json')
 
 
-@pytest.fixture
-def book_volume_payload(api_responses_dir):
-    with open(api_responses_dir / 'googlebooks_volume.json') as f:
-        return json.load(f)
+@pytest.fixture(scope="session")
+def book_volume_payload(load_api_response):
+    """Load a Google Books volume from fixture (frozen, shared)."""
+    return load_api_response('googlebooks_volume.json')
 
 
 # ============================================================================
@@ -39,7 +39,8 @@ def book_volume_payload(api_responses_dir):
 
 @responses.activate
 def test_search_success(gb_client, book_search_payload):
-    responses.add(responses.GET, SEARCH_URL, json=book_search_payload, status=200)
+    responses.add(responses.GET, SEARCH_URL, body=json.dumps(book_search_payload, default=dict),
+                  content_type='application/json', status=200)
 
     results = gb_client.search('Dune')
 
@@ -106,7 +107,8 @@ def test_get_details_reports_earliest_year_after_search(gb_client):
 
 @responses.activate
 def test_search_sends_api_key_and_intitle(gb_client, book_search_payload):
-    responses.add(responses.GET, SEARCH_URL, json=book_search_payload, status=200)
+    responses.add(responses.GET, SEARCH_URL, body=json.dumps(book_search_payload, default=dict),
+                  content_type='application/json', status=200)
 
     gb_client.search('Dune')
 
@@ -118,7 +120,8 @@ def test_search_sends_api_key_and_intitle(gb_client, book_search_payload):
 
 @responses.activate
 def test_search_cover_url_is_https_without_edge_curl(gb_client, book_search_payload):
-    responses.add(responses.GET, SEARCH_URL, json=book_search_payload, status=200)
+    responses.add(responses.GET, SEARCH_URL, body=json.dumps(book_search_payload, default=dict),
+                  content_type='application/json', status=200)
 
     results = gb_client.search('Dune')
 
@@ -229,7 +232,8 @@ def test_search_retries_transient_error_then_succeeds(gb_client, book_search_pay
     sleep = mocker.patch('lib.api.googlebooks_client.time.sleep')
     responses.add(responses.GET, SEARCH_URL, json={'error': 'unavailable'}, status=503)
     responses.add(responses.GET, SEARCH_URL, json={'error': 'unavailable'}, status=503)
-    responses.add(responses.GET, SEARCH_URL, json=book_search_payload, status=200)
+    responses.add(responses.GET, SEARCH_URL, body=json.dumps(book_search_payload, default=dict),
+                  content_type='application/json', status=200)
 
     results = gb_client.search('Dune')
 
@@ -258,7 +262,8 @@ def test_search_retries_exhausted_raises(gb_client, mocker):
 
 @responses.activate
 def test_get_details_success(gb_client, book_volume_payload):
-    responses.add(responses.GET, VOLUME_URL, json=book_volume_payload, status=200)
+    responses.add(responses.GET, VOLUME_URL, body=json.dumps(book_volume_payload, default=dict),
+                  content_type='application/json', status=200)
 
     details = gb_client.get_details('B1hSG45JCX4C')
 
@@ -358,7 +363,8 @@ def test_get_details_retries_transient_error_then_succeeds(gb_client, book_volum
     """get_details shares the retry helper, so it recovers from a transient 503."""
     mocker.patch('lib.api.googlebooks_client.time.sleep')
     responses.add(responses.GET, VOLUME_URL, json={'error': 'unavailable'}, status=503)
-    responses.add(responses.GET, VOLUME_URL, json=book_volume_payload, status=200)
+    responses.add(responses.GET, VOLUME_URL, body=json.dumps(book_volume_payload, default=dict),
+                  content_type='application/json', status=200)
 
     details = gb_client.get_details('B1hSG45JCX4C')
 
@@ -489,34 +495,31 @@ def test_get_poster_url_none(gb_client):
 # prompt_disambiguation()
 # ============================================================================
 
-def test_prompt_disambiguation_select(gb_client, mocker):
+def test_prompt_disambiguation_select(gb_client, fake_input):
     results = [
         {'title': 'Dune', 'author': 'Frank Herbert', 'first_publish_year': 1965},
         {'title': 'Dune Messiah', 'author': 'Frank Herbert', 'first_publish_year': 1969},
     ]
 
-    inputs = iter(['2'])
-    mocker.patch('lib.api.googlebooks_client.get_user_input', lambda prompt: next(inputs))
+    fake_input.extend(['2'])
 
     selected = gb_client.prompt_disambiguation('Dune', results)
 
     assert selected['title'] == 'Dune Messiah'
 
 
-def test_prompt_disambiguation_skip(gb_client, mocker):
+def test_prompt_disambiguation_skip(gb_client, fake_input):
     results = [{'title': 'Dune', 'author': 'Frank Herbert', 'first_publish_year': 1965}]
 
-    inputs = iter(['0'])
-    mocker.patch('lib.api.googlebooks_client.get_user_input', lambda prompt: next(inputs))
+    fake_input.extend(['0'])
 
     assert gb_client.prompt_disambiguation('Dune', results) is None
 
 
-def test_prompt_disambiguation_invalid_then_valid(gb_client, mocker, capsys):
+def test_prompt_disambiguation_invalid_then_valid(gb_client, fake_input, capsys):
     results = [{'title': 'Dune', 'author': 'Frank Herbert', 'first_publish_year': 1965}]
 
-    inputs = iter(['99', 'abc', '1'])
-    mocker.patch('lib.api.googlebooks_client.get_user_input', lambda prompt: next(inputs))
+    fake_input.extend(['99', 'abc', '1'])
 
     selected = gb_client.prompt_disambiguation('Dune', results)
 
@@ -526,11 +529,10 @@ def test_prompt_disambiguation_invalid_then_valid(gb_client, mocker, capsys):
     assert 'valid number' in captured.out
 
 
-def test_prompt_disambiguation_displays_tbd_for_missing_year(gb_client, mocker, capsys):
+def test_prompt_disambiguation_displays_tbd_for_missing_year(gb_client, fake_input, capsys):
     results = [{'title': 'Future Book', 'author': 'A', 'first_publish_year': None}]
 
-    inputs = iter(['1'])
-    mocker.patch('lib.api.googlebooks_client.get_user_input', lambda prompt: next(inputs))
+    fake_input.extend(['1'])
 
     gb_client.prompt_disambiguation('Future Book', results)
 
@@ -1,6 +1,7 @@
 """Unit tests for lib/api/igdb_client.py"""
 
 import json
+import re
 
 import pytest
 import responses
@@ -8,17 +9,32 @@ from freezegun import freeze_time
 
 from lib.api.igdb_client import IGDBClient
 
+pytestmark = pytest.mark.mocked_net
+
+# Expected Apicalypse query shapes, compiled once. Matching them in order also
+# catches regressions that drop or reorder clauses in the query builders.
+_SEARCH_QUERY_RE = re.compile(
+    r'search "Test Game";.*'
+    r'fields name, first_release_date, summary, url, involved_companies, cover\.image_id;.*'
+    r'limit 25;',
+    re.DOTALL,
+)
+_DETAILS_FIELDS_RE = re.compile(
+    r'involved_companies\.company\.name.*involved_companies\.developer.*'
+    r'involved_companies\.publisher.*game_modes\.name.*genres\.name',
+    re.DOTALL,
+)
+
 # ============================================================================
 # Test Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def igdb_client(api_responses_dir):
-    """Create an IGDB client with mocked OAuth."""
+    """Create an IGDB client with mocked OAuth (shared across the module)."""
     with responses.RequestsMock() as rsps:
         # Mock OAuth token request
-        with open(api_responses_dir / 'igdb_oauth_token.json') as f:
-            token_response = json.load(f)
+        token_response = json.loads((api_responses_dir / 'igdb_oauth_token.json').read_bytes())
 
         rsps.add(
             responses.POST,
@@ -31,29 +47,39 @@ def igdb_client(api_responses_dir):
         return client
 
 
-@pytest.fixture
-def game_search_results(api_responses_dir):
-    """Load game search results from fixture."""
-    with open(api_responses_dir / 'igdb_game_search.json') as f:
-        return json.load(f)
+@pytest.fixture(scope="session")
+def game_search_results(load_api_response):
+    """Load game search results from fixture (frozen, shared)."""
+    return load_api_response('igdb_game_search.json')
+
+
+@pytest.fixture(scope="session")
+def game_details(load_api_response):
+    """Load game details from fixture (frozen, shared)."""
+    return load_api_response('igdb_game_details.json')
+
+
+@pytest.fixture(scope="session")
+def game_search_results_bytes(api_responses_dir):
+    """Raw game search payload, as IGDBWrapper.api_request returns it."""
+    return (api_responses_dir / 'igdb_game_search.json').read_bytes()
 
 
-@pytest.fixture
-def game_details(api_responses_dir):
-    """Load game details from fixture."""
-    with open(api_responses_dir / 'igdb_game_details.json') as f:
-        return json.load(f)
+@pytest.fixture(scope="session")
+def game_details_bytes(api_responses_dir):
+    """Raw game details payload, as IGDBWrapper.api_request returns it."""
+    return (api_responses_dir / 'igdb_game_details.json').read_bytes()
 
 
 # ============================================================================
 # Tests for __init__ and OAuth2
 # ============================================================================
 
+@pytest.mark.local_only
 @responses.activate
 def test_igdb_client_init_success(api_responses_dir):
     """Test IGDB client initialization with successful OAuth."""
-    with open(api_responses_dir / 'igdb_oauth_token.json') as f:
-        token_response = json.load(f)
+    token_response = json.loads((api_responses_dir / 'igdb_oauth_token.json').read_bytes())
 
     responses.add(
         responses.POST,
@@ -69,6 +95,7 @@ def test_igdb_client_init_success(api_responses_dir):
     assert hasattr(client, 'wrapper')
 
 
+@pytest.mark.local_only
 @responses.activate
 def test_igdb_client_oauth_request_parameters():
     """Test that OAuth request includes correct parameters."""
@@ -89,6 +116,7 @@ def test_igdb_client_oauth_request_parameters():
     assert 'grant_type=client_credentials' in request_url
 
 
+@pytest.mark.local_only
 @responses.activate
 def test_igdb_client_oauth_failure():
     """Test IGDB client initialization with OAuth failure."""
@@ -102,11 +130,11 @@ def test_igdb_client_oauth_failure():
         IGDBClient('invalid_id', 'invalid_secret')
 
 
+@pytest.mark.local_only
 @responses.activate
 def test_get_access_token_returns_token(api_responses_dir):
     """Test that access token is extracted from OAuth response."""
-    with open(api_responses_dir / 'igdb_oauth_token.json') as f:
-        token_response = json.load(f)
+    token_response = json.loads((api_responses_dir / 'igdb_oauth_token.json').read_bytes())
 
     responses.add(
         responses.POST,
@@ -121,17 +149,36 @@ def test_get_access_token_returns_token(api_responses_dir):
     assert client.wrapper is not None
 
 
+@pytest.mark.local_only
+@responses.activate
+def test_access_token_cached_per_credentials():
+    """Test that the OAuth token is fetched once per (client_id, client_secret)."""
+    responses.add(
+        responses.POST,
+        'https://id.twitch.tv/oauth2/token',
+        json={'access_token': 'test_token'},
+        status=200
+    )
+
+    IGDBClient('test_id', 'test_secret')
+    IGDBClient('test_id', 'test_secret')
+    assert len(responses.calls) == 1
+
+    IGDBClient('other_id', 'other_secret')
+    assert len(responses.calls) == 2
+
+
 # ============================================================================
 # Tests for search()
 # ============================================================================
 
-def test_search_success(igdb_client, game_search_results, mocker):
+def test_search_success(igdb_client, game_search_results_bytes, mocker):
     """Test successful game search."""
     # Mock the IGDB wrapper api_request
     mock_api_request = mocker.patch.object(
         igdb_client.wrapper,
         'api_request',
-        return_value=json.dumps(game_search_results).encode('utf-8')
+        return_value=game_search_results_bytes
     )
 
     results = igdb_client.search('Elden Ring')
@@ -188,21 +235,19 @@ def test_search_query_format(igdb_client, mocker):
     query = call_args[1]
 
     # Verify query format
-    assert 'search "Test Game"' in query
-    assert 'fields name, first_release_date, summary, url, involved_companies, cover.image_id' in query
-    assert 'limit 25' in query
+    assert _SEARCH_QUERY_RE.search(query)
 
 
 # ============================================================================
 # Tests for get_details()
 # ============================================================================
 
-def test_get_details_success(igdb_client, game_details, mocker):
+def test_get_details_success(igdb_client, game_details_bytes, mocker):
     """Test getting game details."""
     mock_api_request = mocker.patch.object(
         igdb_client.wrapper,
         'api_request',
-        return_value=json.dumps(game_details).encode('utf-8')
+        return_value=game_details_bytes
     )
 
     details = igdb_client.get_details('119277')
@@ -215,6 +260,7 @@ def test_get_details_success(igdb_client, game_details, mocker):
     # Verify query
     call_args = mock_api_request.call_args[0]
     query = call_args[1]
+    assert _DETAILS_FIELDS_RE.search(query)
     assert 'where id = 119277' in query
 
 
@@ -258,11 +304,7 @@ def test_get_details_includes_expanded_fields(igdb_client, mocker):
     query = call_args[1]
 
     # Verify expanded fields
-    assert 'involved_companies.company.name' in query
-    assert 'involved_companies.developer' in query
-    assert 'involved_companies.publisher' in query
-    assert 'game_modes.name' in query
-    assert 'genres.name' in query
+    assert _DETAILS_FIELDS_RE.search(query)
 
 
 # ============================================================================
@@ -270,15 +312,14 @@ def test_get_details_includes_expanded_fields(igdb_client, mocker):
 # ============================================================================
 
 @freeze_time("2024-01-15 12:00:00", tz_offset=0)
-def test_prompt_disambiguation_timestamp_utc(igdb_client, mocker, capsys):
+def test_prompt_disambiguation_timestamp_utc(igdb_client, fake_input, capsys):
     """Test that timestamps are converted using UTC timezone."""
     # Timestamp for 2022-02-25 00:00:00 UTC (Elden Ring release)
     results = [
         {'name': 'Elden Ring', 'first_release_date': 1645747200, 'summary': 'Test'}
     ]
 
-    inputs = iter(['1'])
-    mocker.patch('lib.api.igdb_client.get_user_input', lambda prompt: next(inputs))
+    fake_input.extend(['1'])
 
     igdb_client.prompt_disambiguation('Elden Ring', results)
 
@@ -304,15 +345,14 @@ def test_get_filename_timestamp_utc(igdb_client):
 # Tests for unreleased games (TBD)
 # ============================================================================
 
-def test_prompt_disambiguation_unreleased_game(igdb_client, mocker, capsys):
+def test_prompt_disambiguation_unreleased_game(igdb_client, fake_input, capsys):
     """Test that unreleased games show TBD for year."""
     results = [
         {'name': 'Unreleased Game', 'summary': 'Coming soon'}
         # No first_release_date
     ]
 
-    inputs = iter(['1'])
-    mocker.patch('lib.api.igdb_client.get_user_input', lambda prompt: next(inputs))
+    fake_input.extend(['1'])
 
     igdb_client.prompt_disambiguation('Test', results)
 
@@ -559,10 +599,9 @@ def test_get_poster_url_uses_cover_big(igdb_client):
 # Tests for prompt_disambiguation()
 # ============================================================================
 
-def test_prompt_disambiguation_select_first(igdb_client, game_search_results, mocker):
+def test_prompt_disambiguation_select_first(igdb_client, game_search_results, fake_input):
     """Test disambiguating and selecting first result."""
-    inputs = iter(['1'])
-    mocker.patch('lib.api.igdb_client.get_user_input', lambda prompt: next(inputs))
+    fake_input.extend(['1'])
 
     result = igdb_client.prompt_disambiguation('Elden Ring', game_search_results)
 
@@ -570,20 +609,18 @@ def test_prompt_disambiguation_select_first(igdb_client, game_search_results, mo
     assert result['name'] == 'Elden Ring'
 
 
-def test_prompt_disambiguation_skip(igdb_client, game_search_results, mocker):
+def test_prompt_disambiguation_skip(igdb_client, game_search_results, fake_input):
     """Test disambiguating and skipping."""
-    inputs = iter(['0'])
-    mocker.patch('lib.api.igdb_client.get_user_input', lambda prompt: next(inputs))
+    fake_input.extend(['0'])
 
     result = igdb_client.prompt_disambiguation('Elden Ring', game_search_results)
 
     assert result is None
 
 
-def test_prompt_disambiguation_invalid_then_valid(igdb_client, game_search_results, mocker, capsys):
+def test_prompt_disambiguation_invalid_then_valid(igdb_client, game_search_results, fake_input, capsys):
     """Test handling invalid input then valid selection."""
-    inputs = iter(['99', '1'])
-    mocker.patch('lib.api.igdb_client.get_user_input', lambda prompt: next(inputs))
+    fake_input.extend(['99', '1'])
 
     result = igdb_client.prompt_disambiguation('Elden Ring', game_search_results)
 
@@ -592,10 +629,9 @@ def test_prompt_disambiguation_invalid_then_valid(igdb_client, game_search_resul
     assert 'between 0 and 2' in captured.out
 
 
-def test_prompt_disambiguation_displays_game_label(igdb_client, game_search_results, mocker, capsys):
+def test_prompt_disambiguation_displays_game_label(igdb_client, game_search_results, fake_input, capsys):
     """Test that disambiguation displays [GAME] label."""
-    inputs = iter(['1'])
-    mocker.patch('lib.api.igdb_client.get_user_input', lambda prompt: next(inputs))
+    fake_input.extend(['1'])
 
     igdb_client.prompt_disambiguation('Elden Ring', game_search_results)
 
@@ -1,33 +1,45 @@
 """Unit tests for lib/api/musicbrainz_client.py"""
 
-import json
+import copy
+import io
+import threading
+import time
 
+import musicbrainzngs
 import pytest
 
-from lib.api.musicbrainz_client import MusicBrainzClient
+from lib.api.musicbrainz_client import _RELEASE_INCLUDES, MusicBrainzClient, _fetch_release_once
+
+pytestmark = pytest.mark.mocked_net
 
 # ============================================================================
 # Test Fixtures
 # ============================================================================
 
-@pytest.fixture
-def mb_client():
-    """Create a MusicBrainz client."""
+@pytest.fixture(scope="session")
+def _mb_client_template():
+    """Build the client (and set the user agent) once; tests get shallow copies."""
     return MusicBrainzClient()
 
 
 @pytest.fixture
-def album_search_results(api_responses_dir):
-    """Load album search results from fixture."""
-    with open(api_responses_dir / 'musicbrainz_album_search.json') as f:
-        return json.load(f)
+def mb_client(_mb_client_template):
+    """Create a MusicBrainz client with its own release-group map."""
+    client = copy.copy(_mb_client_template)
+    client._release_groups = {}
+    return client
 
 
-@pytest.fixture
-def album_details(api_responses_dir):
-    """Load album details from fixture."""
-    with open(api_responses_dir / 'musicbrainz_album_details.json') as f:
-        return json.load(f)
+@pytest.fixture(scope="session")
+def album_search_results(load_api_response):
+    """Load album search results from fixture (shared; the client checks isinstance(dict))."""
+    return load_api_response('musicbrainz_album_search.json', freeze=False)
+
+
+@pytest.fixture(scope="session")
+def album_details(load_api_response):
+    """Load album details from fixture (shared; the client checks isinstance(dict))."""
+    return load_api_response('musicbrainz_album_details.json', freeze=False)
 
 
 # ============================================================================
@@ -40,6 +52,13 @@ def test_mb_client_init(mb_client, mocker):
     assert mb_client is not None
 
 
+def test_mb_client_fixture_has_own_release_groups(mb_client, _mb_client_template):
+    """Test release-group mappings recorded in one test can't leak into another."""
+    mb_client._release_groups['release'] = 'group'
+
+    assert _mb_client_template._release_groups == {}
+
+
 def test_mb_client_sets_user_agent(mocker):
     """Test that client sets user agent on initialization."""
     mock_set_useragent = mocker.patch('musicbrainzngs.set_useragent')
@@ -95,8 +114,6 @@ def test_search_no_results(mb_client, mocker):
 
 def test_search_api_error(mb_client, mocker):
     """Test search with API error."""
-    import musicbrainzngs
-
     mocker.patch(
         'musicbrainzngs.search_releases',
         side_effect=musicbrainzngs.WebServiceError('API error')
@@ -199,175 +216,216 @@ def test_search_date_formats(mb_client, mocker, date_input):
 # Tests for get_details()
 # ============================================================================
 
-def test_get_details_success(mb_client, album_details, mocker):
-    """Test getting album details."""
-    mocker.patch(
-        'musicbrainzngs.get_release_by_id',
-        return_value=album_details
-    )
-
-    details = mb_client.get_details('a3b7f0e5-7e7d-4e4f-8e5c-1a2b3c4d5e6f')
-
-    assert details['id'] == 'a3b7f0e5-7e7d-4e4f-8e5c-1a2b3c4d5e6f'
-    assert details['title'] == 'Abbey Road'
-    assert details['artist'] == 'The Beatles'
-    assert details['date'] == '1969-09-26'
-    assert details['label'] == 'Apple Records'
-
-
-def test_get_details_includes_expanded_info(mb_client, mocker):
-    """Test that get_details requests expanded information."""
-    mock_get = mocker.patch(
-        'musicbrainzngs.get_release_by_id',
-        return_value={'release': {'id': 'test', 'title': 'Test'}}
-    )
-
-    mb_client.get_details('test-id')
-
-    # Verify includes parameter
-    mock_get.assert_called_once_with(
-        'test-id',
-        includes=['artists', 'labels', 'release-groups', 'tags']
-    )
-
+# Minimal release payload; each FIELD_CASES entry below overrides a field or two.
+BASE_RELEASE = {
+    'id': 'test-id',
+    'title': 'Test Album',
+    'artist-credit': [{'artist': {'name': 'Test Artist'}}],
+    'date': '2020-01-01',
+}
+
+FIELD_CASES = [
+    pytest.param(
+        {'label-info-list': [], 'release-group': {}},
+        {'label': 'Independent'},
+        id='no_label',
+    ),
+    pytest.param(
+        {'release-group': {'tag-list': [
+            {'name': 'rock', 'count': 10},
+            {'name': 'pop', 'count': 8},
+            {'name': 'obscure', 'count': 2},  # Filtered out (count <= 5)
+            {'name': 'unpopular', 'count': 1},  # Filtered out (count <= 5)
+        ]}},
+        {'tags': ['rock', 'pop']},
+        id='tags_filtered_by_vote_count',
+    ),
+    pytest.param(
+        {'release-group': {'tag-list': [
+            {'name': 'least', 'count': 6},
+            {'name': 'most', 'count': 20},
+            {'name': 'middle', 'count': 10},
+        ]}},
+        {'tags': ['most', 'middle', 'least']},
+        id='tags_sorted_by_vote_count',
+    ),
+    pytest.param(
+        {'release-group': {'tag-list': [{'name': f'tag{i}', 'count': 10} for i in range(10)]}},
+        {'tags': [f'tag{i}' for i in range(5)]},
+        id='max_five_tags',
+    ),
+    pytest.param(
+        {'title': 'Live Album', 'release-group': {
+            'primary-type': 'Album',
+            'secondary-type-list': ['Live', 'Compilation'],
+        }},
+        {'primary_type': 'Album', 'secondary_types': ['Live', 'Compilation']},
+        id='secondary_types',
+    ),
+]
+
+
+class TestGetDetails:
+    """get_details()/get_details_batch() against one class-wide patch of the release API."""
+
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def _patch_release_api(cls, class_mocker):
+        """Patch musicbrainzngs once for the class instead of once per test."""
+        cls.mock_get = class_mocker.patch('musicbrainzngs.get_release_by_id')
+        cls.mock_browse = class_mocker.patch('musicbrainzngs.browse_releases')
+
+    @pytest.fixture(autouse=True)
+    def _reset_release_api(self):
+        """Give each test clean mocks: no calls, no configured return/side effect."""
+        self.mock_get.reset_mock(return_value=True, side_effect=True)
+        self.mock_browse.reset_mock(return_value=True, side_effect=True)
+
+    def test_get_details_success(self, mb_client, album_details):
+        """Test getting album details."""
+        self.mock_get.return_value = album_details
+
+        details = mb_client.get_details('a3b7f0e5-7e7d-4e4f-8e5c-1a2b3c4d5e6f')
+
+        assert details['id'] == 'a3b7f0e5-7e7d-4e4f-8e5c-1a2b3c4d5e6f'
+        assert details['title'] == 'Abbey Road'
+        assert details['artist'] == 'The Beatles'
+        assert details['date'] == '1969-09-26'
+        assert details['label'] == 'Apple Records'
+
+    def test_get_details_includes_expanded_info(self, mb_client):
+        """Test that get_details requests expanded information."""
+        self.mock_get.return_value = {'release': {'id': 'test', 'title': 'Test'}}
 
-def test_get_details_api_error(mb_client, mocker):
-    """Test get_details with API error."""
-    import musicbrainzngs
-
-    mocker.patch(
-        'musicbrainzngs.get_release_by_id',
-        side_effect=musicbrainzngs.WebServiceError('API error')
-    )
-
-    with pytest.raises(Exception) as excinfo:
         mb_client.get_details('test-id')
 
-    assert 'MusicBrainz API error' in str(excinfo.value)
-
-
-def test_get_details_no_label(mb_client, mocker):
-    """Test details with no label information."""
-    mock_result = {
-        'release': {
-            'id': 'test-id',
-            'title': 'Test Album',
-            'artist-credit': [{'artist': {'name': 'Test Artist'}}],
-            'date': '2020-01-01',
-            'label-info-list': [],
-            'release-group': {}
+        # Verify includes parameter (the shared module-level list, not a per-call literal)
+        self.mock_get.assert_called_once_with(
+            'test-id',
+            includes=['artists', 'labels', 'release-groups', 'tags']
+        )
+        assert self.mock_get.call_args.kwargs['includes'] is _RELEASE_INCLUDES
+
+    def test_get_details_cached_by_mbid(self, mb_client, album_details):
+        """Test that repeated get_details calls for one MBID fetch the release once."""
+        self.mock_get.return_value = album_details
+
+        first = mb_client.get_details('a3b7f0e5-7e7d-4e4f-8e5c-1a2b3c4d5e6f')
+        second = MusicBrainzClient().get_details('a3b7f0e5-7e7d-4e4f-8e5c-1a2b3c4d5e6f')
+        mb_client.get_details('other-mbid')
+
+        assert first == second
+        assert first is not second
+        assert self.mock_get.call_count == 2
+
+    def test_concurrent_fetches_share_one_request(self, album_details):
+        """Test that racing lookups of one MBID issue a single get_release_by_id call."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_release(*args, **kwargs):
+            started.set()
+            release.wait(timeout=5)
+            return album_details
+
+        self.mock_get.side_effect = slow_release
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(_fetch_release_once('mbid')))
+                   for _ in range(3)]
+
+        threads[0].start()
+        started.wait(timeout=5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert self.mock_get.call_count == 1
+        assert len(results) == 3
+        assert all(result is album_details for result in results)
+
+    def test_get_details_batch(self, mb_client, mocker):
+        """Test that releases sharing a release-group are resolved with one browse call."""
+        release_group = {
+            'id': 'rg-1',
+            'primary-type': 'Album',
+            'secondary-type-list': ['Live'],
+            'tag-list': [{'name': 'rock', 'count': '10'}],
         }
-    }
-
-    mocker.patch('musicbrainzngs.get_release_by_id', return_value=mock_result)
-
-    details = mb_client.get_details('test-id')
-
-    assert details['label'] == 'Independent'
-
-
-def test_get_details_tags_filtered_by_vote_count(mb_client, mocker):
-    """Test that tags are filtered by vote count > 5."""
-    mock_result = {
-        'release': {
-            'id': 'test-id',
-            'title': 'Test Album',
-            'artist-credit': [{'artist': {'name': 'Test Artist'}}],
-            'date': '2020-01-01',
-            'release-group': {
-                'tag-list': [
-                    {'name': 'rock', 'count': 10},
-                    {'name': 'pop', 'count': 8},
-                    {'name': 'obscure', 'count': 2},  # Should be filtered out
-                    {'name': 'unpopular', 'count': 1},  # Should be filtered out
-                ]
+        self.mock_get.return_value = {
+            'release': {
+                'id': 'mbid-1',
+                'title': 'Live Album',
+                'date': '2001',
+                'artist-credit': [{'artist': {'name': 'Band'}}],
+                'release-group': release_group,
             }
         }
-    }
-
-    mocker.patch('musicbrainzngs.get_release_by_id', return_value=mock_result)
-
-    details = mb_client.get_details('test-id')
-
-    # Only tags with count > 5 should be included
-    assert 'rock' in details['tags']
-    assert 'pop' in details['tags']
-    assert 'obscure' not in details['tags']
-    assert 'unpopular' not in details['tags']
-
-
-def test_get_details_tags_sorted_by_vote_count(mb_client, mocker):
-    """Test that tags are sorted by vote count."""
-    mock_result = {
-        'release': {
-            'id': 'test-id',
-            'title': 'Test Album',
-            'artist-credit': [{'artist': {'name': 'Test Artist'}}],
-            'date': '2020-01-01',
-            'release-group': {
-                'tag-list': [
-                    {'name': 'least', 'count': 6},
-                    {'name': 'most', 'count': 20},
-                    {'name': 'middle', 'count': 10},
-                ]
-            }
+        self.mock_browse.return_value = {
+            'release-list': [
+                {'id': 'mbid-1', 'title': 'Live Album'},
+                {'id': 'mbid-2', 'title': 'Live Album', 'date': '2002',
+                 'artist-credit': [{'artist': {'name': 'Band'}}],
+                 'label-info-list': [{'label': {'name': 'Reissue Records'}}]},
+                {'id': 'mbid-unrequested', 'title': 'Live Album'},
+            ]
         }
-    }
 
-    mocker.patch('musicbrainzngs.get_release_by_id', return_value=mock_result)
+        # search() is where the client learns that mbid-2 shares mbid-1's group
+        mocker.patch('musicbrainzngs.search_releases', return_value={'release-list': [
+            {'id': 'mbid-1', 'title': 'Live Album', 'release-group': {'id': 'rg-1'}},
+            {'id': 'mbid-2', 'title': 'Live Album', 'release-group': {'id': 'rg-1'}},
+        ]})
+        mb_client.search('Live Album')
 
-    details = mb_client.get_details('test-id')
+        details = mb_client.get_details_batch(['mbid-1', 'mbid-2', 'mbid-1'])
 
-    # Tags should be sorted by count descending
-    assert details['tags'][0] == 'most'
-    assert details['tags'][1] == 'middle'
-    assert details['tags'][2] == 'least'
+        assert list(details) == ['mbid-1', 'mbid-2']
+        assert self.mock_get.call_count == 1
+        self.mock_browse.assert_called_once()
+        assert self.mock_browse.call_args.kwargs['release_group'] == 'rg-1'
+        assert details['mbid-2']['date'] == '2002'
+        assert details['mbid-2']['label'] == 'Reissue Records'
+        assert details['mbid-2']['secondary_types'] == ['Live']
+        assert details['mbid-2']['tags'] == ['rock']
 
+    def test_get_details_batch_unrelated_releases_skip_browse(self, mb_client, mocker):
+        """Test that MBIDs with no known shared release-group are never browsed."""
+        mocker.patch('musicbrainzngs.search_releases', return_value={'release-list': [
+            {'id': 'mbid-1', 'title': 'One', 'release-group': {'id': 'rg-1'}},
+            {'id': 'mbid-2', 'title': 'Two', 'release-group': {'id': 'rg-2'}},
+        ]})
+        mb_client.search('Album')
+        self.mock_get.side_effect = lambda mbid, includes: {'release': {
+            'id': mbid, 'title': mbid, 'release-group': {'id': f'rg-{mbid[-1]}'}
+        }}
 
-def test_get_details_max_five_tags(mb_client, mocker):
-    """Test that maximum 5 tags are returned."""
-    mock_result = {
-        'release': {
-            'id': 'test-id',
-            'title': 'Test Album',
-            'artist-credit': [{'artist': {'name': 'Test Artist'}}],
-            'date': '2020-01-01',
-            'release-group': {
-                'tag-list': [
-                    {'name': f'tag{i}', 'count': 10} for i in range(10)
-                ]
-            }
-        }
-    }
+        details = mb_client.get_details_batch(['mbid-1', 'mbid-2', 'mbid-3'])
 
-    mocker.patch('musicbrainzngs.get_release_by_id', return_value=mock_result)
+        assert list(details) == ['mbid-1', 'mbid-2', 'mbid-3']
+        assert self.mock_get.call_count == 3
+        self.mock_browse.assert_not_called()
 
-    details = mb_client.get_details('test-id')
+    def test_get_details_api_error(self, mb_client):
+        """Test get_details with API error."""
+        self.mock_get.side_effect = musicbrainzngs.WebServiceError('API error')
 
-    assert len(details['tags']) == 5
+        with pytest.raises(Exception) as excinfo:
+            mb_client.get_details('test-id')
 
+        assert 'MusicBrainz API error' in str(excinfo.value)
 
-def test_get_details_secondary_types(mb_client, mocker):
-    """Test that secondary types are included."""
-    mock_result = {
-        'release': {
-            'id': 'test-id',
-            'title': 'Live Album',
-            'artist-credit': [{'artist': {'name': 'Test Artist'}}],
-            'date': '2020-01-01',
-            'release-group': {
-                'primary-type': 'Album',
-                'secondary-type-list': ['Live', 'Compilation']
-            }
-        }
-    }
-
-    mocker.patch('musicbrainzngs.get_release_by_id', return_value=mock_result)
+    @pytest.mark.parametrize("overrides, expected", FIELD_CASES)
+    def test_get_details_fields(self, mb_client, overrides, expected):
+        """Test label fallback, tag filtering/sorting/limit, and release-group types."""
+        self.mock_get.return_value = {'release': {**BASE_RELEASE, **overrides}}
 
-    details = mb_client.get_details('test-id')
+        details = mb_client.get_details('test-id')
 
-    assert details['primary_type'] == 'Album'
-    assert details['secondary_types'] == ['Live', 'Compilation']
+        for key, value in expected.items():
+            assert details[key] == value
 
 
 # ============================================================================
@@ -481,6 +539,7 @@ def test_get_filename(mb_client):
     ("1969-09", "1969"),     # Month precision
     ("1969", "1969"),        # Year only
     ("", "TBD"),             # No date
+    (None, "TBD"),           # Explicit null date
 ])
 def test_get_filename_date_formats(mb_client, date_input, expected_year):
     """Test filename with various date formats."""
@@ -525,41 +584,25 @@ def test_get_filename_multiple_artists(mb_client):
 # Tests for get_poster_url()
 # ============================================================================
 
-def test_get_poster_url(mb_client):
-    """Test getting poster URL for album."""
-    details = {
-        'id': 'a3b7f0e5-7e7d-4e4f-8e5c-1a2b3c4d5e6f',
-        'title': 'Abbey Road'
-    }
-
-    url = mb_client.get_poster_url(details)
-
-    assert url == 'https://coverartarchive.org/release/a3b7f0e5-7e7d-4e4f-8e5c-1a2b3c4d5e6f/front'
-
-
-def test_get_poster_url_missing_id(mb_client):
-    """Test getting poster URL when MBID is missing."""
-    details = {'title': 'No ID'}
-
-    url = mb_client.get_poster_url(details)
-
-    assert url is None
-
-
-def test_get_poster_url_none_id(mb_client):
-    """Test getting poster URL when MBID is None."""
-    details = {'id': None, 'title': 'No ID'}
-
-    url = mb_client.get_poster_url(details)
-
-    assert url is None
+@pytest.mark.parametrize("details, expected", [
+    pytest.param(
+        {'id': 'a3b7f0e5-7e7d-4e4f-8e5c-1a2b3c4d5e6f', 'title': 'Abbey Road'},
+        'https://coverartarchive.org/release/a3b7f0e5-7e7d-4e4f-8e5c-1a2b3c4d5e6f/front',
+        id='with_mbid',
+    ),
+    pytest.param({'title': 'No ID'}, None, id='missing_id'),
+    pytest.param({'id': None, 'title': 'No ID'}, None, id='none_id'),
+])
+def test_get_poster_url(mb_client, details, expected):
+    """Test Cover Art Archive URL for an album, or None without an MBID."""
+    assert mb_client.get_poster_url(details) == expected
 
 
 # ============================================================================
 # Tests for prompt_disambiguation()
 # ============================================================================
 
-def test_prompt_disambiguation_select_first(mb_client, mocker):
+def test_prompt_disambiguation_select_first(mb_client, fake_input):
     """Test disambiguating and selecting first result."""
     results = [
         {
@@ -572,8 +615,7 @@ def test_prompt_disambiguation_select_first(mb_client, mocker):
         }
     ]
 
-    inputs = iter(['1'])
-    mocker.patch('lib.api.musicbrainz_client.get_user_input', lambda prompt: next(inputs))
+    fake_input.extend(['1'])
 
     result = mb_client.prompt_disambiguation('Abbey Road', results)
 
@@ -581,19 +623,18 @@ def test_prompt_disambiguation_select_first(mb_client, mocker):
     assert result['title'] == 'Abbey Road'
 
 
-def test_prompt_disambiguation_skip(mb_client, mocker):
+def test_prompt_disambiguation_skip(mb_client, fake_input):
     """Test disambiguating and skipping."""
     results = [{'title': 'Test', 'artist': 'Test', 'date': '2020'}]
 
-    inputs = iter(['0'])
-    mocker.patch('lib.api.musicbrainz_client.get_user_input', lambda prompt: next(inputs))
+    fake_input.extend(['0'])
 
     result = mb_client.prompt_disambiguation('Test', results)
 
     assert result is None
 
 
-def test_prompt_disambiguation_displays_secondary_types(mb_client, mocker, capsys):
+def test_prompt_disambiguation_displays_secondary_types(mb_client, fake_input, monkeypatch):
     """Test that disambiguation displays secondary types."""
     results = [
         {
@@ -606,16 +647,17 @@ def test_prompt_disambiguation_displays_secondary_types(mb_client, mocker, capsy
         }
     ]
 
-    inputs = iter(['1'])
-    mocker.patch('lib.api.musicbrainz_client.get_user_input', lambda prompt: next(inputs))
+    fake_input.extend(['1'])
+
+    stdout = io.StringIO()
+    monkeypatch.setattr('sys.stdout', stdout)
 
     mb_client.prompt_disambiguation('Live Album', results)
 
-    captured = capsys.readouterr()
-    assert '[ALBUM/LIVE/COMPILATION]' in captured.out
+    assert '[ALBUM/LIVE/COMPILATION]' in stdout.getvalue()
 
 
-def test_prompt_disambiguation_displays_disambiguation_text(mb_client, mocker, capsys):
+def test_prompt_disambiguation_displays_disambiguation_text(mb_client, fake_input, monkeypatch):
     """Test that disambiguation text is displayed."""
     results = [
         {
@@ -628,23 +670,23 @@ def test_prompt_disambiguation_displays_disambiguation_text(mb_client, mocker, c
         }
     ]
 
-    inputs = iter(['1'])
-    mocker.patch('lib.api.musicbrainz_client.get_user_input', lambda prompt: next(inputs))
+    fake_input.extend(['1'])
+
+    stdout = io.StringIO()
+    monkeypatch.setattr('sys.stdout', stdout)
 
     mb_client.prompt_disambiguation('Abbey Road', results)
 
-    captured = capsys.readouterr()
-    assert '[original UK release]' in captured.out
+    assert '[original UK release]' in stdout.getvalue()
 
 
-def test_prompt_disambiguation_invalid_then_valid(mb_client, mocker, capsys):
+def test_prompt_disambiguation_invalid_then_valid(mb_client, fake_input, capsys):
     """Test handling invalid input then valid selection."""
     results = [
         {'title': 'Test', 'artist': 'Test', 'date': '2020', 'type': 'Album', 'secondary-types': []}
     ]
 
-    inputs = iter(['99', '1'])
-    mocker.patch('lib.api.musicbrainz_client.get_user_input', lambda prompt: next(inputs))
+    fake_input.extend(['99', '1'])
 
     result = mb_client.prompt_disambiguation('Test', results)
 
@@ -1,54 +1,76 @@
 """Unit tests for lib/api/tmdb_client.py"""
 
+import copy
 import json
 
 import pytest
+import requests
 import responses
 
 from lib.api.tmdb_client import TMDBClient
+from lib.poster_utils import make_session
 
 # ============================================================================
 # Test Fixtures
 # ============================================================================
 
-@pytest.fixture
-def tmdb_client():
-    """Create a TMDB client for movies."""
+@pytest.fixture(scope="session")
+def _tmdb_client_template():
+    """Build the movie client once; tests get shallow copies."""
     return TMDBClient('test_api_key', 'movie')
 
 
-@pytest.fixture
-def tmdb_tv_client():
-    """Create a TMDB client for TV shows."""
+@pytest.fixture(scope="session")
+def _tmdb_tv_client_template():
+    """Build the TV client once; tests get shallow copies."""
     return TMDBClient('test_api_key', 'tv')
 
 
-@pytest.fixture
-def movie_search_results(api_responses_dir):
-    """Load movie search results from fixture."""
-    with open(api_responses_dir / 'tmdb_movie_search.json') as f:
-        return json.load(f)
+def _copy_client(template):
+    """Shallow-copy a template client, giving the copy its own session."""
+    client = copy.copy(template)
+    client._session = make_session()
+    return client
 
 
 @pytest.fixture
-def movie_details(api_responses_dir):
-    """Load movie details from fixture."""
-    with open(api_responses_dir / 'tmdb_movie_details.json') as f:
-        return json.load(f)
+def tmdb_client(_tmdb_client_template):
+    """Create a TMDB client for movies."""
+    client = _copy_client(_tmdb_client_template)
+    yield client
+    client._session.close()
 
 
 @pytest.fixture
-def tv_search_results(api_responses_dir):
-    """Load TV search results from fixture."""
-    with open(api_responses_dir / 'tmdb_tv_search.json') as f:
-        return json.load(f)
+def tmdb_tv_client(_tmdb_tv_client_template):
+    """Create a TMDB client for TV shows."""
+    client = _copy_client(_tmdb_tv_client_template)
+    yield client
+    client._session.close()
 
 
-@pytest.fixture
-def tv_details(api_responses_dir):
-    """Load TV details from fixture."""
-    with open(api_responses_dir / 'tmdb_tv_details.json') as f:
-        return json.load(f)
+@pytest.fixture(scope="session")
+def movie_search_results(load_api_response):
+    """Load movie search results from fixture (frozen, shared)."""
+    return load_api_response('tmdb_movie_search.json')
+
+
+@pytest.fixture(scope="session")
+def movie_details(load_api_response):
+    """Load movie details from fixture (frozen, shared)."""
+    return load_api_response('tmdb_movie_details.json')
+
+
+@pytest.fixture(scope="session")
+def tv_search_results(load_api_response):
+    """Load TV search results from fixture (frozen, shared)."""
+    return load_api_response('tmdb_tv_search.json')
+
+
+@pytest.fixture(scope="session")
+def tv_details(load_api_response):
+    """Load TV details from fixture (frozen, shared)."""
+    return load_api_response('tmdb_tv_details.json')
 
 
 # ============================================================================
@@ -73,17 +95,46 @@ def test_tmdb_client_init_tv():
     assert client.tmdb_base_url == 'https://api.themoviedb.org/3'
 
 
+def test_tmdb_client_fixture_has_own_session(tmdb_client, _tmdb_client_template):
+    """Test each test's client gets its own session rather than the template's."""
+    assert tmdb_client._session is not _tmdb_client_template._session
+
+
+def test_tmdb_client_reuses_session(mocked_responses, mocker):
+    """Test that search and get_details share one pooled requests.Session."""
+    mocked_responses.add(
+        responses.GET,
+        'https://api.themoviedb.org/3/search/movie',
+        json={'results': []},
+        status=200
+    )
+    mocked_responses.add(
+        responses.GET,
+        'https://api.themoviedb.org/3/movie/123',
+        json={'id': 123},
+        status=200
+    )
+    client = TMDBClient('my_api_key', 'movie')
+    assert isinstance(client._session, requests.Session)
+    spy = mocker.spy(client._session, 'get')
+
+    client.search('Test')
+    client.get_details('123')
+
+    assert spy.call_count == 2
+
+
 # ============================================================================
 # Tests for search()
 # ============================================================================
 
-@responses.activate
-def test_search_movie_success(tmdb_client, movie_search_results):
+def test_search_movie_success(tmdb_client, movie_search_results, mocked_responses):
     """Test successful movie search."""
-    responses.add(
+    mocked_responses.add(
         responses.GET,
         'https://api.themoviedb.org/3/search/movie',
-        json=movie_search_results,
+        body=json.dumps(movie_search_results, default=dict),
+        content_type='application/json',
         status=200
     )
 
@@ -94,13 +145,13 @@ def test_search_movie_success(tmdb_client, movie_search_results):
     assert results[0]['release_date'] == '2010-07-16'
 
 
-@responses.activate
-def test_search_tv_success(tmdb_tv_client, tv_search_results):
+def test_search_tv_success(tmdb_tv_client, tv_search_results, mocked_responses):
     """Test successful TV show search."""
-    responses.add(
+    mocked_responses.add(
         responses.GET,
         'https://api.themoviedb.org/3/search/tv',
-        json=tv_search_results,
+        body=json.dumps(tv_search_results, default=dict),
+        content_type='application/json',
         status=200
     )
 
@@ -111,10 +162,9 @@ def test_search_tv_success(tmdb_tv_client, tv_search_results):
     assert results[0]['first_air_date'] == '2022-06-24'
 
 
-@responses.activate
-def test_search_no_results(tmdb_client):
+def test_search_no_results(tmdb_client, mocked_responses):
     """Test search with no results."""
-    responses.add(
+    mocked_responses.add(
         responses.GET,
         'https://api.themoviedb.org/3/search/movie',
         json={'results': [], 'total_results': 0},
@@ -126,10 +176,22 @@ def test_search_no_results(tmdb_client):
     assert len(results) == 0
 
 
-@responses.activate
-def test_search_http_error(tmdb_client):
+def test_search_decodes_utf8_without_charset(tmdb_client, mocked_responses):
+    """Test non-ASCII results decode from raw bytes when no charset is declared."""
+    mocked_responses.add(
+        responses.GET,
+        'https://api.themoviedb.org/3/search/movie',
+        body=json.dumps({'results': [{'title': 'Amélie'}]}, ensure_ascii=False).encode('utf-8'),
+        content_type='application/json',
+        status=200
+    )
+
+    assert tmdb_client.search('Amelie') == [{'title': 'Amélie'}]
+
+
+def test_search_http_error(tmdb_client, mocked_responses):
     """Test search with HTTP error."""
-    responses.add(
+    mocked_responses.add(
         responses.GET,
         'https://api.themoviedb.org/3/search/movie',
         status=401
@@ -139,10 +201,9 @@ def test_search_http_error(tmdb_client):
         tmdb_client.search('Inception')
 
 
-@responses.activate
-def test_search_includes_api_key(tmdb_client):
+def test_search_includes_api_key(tmdb_client, mocked_responses):
     """Test that search includes API key in request."""
-    responses.add(
+    mocked_responses.add(
         responses.GET,
         'https://api.themoviedb.org/3/search/movie',
         json={'results': []},
@@ -152,21 +213,21 @@ def test_search_includes_api_key(tmdb_client):
     tmdb_client.search('Test')
 
     # Verify API key was sent
-    assert len(responses.calls) == 1
-    assert 'api_key=test_api_key' in responses.calls[0].request.url
+    assert len(mocked_responses.calls) == 1
+    assert 'api_key=test_api_key' in mocked_responses.calls[0].request.url
 
 
 # ============================================================================
 # Tests for get_details()
 # ============================================================================
 
-@responses.activate
-def test_get_details_movie_success(tmdb_client, movie_details):
+def test_get_details_movie_success(tmdb_client, movie_details, mocked_responses):
     """Test getting movie details."""
-    responses.add(
+    mocked_responses.add(
         responses.GET,
         'https://api.themoviedb.org/3/movie/27205',
-        json=movie_details,
+        body=json.dumps(movie_details, default=dict),
+        content_type='application/json',
         status=200
     )
 
@@ -178,13 +239,13 @@ def test_get_details_movie_success(tmdb_client, movie_details):
     assert 'external_ids' in details
 
 
-@responses.activate
-def test_get_details_tv_success(tmdb_tv_client, tv_details):
+def test_get_details_tv_success(tmdb_tv_client, tv_details, mocked_responses):
     """Test getting TV show details."""
-    responses.add(
+    mocked_responses.add(
         responses.GET,
         'https://api.themoviedb.org/3/tv/156482',
-        json=tv_details,
+        body=json.dumps(tv_details, default=dict),
+        content_type='application/json',
         status=200
     )
 
@@ -195,10 +256,9 @@ def test_get_details_tv_success(tmdb_tv_client, tv_details):
     assert 'credits' in details
 
 
-@responses.activate
-def test_get_details_appends_credits_and_external_ids(tmdb_client):
+def test_get_details_appends_credits_and_external_ids(tmdb_client, mocked_responses):
     """Test that get_details appends credits and external_ids."""
-    responses.add(
+    mocked_responses.add(
         responses.GET,
         'https://api.themoviedb.org/3/movie/123',
         json={'id': 123},
@@ -208,16 +268,15 @@ def test_get_details_appends_credits_and_external_ids(tmdb_client):
     tmdb_client.get_details('123')
 
     # Verify append_to_response was sent (comma is URL-encoded as %2C)
-    assert len(responses.calls) == 1
-    assert 'append_to_response=' in responses.calls[0].request.url
-    assert 'credits' in responses.calls[0].request.url
-    assert 'external_ids' in responses.calls[0].request.url
+    assert len(mocked_responses.calls) == 1
+    assert 'append_to_response=' in mocked_responses.calls[0].request.url
+    assert 'credits' in mocked_responses.calls[0].request.url
+    assert 'external_ids' in mocked_responses.calls[0].request.url
 
 
-@responses.activate
-def test_get_details_http_error(tmdb_client):
+def test_get_details_http_error(tmdb_client, mocked_responses):
     """Test get_details with HTTP error."""
-    responses.add(
+    mocked_responses.add(
         responses.GET,
         'https://api.themoviedb.org/3/movie/999999',
         status=404
@@ -262,27 +321,38 @@ def test_format_cast_as_wikilink_missing_name(tmdb_client):
 
 
 # ============================================================================
-# Tests for format_note_content() - Movies
+# Tests for format_note_content() - Movies and TV Shows
 # ============================================================================
 
-def test_format_note_content_movie(tmdb_client, movie_details):
-    """Test formatting movie note content."""
-    content = tmdb_client.format_note_content(movie_details)
-
-    # Check YAML frontmatter
+@pytest.mark.parametrize("client_fx, details_fx, expected", [
+    pytest.param('tmdb_client', 'movie_details', [
+        '  - movie',
+        'imdb.com/title/tt1375666',
+        'Directed by [[Christopher Nolan]]',
+        'Cobb ([[Leonardo DiCaprio]])',
+        'corporate secrets',
+    ], id='movie'),
+    # TV shows credit the creator ("Created by"), not a director
+    pytest.param('tmdb_tv_client', 'tv_details', [
+        '  - series',
+        'imdb.com/title/tt15398010',
+        'Created by [[Alan Yang]]',
+        'Molly Novak ([[Maya Rudolph]])',
+    ], id='tv'),
+])
+def test_format_note_content(request, client_fx, details_fx, expected):
+    """Test formatting movie and TV note content."""
+    client = request.getfixturevalue(client_fx)
+    content = client.format_note_content(request.getfixturevalue(details_fx))
+
+    # Check YAML frontmatter and sections
     assert content.startswith('---')
     assert 'tags:' in content
-    assert '  - movie' in content
-
-    # Check sections
     assert '## Links' in content
-    assert 'imdb.com/title/tt1375666' in content
     assert '## Description' in content
 
-    # Check content
-    assert 'Directed by [[Christopher Nolan]]' in content
-    assert 'Cobb ([[Leonardo DiCaprio]])' in content
-    assert 'corporate secrets' in content
+    for snippet in expected:
+        assert snippet in content
 
 
 def test_format_note_content_movie_genre_tags(tmdb_client, movie_details):
@@ -310,19 +380,28 @@ def test_format_note_content_movie_missing_imdb(tmdb_client):
     assert 'Not available' in content
 
 
-def test_format_note_content_movie_missing_director(tmdb_client):
-    """Test formatting movie without director."""
-    details = {
+@pytest.mark.parametrize("client_fx, details, expected", [
+    pytest.param('tmdb_client', {
         'title': 'Test Movie',
         'overview': 'A test movie',
         'credits': {'cast': [], 'crew': []},
         'external_ids': {'imdb_id': 'tt1234567'},
         'genres': []
-    }
-
-    content = tmdb_client.format_note_content(details)
+    }, 'Directed by Unknown', id='movie_missing_director'),
+    pytest.param('tmdb_tv_client', {
+        'name': 'Test Show',
+        'overview': 'A test show',
+        'created_by': [],
+        'credits': {'cast': []},
+        'external_ids': {'imdb_id': 'tt1234567'},
+        'genres': []
+    }, 'Created by Unknown', id='tv_missing_creator'),
+])
+def test_format_note_content_missing_credit(request, client_fx, details, expected):
+    """Test formatting without a director (movie) or creator (TV)."""
+    content = request.getfixturevalue(client_fx).format_note_content(details)
 
-    assert 'Directed by Unknown' in content
+    assert expected in content
 
 
 def test_format_note_content_movie_missing_cast(tmdb_client):
@@ -344,45 +423,6 @@ def test_format_note_content_movie_missing_cast(tmdb_client):
     assert 'Directed by [[Director Name]]. Starring .' in content
 
 
-# ============================================================================
-# Tests for format_note_content() - TV Shows
-# ============================================================================
-
-def test_format_note_content_tv(tmdb_tv_client, tv_details):
-    """Test formatting TV show note content."""
-    content = tmdb_tv_client.format_note_content(tv_details)
-
-    # Check YAML frontmatter
-    assert content.startswith('---')
-    assert 'tags:' in content
-    assert '  - series' in content
-
-    # Check sections
-    assert '## Links' in content
-    assert 'imdb.com/title/tt15398010' in content
-    assert '## Description' in content
-
-    # Check content - should have "Created by" not "Directed by"
-    assert 'Created by [[Alan Yang]]' in content
-    assert 'Molly Novak ([[Maya Rudolph]])' in content
-
-
-def test_format_note_content_tv_missing_creator(tmdb_tv_client):
-    """Test formatting TV show without creator."""
-    details = {
-        'name': 'Test Show',
-        'overview': 'A test show',
-        'created_by': [],
-        'credits': {'cast': []},
-        'external_ids': {'imdb_id': 'tt1234567'},
-        'genres': []
-    }
-
-    content = tmdb_tv_client.format_note_content(details)
-
-    assert 'Created by Unknown' in content
-
-
 # ============================================================================
 # Tests for get_filename() - Movies
 # ============================================================================
@@ -406,9 +446,10 @@ def test_get_filename_movie_sanitizes_title(tmdb_client):
     assert filename == 'Movie - The Subtitle (2020).md'
 
 
-def test_get_filename_movie_missing_year(tmdb_client):
-    """Test movie filename without release date."""
-    details = {'title': 'Test Movie', 'release_date': ''}
+@pytest.mark.parametrize("release_date", ['', None])
+def test_get_filename_movie_missing_year(tmdb_client, release_date):
+    """Test movie filename without release date (empty or null)."""
+    details = {'title': 'Test Movie', 'release_date': release_date}
 
     with pytest.raises(ValueError) as excinfo:
         tmdb_client.get_filename(details)
@@ -467,92 +508,51 @@ def test_get_poster_url_tv(tmdb_tv_client, tv_details):
     assert url == 'https://image.tmdb.org/t/p/original/loot_poster.jpg'
 
 
-def test_get_poster_url_missing(tmdb_client):
-    """Test getting poster URL when poster_path is missing."""
-    details = {'id': 123, 'title': 'No Poster'}
-
-    url = tmdb_client.get_poster_url(details)
-
-    assert url is None
-
-
-def test_get_poster_url_null(tmdb_client):
-    """Test getting poster URL when poster_path is null."""
-    details = {'id': 123, 'title': 'No Poster', 'poster_path': None}
-
-    url = tmdb_client.get_poster_url(details)
-
-    assert url is None
+@pytest.mark.parametrize("details", [
+    pytest.param({'id': 123, 'title': 'No Poster'}, id='missing'),
+    pytest.param({'id': 123, 'title': 'No Poster', 'poster_path': None}, id='null'),
+])
+def test_get_poster_url_no_poster(tmdb_client, details):
+    """Test getting poster URL when poster_path is missing or null."""
+    assert tmdb_client.get_poster_url(details) is None
 
 
 # ============================================================================
 # Tests for prompt_disambiguation()
 # ============================================================================
 
-def test_prompt_disambiguation_select_first(tmdb_client, movie_search_results, monkeypatch):
-    """Test disambiguating and selecting first result."""
-    # Mock user input to select first option
-    inputs = iter(['1'])
-    monkeypatch.setattr('lib.api.tmdb_client.get_user_input', lambda prompt: next(inputs))
-
-    result = tmdb_client.prompt_disambiguation('Inception', movie_search_results['results'])
-
-    assert result is not None
-    assert result['title'] == 'Inception'
-    assert result['release_date'] == '2010-07-16'
-
-
-def test_prompt_disambiguation_select_second(tmdb_client, movie_search_results, monkeypatch):
-    """Test disambiguating and selecting second result."""
-    inputs = iter(['2'])
-    monkeypatch.setattr('lib.api.tmdb_client.get_user_input', lambda prompt: next(inputs))
-
-    result = tmdb_client.prompt_disambiguation('Inception', movie_search_results['results'])
-
-    assert result is not None
-    assert result['title'] == 'Inception: The Documentary'
-
-
-def test_prompt_disambiguation_skip(tmdb_client, movie_search_results, monkeypatch):
-    """Test disambiguating and skipping."""
-    inputs = iter(['0'])
-    monkeypatch.setattr('lib.api.tmdb_client.get_user_input', lambda prompt: next(inputs))
+@pytest.mark.parametrize("inputs, expected, stdout_contains", [
+    pytest.param(['1'], {'title': 'Inception', 'release_date': '2010-07-16'}, None,
+                 id='select_first'),
+    pytest.param(['2'], {'title': 'Inception: The Documentary'}, None, id='select_second'),
+    pytest.param(['0'], None, None, id='skip'),
+    pytest.param(['99', '1'], {'title': 'Inception'}, 'between 0 and 2',
+                 id='invalid_then_valid'),
+    pytest.param(['abc', '1'], {'title': 'Inception'}, 'valid number',
+                 id='non_numeric_then_valid'),
+])
+def test_prompt_disambiguation(tmdb_client, movie_search_results, fake_input, capsys,
+                               inputs, expected, stdout_contains):
+    """Test selecting, skipping, and re-prompting after bad input."""
+    fake_input.extend(inputs)
 
     result = tmdb_client.prompt_disambiguation('Inception', movie_search_results['results'])
 
-    assert result is None
+    if expected is None:
+        assert result is None
+    else:
+        assert result is not None
+        for key, value in expected.items():
+            assert result[key] == value
 
-
-def test_prompt_disambiguation_invalid_then_valid(tmdb_client, movie_search_results, monkeypatch, capsys):
-    """Test handling invalid input then valid selection."""
-    inputs = iter(['99', '1'])  # Invalid, then valid
-    monkeypatch.setattr('lib.api.tmdb_client.get_user_input', lambda prompt: next(inputs))
-
-    result = tmdb_client.prompt_disambiguation('Inception', movie_search_results['results'])
-
-    assert result is not None
-    # Check error message was printed
-    captured = capsys.readouterr()
-    assert 'between 0 and 2' in captured.out
-
-
-def test_prompt_disambiguation_non_numeric_then_valid(tmdb_client, movie_search_results, monkeypatch, capsys):
-    """Test handling non-numeric input then valid selection."""
-    inputs = iter(['abc', '1'])  # Non-numeric, then valid
-    monkeypatch.setattr('lib.api.tmdb_client.get_user_input', lambda prompt: next(inputs))
-
-    result = tmdb_client.prompt_disambiguation('Inception', movie_search_results['results'])
-
-    assert result is not None
-    # Check error message was printed
-    captured = capsys.readouterr()
-    assert 'valid number' in captured.out
+    if stdout_contains:
+        # Check error message was printed
+        assert stdout_contains in capsys.readouterr().out
 
 
-def test_prompt_disambiguation_tv_shows(tmdb_tv_client, tv_search_results, monkeypatch, capsys):
+def test_prompt_disambiguation_tv_shows(tmdb_tv_client, tv_search_results, fake_input, capsys):
     """Test disambiguation displays TV label."""
-    inputs = iter(['1'])
-    monkeypatch.setattr('lib.api.tmdb_client.get_user_input', lambda prompt: next(inputs))
+    fake_input.extend(['1'])
 
     result = tmdb_tv_client.prompt_disambiguation('Loot', tv_search_results['results'])
 
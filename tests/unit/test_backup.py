@@ -1,7 +1,10 @@
 """Unit tests for lib/backup.py"""
 
+import os
+import time
 import zipfile
 
+from lib import backup
 from lib.backup import create_vault_backup
 
 # ============================================================================
@@ -32,10 +35,8 @@ def test_create_vault_backup_success(tmp_path, capsys):
 
     # Verify backup contents
     with zipfile.ZipFile(backup_path, 'r') as zipf:
-        names = zipf.namelist()
-        assert 'note1.md' in names
-        assert 'note2.md' in names
-        assert 'subfolder/note3.md' in names
+        names = set(zipf.namelist())
+        assert {'note1.md', 'note2.md', 'subfolder/note3.md'} <= names
 
         # Verify file contents
         assert zipf.read('note1.md').decode() == "# Note 1"
@@ -84,11 +85,8 @@ def test_create_vault_backup_nested_directories(tmp_path):
 
     # Verify all files are in backup with correct paths
     with zipfile.ZipFile(backup_path, 'r') as zipf:
-        names = zipf.namelist()
-        assert 'root.md' in names
-        assert 'a/level_a.md' in names
-        assert 'a/b/level_b.md' in names
-        assert 'a/b/c/d/deep_file.md' in names
+        names = set(zipf.namelist())
+        assert {'root.md', 'a/level_a.md', 'a/b/level_b.md', 'a/b/c/d/deep_file.md'} <= names
 
 
 def test_create_vault_backup_various_file_types(tmp_path):
@@ -107,15 +105,16 @@ def test_create_vault_backup_various_file_types(tmp_path):
 
     # Verify all file types are backed up
     with zipfile.ZipFile(backup_path, 'r') as zipf:
-        names = zipf.namelist()
-        assert 'note.md' in names
-        assert 'image.jpg' in names
-        assert 'config.json' in names
-        assert 'data.txt' in names
+        names = set(zipf.namelist())
+        assert {'note.md', 'image.jpg', 'config.json', 'data.txt'} <= names
 
         # Verify binary data is preserved
         assert zipf.read('image.jpg') == b'fake image data'
 
+        # Already-compressed formats are stored; text is deflated
+        assert zipf.getinfo('image.jpg').compress_type == zipfile.ZIP_STORED
+        assert zipf.getinfo('note.md').compress_type == zipfile.ZIP_DEFLATED
+
 
 def test_create_vault_backup_preserves_relative_paths(tmp_path):
     """Test that backup preserves relative paths from vault root."""
@@ -132,10 +131,11 @@ def test_create_vault_backup_preserves_relative_paths(tmp_path):
 
     # Verify paths are relative to vault root
     with zipfile.ZipFile(backup_path, 'r') as zipf:
-        names = zipf.namelist()
+        names = set(zipf.namelist())
         # Should not include vault name in path
         assert 'Movies/Action/movie.md' in names
-        assert not any('vault' in name for name in names)
+        # NUL-joined so a match can't straddle two names
+        assert 'vault' not in '\x00'.join(names)
 
 
 def test_create_vault_backup_compression(tmp_path):
@@ -172,10 +172,8 @@ def test_create_vault_backup_unicode_filenames(tmp_path):
 
     # Verify unicode filenames are preserved
     with zipfile.ZipFile(backup_path, 'r') as zipf:
-        names = zipf.namelist()
-        assert '日本語.md' in names
-        assert 'émoji🎬.md' in names
-        assert 'Ñoño.md' in names
+        names = set(zipf.namelist())
+        assert {'日本語.md', 'émoji🎬.md', 'Ñoño.md'} <= names
 
 
 def test_create_vault_backup_special_characters(tmp_path):
@@ -193,10 +191,8 @@ def test_create_vault_backup_special_characters(tmp_path):
 
     # Verify special chars are preserved
     with zipfile.ZipFile(backup_path, 'r') as zipf:
-        names = zipf.namelist()
-        assert 'movie (2020).md' in names
-        assert 'title - subtitle.md' in names
-        assert "file's name.md" in names
+        names = set(zipf.namelist())
+        assert {'movie (2020).md', 'title - subtitle.md', "file's name.md"} <= names
 
 
 def test_create_vault_backup_overwrites_existing(tmp_path):
@@ -223,6 +219,117 @@ def test_create_vault_backup_overwrites_existing(tmp_path):
 
     # Verify both files are in the backup
     with zipfile.ZipFile(backup_path, 'r') as zipf:
-        names = zipf.namelist()
-        assert 'note.md' in names
-        assert 'note2.md' in names
+        names = set(zipf.namelist())
+        assert {'note.md', 'note2.md'} <= names
+
+
+def test_create_vault_backup_skips_symlinked_directories(tmp_path):
+    """Test that symlinked directories are not followed (matching os.walk)."""
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    (vault / "note.md").write_text("# Note")
+
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "external.md").write_text("External")
+    (vault / "linked").symlink_to(outside, target_is_directory=True)
+
+    backup_path = tmp_path / "backup.zip"
+    create_vault_backup(vault, str(backup_path))
+
+    with zipfile.ZipFile(backup_path, 'r') as zipf:
+        assert zipf.namelist() == ['note.md']
+
+
+def test_create_vault_backup_skips_unreadable_directories(tmp_path, monkeypatch):
+    """Test that a directory that can't be listed is skipped (matching os.walk)."""
+    vault = tmp_path / "vault"
+    (vault / "locked").mkdir(parents=True)
+    (vault / "open").mkdir()
+    (vault / "note.md").write_text("# Note")
+    (vault / "locked" / "secret.md").write_text("Secret")
+    (vault / "open" / "other.md").write_text("Other")
+
+    scandir = os.scandir
+
+    def fail_for_locked(path):
+        if os.path.basename(path) == 'locked':
+            raise PermissionError(13, 'Permission denied', path)
+        return scandir(path)
+    monkeypatch.setattr(backup.os, 'scandir', fail_for_locked)
+
+    backup_path = tmp_path / "backup.zip"
+    create_vault_backup(vault, str(backup_path))
+
+    with zipfile.ZipFile(backup_path, 'r') as zipf:
+        assert sorted(zipf.namelist()) == ['note.md', 'open/other.md']
+
+
+def test_create_vault_backup_preserves_mtime(tmp_path):
+    """Test that archived notes keep their modification time."""
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    note = vault / "note.md"
+    note.write_text("# Note")
+    mtime = time.mktime((2021, 6, 15, 12, 30, 0, 0, 0, -1))
+    os.utime(note, (mtime, mtime))
+
+    backup_path = tmp_path / "backup.zip"
+    create_vault_backup(vault, str(backup_path))
+
+    with zipfile.ZipFile(backup_path, 'r') as zipf:
+        info = zipf.getinfo('note.md')
+        assert info.date_time == (2021, 6, 15, 12, 30, 0)
+        assert info.compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_create_vault_backup_streams_large_files(tmp_path, monkeypatch):
+    """Test that files over the inline-read limit are still archived intact."""
+    monkeypatch.setattr(backup, '_INLINE_READ_LIMIT', 10)
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    (vault / "small.md").write_text("tiny")
+    (vault / "large.md").write_text("x" * 100)
+
+    backup_path = tmp_path / "backup.zip"
+    create_vault_backup(vault, str(backup_path))
+
+    with zipfile.ZipFile(backup_path, 'r') as zipf:
+        assert zipf.read('small.md') == b"tiny"
+        assert zipf.read('large.md') == b"x" * 100
+        assert zipf.getinfo('large.md').compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_create_vault_backup_read_ahead_keeps_walk_order(tmp_path, monkeypatch):
+    """Test that files read ahead in worker threads are written in walk order."""
+    monkeypatch.setattr(backup, '_READ_AHEAD', 2)
+    vault = tmp_path / "vault"
+    (vault / "sub").mkdir(parents=True)
+    for i in range(5):
+        (vault / f"note{i}.md").write_text(f"# Note {i}")
+        (vault / "sub" / f"sub{i}.md").write_text(f"# Sub {i}")
+
+    backup_path = tmp_path / "backup.zip"
+    create_vault_backup(vault, str(backup_path))
+
+    expected = [arcname for _, arcname in backup._iter_files(str(vault))]
+    with zipfile.ZipFile(backup_path, 'r') as zipf:
+        assert zipf.namelist() == expected
+        assert zipf.read('sub/sub3.md') == b"# Sub 3"
+
+
+def test_create_vault_backup_small_vault_has_no_zip64_records(tmp_path):
+    """Test that a small vault's archive uses plain (non-Zip64) headers."""
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    (vault / "note.md").write_text("# Note")
+
+    backup_path = tmp_path / "backup.zip"
+    create_vault_backup(vault, str(backup_path))
+
+    data = backup_path.read_bytes()
+    # A Zip64 end-of-central-directory locator would sit right before the 22-byte EOCD
+    assert data[-22:-18] == b'PK\x05\x06'
+    assert data[-42:-38] != b'PK\x06\x07'
+    with zipfile.ZipFile(backup_path, 'r') as zipf:
+        assert zipf.getinfo('note.md').extra == b''
@@ -3,8 +3,6 @@
 from datetime import datetime, timezone
 
 import pytest
-import yaml
-from freezegun import freeze_time
 
 from lib.obsidian_utils import (
     extract_title_and_year,
@@ -216,53 +214,55 @@ def test_filter_results_by_year_series_alias():
     assert len(filtered) == 1
 
 
-# ============================================================================
-# Tests for filter_results_by_year - IGDB (games) - CRITICAL UTC TESTS
-# ============================================================================
-
-@freeze_time("2024-01-15 12:00:00", tz_offset=0)
-def test_filter_results_by_year_game_utc():
-    """Test filtering game results by year with UTC timezone handling."""
-    # Timestamp for 2021-01-01 00:00:00 UTC
-    timestamp_2021 = int(datetime(2021, 1, 1, 0, 0, 0, tzinfo=timezone.utc).timestamp())
-    # Timestamp for 2020-12-31 23:59:59 UTC
-    timestamp_2020 = int(datetime(2020, 12, 31, 23, 59, 59, tzinfo=timezone.utc).timestamp())
-
-    results = [
-        {'name': 'Game 2021', 'first_release_date': timestamp_2021},
-        {'name': 'Game 2020', 'first_release_date': timestamp_2020},
-    ]
-    filtered = filter_results_by_year(results, '2021', 'game')
-
-    assert len(filtered) == 1
-    assert filtered[0]['name'] == 'Game 2021'
-
-
-@freeze_time("2024-01-15 12:00:00", tz_offset=0)
-def test_filter_results_by_year_game_multiple_years():
-    """Test filtering games across multiple years."""
-    results = [
-        {'name': 'Game 2020', 'first_release_date': 1577836800},  # 2020-01-01 UTC
-        {'name': 'Game 2021', 'first_release_date': 1609459200},  # 2021-01-01 UTC
-        {'name': 'Game 2022', 'first_release_date': 1640995200},  # 2022-01-01 UTC
-    ]
-    filtered = filter_results_by_year(results, '2021', 'game')
+def test_filter_results_by_year_unknown_media_type():
+    """Test that an unsupported media type matches nothing."""
+    results = [{'title': 'Podcast', 'release_date': '2022-01-01'}]
 
-    assert len(filtered) == 1
-    assert filtered[0]['name'] == 'Game 2021'
+    assert filter_results_by_year(results, '2022', 'podcast') == []
 
 
-def test_filter_results_by_year_game_missing_date():
-    """Test filtering games with missing first_release_date (unreleased)."""
-    results = [
-        {'name': 'Released Game', 'first_release_date': 1609459200},
-        {'name': 'Unreleased Game'},  # No date
-    ]
-    filtered = filter_results_by_year(results, '2021', 'game')
+# ============================================================================
+# Tests for filter_results_by_year - IGDB (games) - CRITICAL UTC TESTS
+# ============================================================================
 
-    # Unreleased game should not match any year
-    assert len(filtered) == 1
-    assert filtered[0]['name'] == 'Released Game'
+class TestFilterResultsByYearGame:
+    """IGDB timestamps, whose year is read in UTC."""
+
+    @pytest.mark.parametrize("results, expected_names", [
+        pytest.param(
+            [
+                # 2021-01-01 00:00:00 UTC and 2020-12-31 23:59:59 UTC
+                {'name': 'Game 2021', 'first_release_date':
+                    int(datetime(2021, 1, 1, 0, 0, 0, tzinfo=timezone.utc).timestamp())},
+                {'name': 'Game 2020', 'first_release_date':
+                    int(datetime(2020, 12, 31, 23, 59, 59, tzinfo=timezone.utc).timestamp())},
+            ],
+            ['Game 2021'],
+            id='utc_year_boundary',
+        ),
+        pytest.param(
+            [
+                {'name': 'Game 2020', 'first_release_date': 1577836800},  # 2020-01-01 UTC
+                {'name': 'Game 2021', 'first_release_date': 1609459200},  # 2021-01-01 UTC
+                {'name': 'Game 2022', 'first_release_date': 1640995200},  # 2022-01-01 UTC
+            ],
+            ['Game 2021'],
+            id='multiple_years',
+        ),
+        pytest.param(
+            [
+                {'name': 'Released Game', 'first_release_date': 1609459200},
+                {'name': 'Unreleased Game'},  # No date: should not match any year
+            ],
+            ['Released Game'],
+            id='missing_date',
+        ),
+    ])
+    def test_filter_results_by_year_game(self, results, expected_names):
+        """Test filtering game results by year with UTC timezone handling."""
+        filtered = filter_results_by_year(results, '2021', 'game')
+
+        assert [result['name'] for result in filtered] == expected_names
 
 
 # ============================================================================
@@ -277,6 +277,8 @@ def test_filter_results_by_year_game_missing_date():
     ("2021", "2020", False),
     (None, "2020", False),
     ("", "2020", False),
+    ("2020-06-15", "20", False),    # Partial year must not prefix-match
+    ("202", "202", True),           # Non-4-digit year falls back to slice compare
 ])
 def test_filter_results_by_year_album_date_formats(date_string, year, should_match):
     """Test filtering albums with various date formats."""
@@ -396,6 +398,18 @@ def test_find_exact_title_match_book():
     assert match['title'] == 'Dune'
 
 
+def test_find_exact_title_match_unicode_casefold():
+    """Test that matching uses full Unicode case folding (ß == SS)."""
+    results = [{'title': 'Straße'}, {'title': 'Strasse 2'}]
+
+    assert find_exact_title_match(results, 'STRASSE', 'movie') == {'title': 'Straße'}
+
+
+def test_find_exact_title_match_unknown_media_type():
+    """Test that an unsupported media type never matches."""
+    assert find_exact_title_match([{'title': 'Dune'}], 'Dune', 'podcast') is None
+
+
 # ============================================================================
 # Tests for filter_results_by_year - Google Books (books)
 # ============================================================================
@@ -444,41 +458,33 @@ def test_is_game_unreleased_false():
 # Tests for translate_genre_tag
 # ============================================================================
 
-def test_translate_genre_tag_with_mapping(tmp_path, monkeypatch):
-    """Test genre translation with mapping file."""
-    # Create a temporary genre_mappings.yaml
-    mappings = {
+@pytest.fixture(scope="session")
+def genre_mappings():
+    """Genre mappings shared by the translation tests (read-only)."""
+    return {
         'sci-fi': ['Science Fiction', 'Sci-Fi'],
         'rpg': ['Role-Playing (RPG)', 'Role Playing'],
         'action-adventure': ['Action/Adventure']
     }
 
-    config_path = tmp_path / 'genre_mappings.yaml'
-    with open(config_path, 'w') as f:
-        yaml.dump(mappings, f)
 
-    # Mock the config path
+def test_translate_genre_tag_with_mapping(genre_mappings, monkeypatch):
+    """Test genre translation with mapping file."""
     from lib import obsidian_utils
 
-    def mock_load():
-        return mappings
-
-    monkeypatch.setattr(obsidian_utils, '_load_genre_mappings', mock_load)
-    # Clear cache
-    obsidian_utils._GENRE_MAPPINGS_CACHE = None
+    monkeypatch.setattr(obsidian_utils, '_load_genre_mappings', lambda: genre_mappings)
 
     assert translate_genre_tag('Science Fiction') == 'sci-fi'
     assert translate_genre_tag('Role-Playing (RPG)') == 'rpg'
     assert translate_genre_tag('Action/Adventure') == 'action-adventure'
 
 
-def test_translate_genre_tag_without_mapping(tmp_path, monkeypatch, capsys):
+def test_translate_genre_tag_without_mapping(monkeypatch, capsys):
     """Test genre translation falls back to sanitization."""
     from lib import obsidian_utils
 
     # Mock empty mappings
     monkeypatch.setattr(obsidian_utils, '_load_genre_mappings', lambda: {})
-    obsidian_utils._GENRE_MAPPINGS_CACHE = None
 
     result = translate_genre_tag('Unknown Genre')
 
@@ -488,6 +494,25 @@ def test_translate_genre_tag_without_mapping(tmp_path, monkeypatch, capsys):
     assert "No genre mapping for 'Unknown Genre'" in captured.out
 
 
+def test_translate_genre_tag_memoized(monkeypatch, capsys):
+    """Test repeated genres skip the mapping scan and warn only once."""
+    from lib import obsidian_utils
+
+    calls = []
+
+    def mock_load():
+        calls.append(1)
+        return {'rock': ['Rock']}
+
+    monkeypatch.setattr(obsidian_utils, '_load_genre_mappings', mock_load)
+
+    assert [translate_genre_tag(g) for g in ['Rock', 'Rock', 'Shoegaze', 'Shoegaze']] == [
+        'rock', 'rock', 'shoegaze', 'shoegaze'
+    ]
+    assert len(calls) == 2
+    assert capsys.readouterr().out.count("No genre mapping for 'Shoegaze'") == 1
+
+
 @pytest.mark.parametrize("genre,expected", [
     ("Action/Adventure", "action-adventure"),
     ("Sci-Fi & Fantasy", "sci-fi-fantasy"),
@@ -501,7 +526,6 @@ def test_translate_genre_tag_sanitization(genre, expected, monkeypatch, capsys):
 
     # Mock empty mappings
     monkeypatch.setattr(obsidian_utils, '_load_genre_mappings', lambda: {})
-    obsidian_utils._GENRE_MAPPINGS_CACHE = None
 
     result = translate_genre_tag(genre)
     assert result == expected
@@ -511,16 +535,10 @@ def test_load_genre_mappings_missing_file(tmp_path, monkeypatch):
     """Test loading genre mappings when config file doesn't exist."""
     from lib import obsidian_utils
 
-    # Point to non-existent path
-    fake_path = tmp_path / 'nonexistent' / 'genre_mappings.yaml'
-
-    def mock_get_path():
-        return fake_path
-
-    # Clear cache
-    obsidian_utils._GENRE_MAPPINGS_CACHE = None
+    # Clear cache (restored afterwards so other tests keep the real mappings)
+    monkeypatch.setattr(obsidian_utils, '_GENRE_MAPPINGS_CACHE', None)
 
-    # Mock Path to point to fake location
+    # Point the config lookup (relative to the module file) at a fake location
     monkeypatch.setattr(obsidian_utils, '__file__', str(tmp_path / 'obsidian_utils.py'))
 
     mappings = obsidian_utils._load_genre_mappings()
@@ -533,13 +551,8 @@ def test_load_genre_mappings_caches_result(tmp_path, monkeypatch):
     from lib import obsidian_utils
 
     mappings = {'test': ['Test Genre']}
+    monkeypatch.setattr(obsidian_utils, '_GENRE_MAPPINGS_CACHE', mappings)
+    # A cache hit must not touch the config file, so point it somewhere empty
+    monkeypatch.setattr(obsidian_utils, '__file__', str(tmp_path / 'obsidian_utils.py'))
 
-    def mock_load():
-        return mappings
-
-    monkeypatch.setattr(obsidian_utils, '_load_genre_mappings', mock_load)
-    obsidian_utils._GENRE_MAPPINGS_CACHE = mappings
-
-    # Second call should return cached result
-    result = obsidian_utils._load_genre_mappings()
-    assert result == mappings
+    assert obsidian_utils._load_genre_mappings() is mappings
@@ -1,10 +1,15 @@
 """Unit tests for lib/poster_downloader.py"""
 
 import json
+import os
+import threading
 
 import pytest
+import requests
 import responses
+import yaml
 
+from lib import poster_downloader
 from lib.poster_downloader import PosterDownloader
 
 # ============================================================================
@@ -33,12 +38,14 @@ def poster_downloader_igdb(tmp_path):
             status=200
         )
 
-        return PosterDownloader(
+        pd = PosterDownloader(
             vault_path=tmp_path,
             igdb_client_id='test_id',
             igdb_client_secret='test_secret',
             poster_width=200
         )
+        pd.igdb_wrapper  # Authenticate while the OAuth mock is active
+        return pd
 
 
 @pytest.fixture
@@ -88,6 +95,25 @@ def test_init_with_igdb(tmp_path):
     assert pd.igdb_wrapper is not None
 
 
+@responses.activate
+def test_init_defers_igdb_oauth(tmp_path):
+    """Test that construction makes no request and later downloaders reuse the token."""
+    pd = PosterDownloader(tmp_path, igdb_client_id='test_id', igdb_client_secret='test_secret')
+    assert len(responses.calls) == 0
+
+    responses.add(
+        responses.POST,
+        'https://id.twitch.tv/oauth2/token',
+        json={'access_token': 'test_token'},
+        status=200
+    )
+    other = PosterDownloader(tmp_path, igdb_client_id='test_id', igdb_client_secret='test_secret')
+
+    assert pd.igdb_wrapper is pd.igdb_wrapper
+    assert other.igdb_wrapper is not None
+    assert len(responses.calls) == 1
+
+
 def test_init_musicbrainz_sets_useragent(tmp_path, mocker):
     """Test that initialization sets MusicBrainz user agent."""
     mock_set_useragent = mocker.patch('musicbrainzngs.set_useragent')
@@ -231,6 +257,33 @@ This is a #series I watched.
     assert media_type == 'series'
 
 
+@pytest.mark.parametrize("tags,expected", [
+    ("[series, Movie]", 'movie'),    # Priority order, not list position
+    ("[drama, 2001, BOOK]", 'book'),
+    ("[drama, comedy]", None),
+])
+def test_get_media_type_tag_priority(poster_downloader_tmdb, tmp_path, tags, expected):
+    """Test frontmatter tags pick the highest-priority media type, ignoring other tags."""
+    file = tmp_path / 'test.md'
+    file.write_text(f"---\ntags: {tags}\n---\n")
+
+    assert poster_downloader_tmdb.get_media_type_from_tags(file) == expected
+
+
+@pytest.mark.parametrize("body,expected", [
+    ("Notes #series then #movie", 'movie'),   # Priority order, not position
+    ("#GAME night", 'game'),
+    ("#movies list", 'movie'),                # Substring match
+    ("no hashtags here", None),
+])
+def test_get_media_type_hashtag_priority(poster_downloader_tmdb, tmp_path, body, expected):
+    """Test hashtag detection is case-insensitive and follows media-type priority."""
+    file = tmp_path / 'test.md'
+    file.write_text(f"# Title\n\n{body}\n")
+
+    assert poster_downloader_tmdb.get_media_type_from_tags(file) == expected
+
+
 def test_get_media_type_yaml_takes_priority(poster_downloader_tmdb, tmp_path):
     """Test that YAML tags take priority over hashtags."""
     file = tmp_path / 'test.md'
@@ -352,6 +405,286 @@ def test_find_media_files_recursive(poster_downloader_tmdb, tmp_path):
     assert files[0][0].name == 'Movie.md'
 
 
+def test_find_media_files_keeps_walk_order(poster_downloader_tmdb, tmp_path, monkeypatch):
+    """Test that notes read on the thread pool are reported in walk order."""
+    monkeypatch.setattr(poster_downloader, '_SCAN_WORKERS', 3)
+    for folder in (tmp_path, tmp_path / 'Movies', tmp_path / 'Movies' / 'Old', tmp_path / 'TV'):
+        folder.mkdir(exist_ok=True)
+        for i in range(4):
+            (folder / f'Movie{i}.md').write_text('---\ntags: [movie]\n---\n')
+
+    files = poster_downloader_tmdb.find_media_files()
+
+    assert [f[0] for f in files] == list(tmp_path.rglob('*.md'))
+
+
+def test_find_media_files_reads_notes_during_walk(poster_downloader_tmdb, tmp_path, monkeypatch):
+    """Test notes are read while the walk is still listing the rest of the vault."""
+    (tmp_path / 'A').mkdir()
+    (tmp_path / 'A' / 'Movie.md').write_text('---\ntags: [movie]\n---\n')
+    (tmp_path / 'B').mkdir()
+    (tmp_path / 'B' / 'Series.md').write_text('---\ntags: [series]\n---\n')
+    first_read = threading.Event()
+    real_load_note = poster_downloader._load_note
+    real_iter = poster_downloader._iter_markdown_files
+
+    def load_note(path, stat=None):
+        first_read.set()
+        return real_load_note(path, stat)
+
+    def iter_markdown_files(root):
+        entries = real_iter(root)
+        yield next(entries)
+        # The first note must be picked up before the walk moves on
+        assert first_read.wait(timeout=5)
+        yield from entries
+
+    monkeypatch.setattr(poster_downloader, '_load_note', load_note)
+    monkeypatch.setattr(poster_downloader, '_iter_markdown_files', iter_markdown_files)
+
+    files = poster_downloader_tmdb.find_media_files()
+
+    assert [f[0] for f in files] == list(tmp_path.rglob('*.md'))
+
+
+def test_find_media_files_reports_unreadable_entries(poster_downloader_tmdb, tmp_path, capsys):
+    """Test that an unreadable note is reported and the scan continues."""
+    (tmp_path / 'Broken.md').write_bytes(b'---\ntags: [\xff]\n---\n')
+    (tmp_path / 'Movie.md').write_text('---\ntags: [movie]\n---\n')
+
+    files = poster_downloader_tmdb.find_media_files()
+
+    assert [f[0].name for f in files] == ['Movie.md']
+    assert 'Error reading' in capsys.readouterr().out
+
+
+def test_find_media_files_skips_non_notes(poster_downloader_tmdb, tmp_path):
+    """Test directories named '*.md', other extensions and symlinked dirs are not scanned."""
+    (tmp_path / 'Folder.md').mkdir()
+    (tmp_path / 'Movie.md.bak').write_text('---\ntags: [movie]\n---\n')
+    real = tmp_path / 'Real'
+    real.mkdir()
+    (real / 'Movie.md').write_text('---\ntags: [movie]\n---\n')
+    (tmp_path / 'Link').symlink_to(real, target_is_directory=True)
+
+    files = poster_downloader_tmdb.find_media_files()
+
+    assert files == [(real / 'Movie.md', 'movie')]
+
+
+def test_find_media_files_parses_each_note_once(poster_downloader_tmdb, tmp_path, mocker):
+    """Test that tag detection and the poster check share one parse per file."""
+    (tmp_path / 'Movie.md').write_text('---\ntags: [movie]\n---\n# Movie')
+    (tmp_path / 'Series.md').write_text('---\ntags: [series]\nposter: x.jpg\n---\n# Series')
+    spy = mocker.spy(poster_downloader, 'split_yaml_frontmatter')
+
+    files = poster_downloader_tmdb.find_media_files()
+
+    assert [f[0].name for f in files] == ['Movie.md']
+    assert spy.call_count == 2
+
+
+def test_find_media_files_uses_one_inspection_per_note(poster_downloader_tmdb, tmp_path, mocker):
+    """Test the scan reads media type and poster flag from one _Note, not the public checks."""
+    (tmp_path / 'Movie.md').write_text('---\ntags: [movie]\n---\n')
+    (tmp_path / 'Done.md').write_text('---\ntags: [movie]\nposter: done.jpg\n---\n')
+    media_type = mocker.patch.object(poster_downloader_tmdb, 'get_media_type_from_tags')
+    has_poster = mocker.patch.object(poster_downloader_tmdb, 'already_has_poster')
+    parse = mocker.spy(poster_downloader, '_parse_note')
+
+    files = poster_downloader_tmdb.find_media_files()
+
+    assert [(f[0].name, f[1]) for f in files] == [('Movie.md', 'movie')]
+    assert parse.call_count == 2
+    media_type.assert_not_called()
+    has_poster.assert_not_called()
+
+
+def test_note_cache_rereads_modified_file(poster_downloader_tmdb, tmp_path):
+    """Test that editing a note invalidates its cached parse."""
+    file = tmp_path / 'test.md'
+    file.write_text('---\ntags: [movie]\n---\n')
+    assert poster_downloader_tmdb.already_has_poster(file) is False
+
+    file.write_text('---\ntags: [movie]\nposter: a.jpg\n---\n')
+    stat = file.stat()
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert poster_downloader_tmdb.already_has_poster(file) is True
+
+
+def test_get_media_type_unreadable_file(poster_downloader_tmdb, tmp_path, capsys):
+    """Test that a missing file reports an error and yields no media type."""
+    missing = tmp_path / 'gone.md'
+
+    assert poster_downloader_tmdb.get_media_type_from_tags(missing) is None
+    assert poster_downloader_tmdb.already_has_poster(missing) is False
+    assert 'Error reading' in capsys.readouterr().out
+
+
+def test_get_media_type_reads_only_frontmatter_when_tagged(poster_downloader_tmdb, tmp_path):
+    """Test a frontmatter media tag settles the type without decoding the body."""
+    file = tmp_path / 'test.md'
+    # Invalid UTF-8 past the frontmatter would raise if the whole file were read
+    file.write_bytes(b'---\ntags: [movie]\n---\n' + b'x' * 10_000 + b'\xff')
+
+    assert poster_downloader_tmdb.get_media_type_from_tags(file) == 'movie'
+
+
+@pytest.mark.parametrize("content,expected", [
+    ('---\ntitle: A long title\ntags: [game]\n---\nbody', 'game'),
+    ('---\ntitle: A long title\ntags: [note]\n---\nbody #album', 'album'),
+    ('---\ntitle: never closed\n#series', 'series'),
+])
+def test_get_media_type_frontmatter_across_chunks(poster_downloader_tmdb, tmp_path, monkeypatch,
+                                                  content, expected):
+    """Test the frontmatter is found when its closing '---' spans read chunks."""
+    monkeypatch.setattr(poster_downloader, '_HEAD_CHUNK', 4)
+    file = tmp_path / 'test.md'
+    file.write_text(content)
+
+    assert poster_downloader_tmdb.get_media_type_from_tags(file) == expected
+
+
+def test_get_media_type_malformed_yaml_uses_hashtags(poster_downloader_tmdb, tmp_path):
+    """Test that unparseable frontmatter is ignored in favour of hashtags."""
+    file = tmp_path / 'test.md'
+    file.write_text("---\ntags: [movie, action\n---\n\n#game\n")
+
+    assert poster_downloader_tmdb.get_media_type_from_tags(file) == 'game'
+
+
+def test_find_media_files_skips_yaml_for_simple_notes(poster_downloader_tmdb, tmp_path, mocker):
+    """Test notes in the layout the add command writes are never YAML-parsed."""
+    (tmp_path / 'Movie.md').write_text('---\ntags:\n  - movie\n  - drama\n---\n# Movie')
+    (tmp_path / 'Odd.md').write_text('---\ntags: [movie]\nposter: [[odd.jpg]]\n---\n# Odd')
+    spy = mocker.spy(yaml, 'load')
+
+    files = poster_downloader_tmdb.find_media_files()
+
+    assert [f[0].name for f in files] == ['Movie.md']
+    assert spy.call_count == 1  # Only the nested-list poster needed the parser
+
+
+def test_find_media_files_parses_shared_frontmatter_once(
+    poster_downloader_tmdb, tmp_path, mocker, monkeypatch
+):
+    """Test notes with identical (non-simple) frontmatter share one YAML parse."""
+    # One worker: concurrent first parses of the same text may both miss the cache
+    monkeypatch.setattr(poster_downloader, '_SCAN_WORKERS', 1)
+    for name in ('A.md', 'B.md', 'C.md'):
+        (tmp_path / name).write_text(f'---\ntags: [movie]\nmeta:\n  rating: 5\n---\n# {name}')
+    spy = mocker.spy(yaml, 'load')
+
+    files = poster_downloader_tmdb.find_media_files()
+
+    assert sorted(f[0].name for f in files) == ['A.md', 'B.md', 'C.md']
+    assert spy.call_count == 1
+
+
+@responses.activate
+def test_process_file_reuses_session(poster_downloader_tmdb, tmp_path, mocker):
+    """Test the TMDB search and the poster download share one pooled session."""
+    file = tmp_path / 'Inception (2010).md'
+    file.write_text('---\ntags: [movie]\n---\n')
+    responses.add(
+        responses.GET,
+        'https://api.themoviedb.org/3/search/movie',
+        json={'results': [{'title': 'Inception', 'release_date': '2010-07-16',
+                           'poster_path': '/inception.jpg'}]},
+        status=200
+    )
+    download = mocker.patch('lib.poster_downloader.download_and_resize_poster', return_value=True)
+    mocker.patch('lib.poster_downloader.update_frontmatter_with_poster', return_value=True)
+    spy = mocker.spy(poster_downloader_tmdb._session, 'get')
+
+    assert poster_downloader_tmdb.process_file(file, 'movie') is True
+
+    assert spy.call_count == 1
+    assert download.call_args.kwargs['session'] is poster_downloader_tmdb._session
+
+
+# ============================================================================
+# Tests for prefetch_searches()
+# ============================================================================
+
+@responses.activate
+def test_prefetch_searches_fills_search_cache(poster_downloader_tmdb, tmp_path, mocker):
+    """Test prefetched TMDB titles are served from cache; other types are left alone."""
+    for name in ('Dune', 'Alien', 'Heat'):
+        responses.add(
+            responses.GET,
+            'https://api.themoviedb.org/3/search/movie',
+            match=[responses.matchers.query_param_matcher(
+                {'api_key': 'test_tmdb_key', 'query': name, 'language': 'en-US'})],
+            json={'results': [{'title': name}]},
+            status=200
+        )
+    search_igdb = mocker.patch.object(poster_downloader_tmdb, 'search_igdb', return_value=[])
+    media_files = [
+        (tmp_path / 'Dune (1984).md', 'movie'),
+        (tmp_path / 'Dune (2021).md', 'movie'),
+        (tmp_path / 'Alien.md', 'movie'),
+        (tmp_path / 'Heat (1995).md', 'movie'),
+        (tmp_path / 'Hades.md', 'game'),
+    ]
+
+    poster_downloader_tmdb.prefetch_searches(media_files)
+
+    assert len(responses.calls) == 3
+    search_igdb.assert_not_called()
+    assert poster_downloader_tmdb.search_api('Heat', 'movie') == ([{'title': 'Heat'}], 'tmdb')
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_prefetch_searches_ignores_failures(poster_downloader_tmdb, tmp_path, capsys):
+    """Test a failed prefetch is silent and leaves the title uncached."""
+    responses.add(responses.GET, 'https://api.themoviedb.org/3/search/movie', status=500)
+    responses.add(responses.GET, 'https://api.themoviedb.org/3/search/tv', status=500)
+
+    poster_downloader_tmdb.prefetch_searches([
+        (tmp_path / 'Dune.md', 'movie'),
+        (tmp_path / 'Loot.md', 'series'),
+    ])
+
+    assert capsys.readouterr().out == ''
+    assert poster_downloader_tmdb._search_cache == {}
+
+
+@responses.activate
+def test_prefetch_searches_isolates_worker_failures(poster_downloader_tmdb, tmp_path, mocker):
+    """Test one failing worker search spares the others and the serial pass retries it."""
+    def add_search(name, **kwargs):
+        responses.add(
+            responses.GET,
+            'https://api.themoviedb.org/3/search/movie',
+            match=[responses.matchers.query_param_matcher(
+                {'api_key': 'test_tmdb_key', 'query': name, 'language': 'en-US'})],
+            **kwargs
+        )
+    for name in ('Dune', 'Heat'):
+        add_search(name, json={'results': [{'title': name, 'poster_path': f'/{name}.jpg'}]})
+    add_search('Alien', body=requests.ConnectionError('reset'))
+    add_search('Alien', json={'results': [{'title': 'Alien', 'poster_path': '/Alien.jpg'}]})
+    files = []
+    for name in ('Dune', 'Alien', 'Heat'):
+        file = tmp_path / f'{name}.md'
+        file.write_text('---\ntags: [movie]\n---\n')
+        files.append((file, 'movie'))
+    shared_get = mocker.spy(poster_downloader_tmdb._session, 'get')
+
+    poster_downloader_tmdb.prefetch_searches(files)
+
+    assert shared_get.call_count == 0  # Workers search over their own sessions
+    assert set(poster_downloader_tmdb._search_cache) == {('dune', 'movie'), ('heat', 'movie')}
+
+    mocker.patch('lib.poster_downloader.download_and_resize_poster', return_value=True)
+    mocker.patch('lib.poster_downloader.update_frontmatter_with_poster', return_value=True)
+    assert all(poster_downloader_tmdb.process_file(*f) for f in files)
+    assert shared_get.call_count == 1  # Only Alien is searched again
+
+
 # ============================================================================
 # Tests for search_tmdb()
 # ============================================================================
@@ -473,6 +806,35 @@ def test_search_api_routes_movie_to_tmdb(poster_downloader_tmdb):
     assert len(results) > 0
 
 
+@responses.activate
+def test_search_api_caches_results_per_title(poster_downloader_tmdb):
+    """Test repeated searches for one title (any case/spacing) hit the API once."""
+    responses.add(
+        responses.GET,
+        'https://api.themoviedb.org/3/search/movie',
+        json={'results': [{'title': 'Dune'}]},
+        status=200
+    )
+
+    first, _ = poster_downloader_tmdb.search_api('Dune', 'movie')
+    second, api_used = poster_downloader_tmdb.search_api('  dune ', 'movie')
+
+    assert second == first
+    assert api_used == 'tmdb'
+    assert len(responses.calls) == 1
+
+
+def test_search_api_does_not_cache_empty_results(poster_downloader_tmdb, mocker):
+    """Test empty (possibly failed) searches are retried."""
+    search = mocker.patch.object(
+        poster_downloader_tmdb, 'search_googlebooks', side_effect=[[], [{'title': 'Dune'}]]
+    )
+
+    assert poster_downloader_tmdb.search_api('Dune', 'book') == ([], 'googlebooks')
+    assert poster_downloader_tmdb.search_api('Dune', 'book') == ([{'title': 'Dune'}], 'googlebooks')
+    assert search.call_count == 2
+
+
 @responses.activate
 def test_search_api_routes_series_to_tmdb(poster_downloader_tmdb):
     """Test that series searches route to TMDB."""
@@ -498,7 +860,7 @@ def test_get_poster_url_from_result_tmdb(poster_downloader_tmdb):
 
     url = poster_downloader_tmdb.get_poster_url_from_result(result, 'tmdb')
 
-    assert url == 'https://image.tmdb.org/t/p/original/abc123.jpg'
+    assert url == 'https://image.tmdb.org/t/p/w342/abc123.jpg'
 
 
 def test_get_poster_url_from_result_tmdb_missing(poster_downloader_tmdb):
@@ -510,6 +872,23 @@ def test_get_poster_url_from_result_tmdb_missing(poster_downloader_tmdb):
     assert url is None
 
 
+@pytest.mark.parametrize("poster_width,size", [
+    (60, 'w92'),
+    (200, 'w342'),
+    (300, 'w500'),
+    (400, 'w780'),
+    (600, 'original'),
+])
+def test_get_poster_url_from_result_tmdb_sized(tmp_path, poster_width, size):
+    """Test TMDB posters use the smallest CDN size at least 1.5x the target width."""
+    downloader = PosterDownloader(vault_path=tmp_path, tmdb_api_key='test_tmdb_key',
+                                  poster_width=poster_width)
+
+    url = downloader.get_poster_url_from_result({'poster_path': '/abc123.jpg'}, 'tmdb')
+
+    assert url == f'https://image.tmdb.org/t/p/{size}/abc123.jpg'
+
+
 def test_get_poster_url_from_result_igdb(poster_downloader_tmdb):
     """Test extracting poster URL from IGDB result."""
     result = {'cover': {'image_id': 'co4thl'}}
@@ -655,8 +1034,7 @@ def test_prompt_disambiguation_movie(poster_downloader_tmdb, mocker):
         {'title': 'Movie 2', 'release_date': '2021-01-01', 'overview': 'Another movie'}
     ]
 
-    inputs = iter(['1'])
-    mocker.patch('lib.poster_downloader.get_user_input', lambda prompt: next(inputs))
+    mocker.patch('lib.poster_downloader.get_user_input', side_effect=['1'])
 
     result = poster_downloader_tmdb.prompt_disambiguation('Movie', results, 'movie', 'tmdb')
 
@@ -668,8 +1046,7 @@ def test_prompt_disambiguation_displays_emoji(poster_downloader_tmdb, mocker, ca
     """Test that disambiguation displays appropriate emoji."""
     results = [{'title': 'Test', 'release_date': '2020-01-01', 'overview': 'Test'}]
 
-    inputs = iter(['1'])
-    mocker.patch('lib.poster_downloader.get_user_input', lambda prompt: next(inputs))
+    mocker.patch('lib.poster_downloader.get_user_input', side_effect=['1'])
 
     poster_downloader_tmdb.prompt_disambiguation('Test', results, 'movie', 'tmdb')
 
@@ -681,8 +1058,7 @@ def test_prompt_disambiguation_skip(poster_downloader_tmdb, mocker):
     """Test skipping disambiguation."""
     results = [{'title': 'Test', 'release_date': '2020-01-01', 'overview': 'Test'}]
 
-    inputs = iter(['0'])
-    mocker.patch('lib.poster_downloader.get_user_input', lambda prompt: next(inputs))
+    mocker.patch('lib.poster_downloader.get_user_input', side_effect=['0'])
 
     result = poster_downloader_tmdb.prompt_disambiguation('Test', results, 'movie', 'tmdb')
 
@@ -719,7 +1095,7 @@ def test_process_file_success(poster_downloader_tmdb, tmp_path, mocker):
     # Mock poster download
     responses.add(
         responses.GET,
-        'https://image.tmdb.org/t/p/original/test.jpg',
+        'https://image.tmdb.org/t/p/w342/test.jpg',
         body=b'fake image data',
         status=200
     )
@@ -736,6 +1112,68 @@ def test_process_file_success(poster_downloader_tmdb, tmp_path, mocker):
     # The poster file may not actually exist due to mocking, but the code path ran.
 
 
+@responses.activate
+def test_process_file_copies_poster_saved_this_run(poster_downloader_tmdb, tmp_path, mocker):
+    """Test a second note resolving to the same poster URL copies the saved file."""
+    first = tmp_path / 'Inception (2010).md'
+    second = tmp_path / 'Copy' / 'Inception (2010).md'
+    second.parent.mkdir()
+    for file in (first, second):
+        file.write_text('---\ntags: [movie]\n---\n# Inception')
+    responses.add(
+        responses.GET,
+        'https://api.themoviedb.org/3/search/movie',
+        json={'results': [{'title': 'Inception', 'release_date': '2010-07-16',
+                           'poster_path': '/test.jpg'}]},
+    )
+    download = mocker.patch(
+        'lib.poster_downloader.download_and_resize_poster',
+        side_effect=lambda url, path, *args, **kwargs: path.write_bytes(b'jpeg') or True
+    )
+
+    assert poster_downloader_tmdb.process_file(first, 'movie') is True
+    assert poster_downloader_tmdb.process_file(second, 'movie') is True
+
+    assert download.call_count == 1
+    assert (second.parent / 'Inception (2010).jpg').read_bytes() == b'jpeg'
+    assert "poster: '[[Inception (2010).jpg]]'" in second.read_text()
+
+
+@responses.activate
+def test_process_file_downloads_when_saved_poster_is_gone(
+    poster_downloader_tmdb, tmp_path, mocker
+):
+    """Test a saved poster that can't be copied falls back to a download, keeping any
+    existing poster if that fails too."""
+    first = tmp_path / 'Inception (2010).md'
+    second = tmp_path / 'Copy' / 'Inception (2010).md'
+    second.parent.mkdir()
+    for file in (first, second):
+        file.write_text('---\ntags: [movie]\n---\n# Inception')
+    responses.add(
+        responses.GET,
+        'https://api.themoviedb.org/3/search/movie',
+        json={'results': [{'title': 'Inception', 'release_date': '2010-07-16',
+                           'poster_path': '/test.jpg'}]},
+    )
+    download = mocker.patch(
+        'lib.poster_downloader.download_and_resize_poster',
+        side_effect=lambda url, path, *args, **kwargs: path.write_bytes(b'jpeg') or True
+    )
+
+    assert poster_downloader_tmdb.process_file(first, 'movie') is True
+    (tmp_path / 'Inception (2010).jpg').unlink()
+    existing = second.parent / 'Inception (2010).jpg'
+    existing.write_bytes(b'old poster')
+    download.side_effect = None
+    download.return_value = False
+
+    assert poster_downloader_tmdb.process_file(second, 'movie') is False
+
+    assert download.call_count == 2
+    assert existing.read_bytes() == b'old poster'
+
+
 @responses.activate
 def test_process_file_no_results(poster_downloader_tmdb, tmp_path, capsys):
     """Test processing file with no search results."""
@@ -1,13 +1,21 @@
 """Unit tests for lib/poster_utils.py"""
 
 import io
+import os
 
+import pytest
+import requests
 import responses
-from PIL import Image
+import yaml
+from PIL import Image, JpegImagePlugin
 
+from lib import poster_utils
 from lib.poster_utils import (
+    add_poster_to_note,
     download_and_resize_poster,
     extract_yaml_frontmatter,
+    make_session,
+    scan_tags_and_poster,
     update_frontmatter_with_poster,
 )
 
@@ -41,6 +49,62 @@ def test_extract_yaml_frontmatter_malformed(sample_markdown_malformed_yaml):
     assert remaining == sample_markdown_malformed_yaml
 
 
+def test_extract_yaml_frontmatter_rejects_python_tags():
+    """Test the (C) loader stays safe: Python object tags are a parse error."""
+    content = "---\nposter: !!python/object/apply:os.getcwd []\n---\n# Note"
+
+    frontmatter, remaining = extract_yaml_frontmatter(content)
+
+    assert frontmatter is None
+    assert remaining == content
+
+
+@pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML built without libyaml")
+def test_extract_yaml_frontmatter_uses_libyaml():
+    """Test frontmatter is parsed and dumped with libyaml's C bindings when available."""
+    assert poster_utils.YamlLoader is yaml.CSafeLoader
+    assert poster_utils.YamlDumper is yaml.CSafeDumper
+
+
+# ============================================================================
+# Tests for scan_tags_and_poster
+# ============================================================================
+
+@pytest.mark.parametrize("frontmatter_text", [
+    "\ntags:\n  - movie\n  - sci-fi\nposter: '[[Dune (2021).jpg]]'\n",
+    "\ntags: [MOVIE, Action]\ntitle: Test Movie\n",
+    "\ntags:\n- game\nposter:\n",
+    "\n# comment\ntags: movie\nposter: \"\"\n",
+    "\ntags: []\nposter: x.jpg\nposter: ''\n",
+    "\ntags: [movie, drama,]\nposter:\ntitle: Dune\n",
+])
+def test_scan_tags_and_poster_matches_yaml(frontmatter_text):
+    """Test the fast frontmatter scan agrees with yaml.safe_load on tags/poster."""
+    parsed = yaml.safe_load(frontmatter_text)
+
+    assert scan_tags_and_poster(frontmatter_text) == {
+        key: parsed[key] for key in ('tags', 'poster') if key in parsed
+    }
+
+
+@pytest.mark.parametrize("frontmatter_text", [
+    "\nposter: [[movie.jpg]]\n",            # Nested flow sequence
+    "\ntags: [movie, action\n",             # Unterminated (invalid YAML)
+    "\ntitle: Movie: Subtitle\n",           # Invalid plain scalar
+    "\ncast:\n  lead: Someone\n",          # Nested mapping
+    "\ndescription: |\n  text\n",          # Block scalar
+    "\nposter: null\n",                     # Non-string poster
+    "\ntags:\n  - movie\n - drama\n",     # Inconsistent indentation
+    "\n- movie\n",                         # Top-level sequence
+    "\ntags:movie\n",                      # Not a key/value pair
+    "\ntags: [movie,, drama]\n",           # Empty flow entry
+    "\ntags:\n  - movie\n  - &a drama\n",  # Anchor
+])
+def test_scan_tags_and_poster_defers_to_yaml(frontmatter_text):
+    """Test that anything beyond the flat key/list layout falls back to YAML."""
+    assert scan_tags_and_poster(frontmatter_text) is None
+
+
 # ============================================================================
 # Tests for download_and_resize_poster - Success Cases
 # ============================================================================
@@ -113,6 +177,27 @@ def test_download_and_resize_poster_rgba(tmp_path, test_images):
     assert resized.width == 150
 
 
+@responses.activate
+def test_download_and_resize_poster_alpha_composited_on_white(tmp_path):
+    """Test transparency (here a grayscale+alpha source) is flattened onto white."""
+    img_bytes = io.BytesIO()
+    Image.new('LA', (200, 300), color=(0, 0)).save(img_bytes, format='PNG')
+
+    responses.add(
+        responses.GET,
+        'https://example.com/poster.png',
+        body=img_bytes.getvalue(),
+        status=200
+    )
+
+    output_path = tmp_path / 'output.jpg'
+    assert download_and_resize_poster('https://example.com/poster.png', output_path)
+
+    resized = Image.open(output_path)
+    assert resized.mode == 'RGB'
+    assert all(channel > 250 for channel in resized.getpixel((100, 150)))
+
+
 @responses.activate
 def test_download_and_resize_poster_grayscale(tmp_path, test_images):
     """Test downloading and resizing grayscale image."""
@@ -265,6 +350,129 @@ def test_download_and_resize_poster_large_to_small(tmp_path, test_images):
     assert resized.height == 300
 
 
+@responses.activate
+def test_download_and_resize_poster_large_jpeg_reduced_decode(tmp_path, mocker):
+    """Test large JPEGs are decoded at reduced scale but still resized exactly."""
+    img_bytes = io.BytesIO()
+    Image.new('RGB', (2000, 3000), color='red').save(img_bytes, format='JPEG')
+
+    responses.add(
+        responses.GET,
+        'https://example.com/original.jpg',
+        body=img_bytes.getvalue(),
+        status=200
+    )
+    draft = mocker.spy(JpegImagePlugin.JpegImageFile, 'draft')
+
+    output_path = tmp_path / 'poster.jpg'
+    assert download_and_resize_poster(
+        'https://example.com/original.jpg', output_path, poster_width=200
+    )
+
+    # 2000x3000 → decoded at 1/4 (500x750), which still covers 2x the 200x300 target
+    assert draft.spy_return[1] == (0, 0, 500, 750)
+    assert Image.open(output_path).size == (200, 300)
+
+
+@responses.activate
+def test_download_and_resize_poster_sized_jpeg_decoded_full_scale(tmp_path, mocker):
+    """Test a CDN-sized JPEG under 2x the target (e.g. TMDB w342) isn't draft-scaled."""
+    img_bytes = io.BytesIO()
+    Image.new('RGB', (342, 513), color='red').save(img_bytes, format='JPEG')
+
+    responses.add(
+        responses.GET,
+        'https://example.com/w342.jpg',
+        body=img_bytes.getvalue(),
+        status=200
+    )
+    draft = mocker.spy(JpegImagePlugin.JpegImageFile, 'draft')
+
+    output_path = tmp_path / 'poster.jpg'
+    assert download_and_resize_poster(
+        'https://example.com/w342.jpg', output_path, poster_width=200
+    )
+
+    # Halving would drop below 2x the 200x300 target, so libjpeg decodes at full scale
+    assert draft.spy_return[1] == (0, 0, 342, 513)
+    assert Image.open(output_path).size == (200, 300)
+
+
+@responses.activate
+def test_download_and_resize_poster_large_png_box_reduced(tmp_path, mocker):
+    """Test large non-JPEG sources are box-reduced before the LANCZOS pass."""
+    img_bytes = io.BytesIO()
+    Image.new('RGB', (500, 750), color='green').save(img_bytes, format='PNG')
+
+    responses.add(
+        responses.GET,
+        'https://example.com/cover.png',
+        body=img_bytes.getvalue(),
+        status=200
+    )
+    reduce = mocker.spy(Image.Image, 'reduce')
+
+    output_path = tmp_path / 'poster.jpg'
+    assert download_and_resize_poster(
+        'https://example.com/cover.png', output_path, poster_width=50
+    )
+
+    # 10x larger than the target with a gap of 3 → integer reduce by 3 first
+    assert reduce.call_args.args[1] == (3, 3)
+    assert Image.open(output_path).size == (50, 75)
+
+
+@responses.activate
+def test_download_and_resize_poster_frees_source_before_encode(tmp_path, mocker):
+    """Test the full-size source is closed once resized, before the JPEG is encoded."""
+    img_bytes = io.BytesIO()
+    Image.new('RGB', (800, 1200), color='red').save(img_bytes, format='PNG')
+
+    responses.add(
+        responses.GET,
+        'https://example.com/cover.png',
+        body=img_bytes.getvalue(),
+        status=200
+    )
+    events = []
+    close = Image.Image.close
+    save = Image.Image.save
+    mocker.patch.object(Image.Image, 'close', autospec=True,
+                        side_effect=lambda img: events.append(('close', img.size)) or close(img))
+    mocker.patch.object(Image.Image, 'save', autospec=True,
+                        side_effect=lambda img, *a, **kw: events.append(('save', img.size))
+                        or save(img, *a, **kw))
+
+    assert download_and_resize_poster(
+        'https://example.com/cover.png', tmp_path / 'poster.jpg', poster_width=200
+    )
+
+    assert events[:2] == [('close', (800, 1200)), ('save', (200, 300))]
+
+
+@responses.activate
+def test_download_and_resize_poster_already_target_size(tmp_path, mocker):
+    """Test an image served at the target size is re-encoded without resampling."""
+    img_bytes = io.BytesIO()
+    Image.new('RGB', (200, 300), color='red').save(img_bytes, format='JPEG')
+
+    responses.add(
+        responses.GET,
+        'https://example.com/sized.jpg',
+        body=img_bytes.getvalue(),
+        status=200
+    )
+    resize = mocker.spy(Image.Image, 'resize')
+
+    output_path = tmp_path / 'poster.jpg'
+    assert download_and_resize_poster(
+        'https://example.com/sized.jpg', output_path, poster_width=200
+    )
+
+    resize.assert_not_called()
+    assert Image.open(output_path).size == (200, 300)
+
+
 @responses.activate
 def test_download_and_resize_poster_small_to_large(tmp_path, test_images):
     """Test upsizing small image."""
@@ -322,6 +530,109 @@ def test_download_and_resize_poster_custom_width(tmp_path, test_images):
     assert resized.width == 300
 
 
+def test_make_session_pools_https_connections():
+    """Test sessions are built with a sized HTTPS connection pool."""
+    assert make_session().get_adapter('https://example.com')._pool_maxsize == 20
+    assert make_session(pool_maxsize=1).get_adapter('https://example.com')._pool_maxsize == 1
+
+
+@responses.activate
+def test_download_and_resize_poster_uses_given_session(tmp_path, test_images, mocker):
+    """Test that a caller-supplied session is used for the download."""
+    img_bytes = io.BytesIO()
+    test_images['rgb'].save(img_bytes, format='PNG')
+    responses.add(responses.GET, 'https://example.com/poster.png', body=img_bytes.getvalue())
+    session = requests.Session()
+    spy = mocker.spy(session, 'get')
+
+    assert download_and_resize_poster(
+        'https://example.com/poster.png', tmp_path / 'poster.jpg', session=session
+    )
+    spy.assert_called_once_with('https://example.com/poster.png', stream=True, timeout=15)
+
+
+@responses.activate
+def test_download_and_resize_poster_defaults_to_shared_session(tmp_path, test_images, mocker):
+    """Test downloads without a session reuse the module's pooled session."""
+    img_bytes = io.BytesIO()
+    test_images['rgb'].save(img_bytes, format='PNG')
+    responses.add(responses.GET, 'https://example.com/poster.png', body=img_bytes.getvalue())
+    spy = mocker.spy(poster_utils._SESSION, 'get')
+
+    for name in ('a.jpg', 'b.jpg'):
+        assert download_and_resize_poster('https://example.com/poster.png', tmp_path / name)
+
+    assert spy.call_count == 2
+
+
+@responses.activate
+def test_download_and_resize_poster_spools_large_download(tmp_path, test_images, monkeypatch):
+    """Test a download larger than the in-memory spool limit still converts."""
+    monkeypatch.setattr(poster_utils, '_SPOOL_MAX_SIZE', 1024)
+    monkeypatch.setattr(poster_utils, '_DOWNLOAD_CHUNK_SIZE', 512)
+    img_bytes = io.BytesIO()
+    test_images['large'].save(img_bytes, format='PNG')
+    responses.add(responses.GET, 'https://example.com/large.png', body=img_bytes.getvalue())
+
+    output_path = tmp_path / 'poster.jpg'
+    assert download_and_resize_poster('https://example.com/large.png', output_path)
+    assert Image.open(output_path).size == (200, 300)
+
+
+@responses.activate
+def test_download_and_resize_poster_writes_atomically(tmp_path, test_images, mocker, monkeypatch):
+    """Test a new poster gets umask-default permissions without touching the process umask."""
+    img_bytes = io.BytesIO()
+    test_images['rgb'].save(img_bytes, format='PNG')
+    responses.add(responses.GET, 'https://example.com/poster.png', body=img_bytes.getvalue())
+    monkeypatch.setattr(poster_utils, '_UMASK', 0o027)
+    umask = mocker.spy(poster_utils.os, 'umask')
+
+    assert download_and_resize_poster('https://example.com/poster.png', tmp_path / 'p.jpg')
+
+    assert (tmp_path / 'p.jpg').stat().st_mode & 0o777 == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ['p.jpg']
+    umask.assert_not_called()
+
+
+@responses.activate
+def test_download_and_resize_poster_replaces_symlink_target(tmp_path, test_images):
+    """Test an existing poster keeps its mode, and a symlinked one keeps its link."""
+    img_bytes = io.BytesIO()
+    test_images['rgb'].save(img_bytes, format='PNG')
+    responses.add(responses.GET, 'https://example.com/poster.png', body=img_bytes.getvalue())
+    target = tmp_path / 'real.jpg'
+    target.write_bytes(b'old poster')
+    target.chmod(0o600)
+    link = tmp_path / 'poster.jpg'
+    link.symlink_to(target)
+
+    assert download_and_resize_poster('https://example.com/poster.png', link)
+
+    assert link.is_symlink()
+    assert Image.open(target).size == (200, 300)
+    assert target.stat().st_mode & 0o777 == 0o600
+
+
+@responses.activate
+def test_download_and_resize_poster_failed_write_keeps_existing(
+    tmp_path, test_images, mocker, capsys
+):
+    """Test a failure while replacing an existing poster leaves it untouched."""
+    img_bytes = io.BytesIO()
+    test_images['rgb'].save(img_bytes, format='PNG')
+    responses.add(responses.GET, 'https://example.com/poster.png', body=img_bytes.getvalue())
+    output_path = tmp_path / 'poster.jpg'
+    output_path.write_bytes(b'old poster')
+    mocker.patch('lib.poster_utils.os.replace', side_effect=OSError('disk full'))
+
+    assert download_and_resize_poster('https://example.com/poster.png', output_path) is False
+
+    assert output_path.read_bytes() == b'old poster'
+    assert [p.name for p in tmp_path.iterdir()] == ['poster.jpg']
+    assert 'disk full' in capsys.readouterr().out
+
+
 # ============================================================================
 # Tests for download_and_resize_poster - Error Cases
 # ============================================================================
@@ -443,6 +754,57 @@ poster: [[old_poster.jpg]]
     assert '[[old_poster.jpg]]' not in new_content
 
 
+def test_update_frontmatter_with_poster_edits_simple_frontmatter_in_place(tmp_path, mocker):
+    """Test simple frontmatter gets its poster line set without a YAML round trip."""
+    file_path = tmp_path / 'test.md'
+    file_path.write_text("---\ntitle: Test Movie\n# rating later\nposter: old.jpg\n"
+                         "tags: [movie, action]\n---\n\n# Content\n")
+    load = mocker.spy(yaml, 'load')
+
+    assert update_frontmatter_with_poster(file_path, "It's (2020).jpg") is True
+
+    # Comments, flow lists and key order are kept exactly as written
+    assert file_path.read_text() == (
+        "---\ntitle: Test Movie\n# rating later\nposter: '[[It''s (2020).jpg]]'\n"
+        "tags: [movie, action]\n---\n\n# Content\n"
+    )
+    load.assert_not_called()
+
+
+def test_update_frontmatter_with_poster_normalizes_crlf(tmp_path):
+    """Test a CRLF note is rewritten with consistent newlines, not mixed ones."""
+    file_path = tmp_path / 'test.md'
+    file_path.write_bytes(b"---\r\ntitle: Test\r\n---\r\n\r\n# Content\r\n")
+
+    assert update_frontmatter_with_poster(file_path, 'poster.jpg') is True
+
+    expected = "---\ntitle: Test\nposter: '[[poster.jpg]]'\n---\n\n# Content\n"
+    assert file_path.read_bytes() == expected.replace('\n', os.linesep).encode()
+
+
+def test_update_frontmatter_with_poster_unchanged_skips_write(tmp_path, mocker):
+    """Test a note that already links the poster is not rewritten."""
+    file_path = tmp_path / 'test.md'
+    file_path.write_text("---\ntitle: Test\nposter: '[[poster.jpg]]'\n---\n# Content\n")
+    write = mocker.spy(poster_utils, 'atomic_write')
+
+    assert update_frontmatter_with_poster(file_path, 'poster.jpg') is True
+
+    write.assert_not_called()
+
+
+def test_update_frontmatter_with_poster_complex_frontmatter_uses_yaml(tmp_path):
+    """Test frontmatter beyond the simple layout is still rewritten through YAML."""
+    file_path = tmp_path / 'test.md'
+    file_path.write_text("---\ntitle: Test\nmeta:\n  rating: 5\n---\n# Content\n")
+
+    assert update_frontmatter_with_poster(file_path, 'poster.jpg') is True
+
+    assert yaml.safe_load(file_path.read_text().split('---')[1]) == {
+        'title': 'Test', 'meta': {'rating': 5}, 'poster': '[[poster.jpg]]'
+    }
+
+
 def test_update_frontmatter_with_poster_preserves_content(tmp_path, sample_markdown_with_yaml):
     """Test that content after frontmatter is preserved."""
     file_path = tmp_path / 'test.md'
@@ -484,3 +846,114 @@ def test_update_frontmatter_with_poster_malformed_yaml(tmp_path, sample_markdown
     # Should have created valid YAML
     content = file_path.read_text()
     assert "poster: '[[poster.jpg]]'" in content
+
+
+def test_add_poster_to_note(tmp_path):
+    """Test the poster is linked in the frontmatter and embedded after it."""
+    file = tmp_path / 'test.md'
+    file.write_text("""---
+title: Test Movie
+tags: [movie]
+---
+
+## Description
+Test content here.
+""")
+
+    result = add_poster_to_note(file, 'poster.jpg')
+
+    assert result == (True, True)
+
+    # Verify file content
+    content = file.read_text()
+    assert "poster: '[[poster.jpg]]'" in content
+    # Poster should be after frontmatter but before original content
+    assert content.endswith('---\n\n![[poster.jpg]]\n\n## Description\nTest content here.\n')
+
+
+def test_add_poster_to_note_no_frontmatter(tmp_path):
+    """Test a note without frontmatter gets both in one rewrite."""
+    file = tmp_path / 'test.md'
+    file.write_text("# Just a heading\n\nSome content")
+
+    assert add_poster_to_note(file, 'poster.jpg') == (True, True)
+
+    assert file.read_text() == (
+        "---\nposter: '[[poster.jpg]]'\n---\n\n![[poster.jpg]]\n\n# Just a heading\n\nSome content"
+    )
+
+
+def test_add_poster_to_note_already_embedded(tmp_path, mocker):
+    """Test re-running on a note that already has the embed doesn't embed it twice."""
+    file = tmp_path / 'test.md'
+    file.write_text("# Just a heading\n\nSome content")
+    assert add_poster_to_note(file, 'poster.jpg') == (True, True)
+    content = file.read_text()
+    write = mocker.spy(poster_utils, 'atomic_write')
+
+    assert add_poster_to_note(file, 'poster.jpg') == (True, False)
+
+    assert file.read_text() == content
+    assert content.count('![[poster.jpg]]') == 1
+    write.assert_not_called()
+
+
+def test_add_poster_to_note_failure(tmp_path, capsys):
+    """Test a missing note reports neither an update nor an embed."""
+    assert add_poster_to_note(tmp_path / 'missing.md', 'poster.jpg') == (False, False)
+    assert "Error updating frontmatter" in capsys.readouterr().out
+
+
+def test_update_frontmatter_with_poster_keeps_permissions(tmp_path, sample_markdown_with_yaml):
+    """Test the atomic rewrite keeps the note's permission bits and leaves no temp file."""
+    file_path = tmp_path / 'test.md'
+    file_path.write_text(sample_markdown_with_yaml)
+    file_path.chmod(0o644)
+
+    assert update_frontmatter_with_poster(file_path, 'poster.jpg') is True
+
+    assert file_path.stat().st_mode & 0o777 == 0o644
+    assert [p.name for p in tmp_path.iterdir()] == ['test.md']
+
+
+def test_update_frontmatter_with_poster_symlinked_note(tmp_path, sample_markdown_with_yaml):
+    """Test a symlinked note stays a symlink and its target gets the update."""
+    target = tmp_path / 'notes' / 'test.md'
+    target.parent.mkdir()
+    target.write_text(sample_markdown_with_yaml)
+    link = tmp_path / 'test.md'
+    link.symlink_to(target)
+
+    assert update_frontmatter_with_poster(link, 'poster.jpg') is True
+
+    assert link.is_symlink()
+    assert "poster: '[[poster.jpg]]'" in target.read_text()
+    assert [p.name for p in target.parent.iterdir()] == ['test.md']
+
+
+def test_update_frontmatter_with_poster_hard_linked_note(tmp_path, sample_markdown_with_yaml):
+    """Test every hard link to a note sees the update."""
+    note = tmp_path / 'test.md'
+    note.write_text(sample_markdown_with_yaml)
+    other = tmp_path / 'other.md'
+    os.link(note, other)
+
+    assert update_frontmatter_with_poster(note, 'poster.jpg') is True
+
+    assert note.stat().st_ino == other.stat().st_ino
+    assert "poster: '[[poster.jpg]]'" in other.read_text()
+
+
+def test_update_frontmatter_with_poster_failed_write_keeps_original(
+    tmp_path, sample_markdown_with_yaml, mocker, capsys
+):
+    """Test a failure while replacing the note leaves the original untouched."""
+    file_path = tmp_path / 'test.md'
+    file_path.write_text(sample_markdown_with_yaml)
+    mocker.patch('lib.poster_utils.os.replace', side_effect=OSError('disk full'))
+
+    assert update_frontmatter_with_poster(file_path, 'poster.jpg') is False
+
+    assert file_path.read_text() == sample_markdown_with_yaml
+    assert [p.name for p in tmp_path.iterdir()] == ['test.md']
+    assert 'disk full' in capsys.readouterr().out